@@ -0,0 +1,70 @@
+"""
+Synthetic fashion catalog used to seed an in-memory Qdrant collection.
+"""
+import random
+from typing import Any, Dict, List
+
+PRODUCT_TYPES = {
+    "Tops": ["t-shirt", "shirt", "hoodie", "sweater", "jacket", "blazer"],
+    "Bottoms": ["jeans", "pants", "trousers", "shorts", "skirt"],
+    "Dresses": ["dress", "gown"],
+    "Shoes": ["sneakers", "boots", "heels", "sandals", "loafers"],
+    "Accessories": ["belt", "scarf", "bag", "backpack", "handbag", "hat"],
+}
+ADJECTIVES = ["classic", "premium", "casual", "formal", "trendy", "vintage", "slim fit", "oversized"]
+MATERIALS = ["cotton", "linen", "denim", "leather", "wool", "silk", "polyester"]
+SEASONS = ["summer", "winter", "spring", "autumn", "all-season"]
+AUDIENCES = ["Men", "Women", "Unisex"]
+COLORS = ["Black", "White", "Red", "Blue", "Brown", "Yellow", "Green", "Beige", "Grey", "Pink"]
+SIZES = ["XS", "S", "M", "L", "XL"]
+
+
+def generate_catalog(size: int = 500, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generates catalog rows shaped like the output of PSQLService.fetch_all.
+
+    Args:
+        size (int): Number of products. Defaults to 500.
+        seed (int): Random seed, so runs are reproducible. Defaults to 42.
+
+    Returns:
+        List[Dict[str, Any]]: Product rows.
+    """
+    rng = random.Random(seed)
+    rows = []
+
+    for product_id in range(1, size + 1):
+        category = rng.choice(list(PRODUCT_TYPES))
+        product_type = rng.choice(PRODUCT_TYPES[category])
+        adjective = rng.choice(ADJECTIVES)
+        material = rng.choice(MATERIALS)
+        season = rng.choice(SEASONS)
+        audience = rng.choice(AUDIENCES)
+        colors = rng.sample(COLORS, rng.randint(1, 4))
+        sizes = sorted(rng.sample(SIZES, rng.randint(1, 5)), key=SIZES.index)
+
+        name = f"{adjective.title()} {material.title()} {product_type.title()}"
+        price = round(rng.uniform(10, 300), 2)
+
+        rows.append(
+            {
+                "product_id": product_id,
+                "product_name": name,
+                "product_description": (
+                    f"A {adjective} {product_type} for {audience.lower()} made of {material}. "
+                    f"Perfect for {season} outfits, comfortable for daily wear and easy to match "
+                    f"with the rest of your wardrobe."
+                ),
+                "slug": f"{name.lower().replace(' ', '-')}-{product_id}",
+                "price": price,
+                "original_price": round(price * rng.uniform(1.0, 1.5), 2),
+                "image_url": f"https://example.com/images/{product_id}.jpg",
+                "rating": round(rng.uniform(3.0, 5.0), 1),
+                "review_count": rng.randint(0, 500),
+                "categories": ", ".join([category, audience]),
+                "available_sizes": ", ".join(sizes),
+                "available_colors": ", ".join(colors),
+            }
+        )
+
+    return rows
@@ -0,0 +1,148 @@
+"""
+Local stand-ins for the remote dependencies of the RAG pipeline.
+
+They mirror the async interfaces of LLMService, CacheService, MemoryService
+and PSQLService, and simulate network latency with asyncio.sleep, so the
+real CPU work (embedding, routing, rerank) can be measured offline.
+"""
+import asyncio
+import random
+import re
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+
+class FakeLLMService:
+    """
+    Stand-in for LLMService (Groq).
+
+    Parameters:
+        latency (float): Seconds per completion call. Defaults to 0.3.
+        token_delay (float): Seconds between streamed chunks. Defaults to 0.01.
+        jitter (float): Relative random variation of the latency. Defaults to 0.2.
+    """
+
+    def __init__(self, latency: float = 0.3, token_delay: float = 0.01, jitter: float = 0.2) -> None:
+        self.latency = latency
+        self.token_delay = token_delay
+        self.jitter = jitter
+        # Decompositions produced by the fused call, served without latency
+        self.decompositions: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def __sleep(self) -> None:
+        await asyncio.sleep(self.latency * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+    async def response(self, prompt: str, stream: bool = False) -> Union[str, AsyncGenerator]:
+        await self.__sleep()
+        text = "Here are some products that match your request:\n- A great option for you."
+
+        if not stream:
+            return text
+
+        async def streamer():
+            for token in text.split(" "):
+                await asyncio.sleep(self.token_delay)
+                yield token + " "
+
+        return streamer()
+
+    async def rewrite_query_with_memory(self, query: str, history: List[Dict]) -> str:
+        if not history:
+            return query
+        await self.__sleep()
+        return query
+
+    @staticmethod
+    def __decompose(query: str) -> List[Dict[str, Any]]:
+        parts = [p.strip() for p in re.split(r"\band\b|,", query) if p.strip()] or [query]
+        return [{"semantic_query": p, "keywords": p.split()} for p in parts]
+
+    async def reflect_and_decompose(self, query: str, history: List[Dict]) -> Optional[Dict[str, Any]]:
+        await self.__sleep()
+        self.decompositions[query] = self.__decompose(query)
+        return {"rewritten_query": query, "intent": None, "queries": self.decompositions[query]}
+
+    async def generate_search_queries(self, query: str) -> List[Dict[str, Any]]:
+        if query in self.decompositions:
+            return self.decompositions[query]
+        await self.__sleep()
+        return self.__decompose(query)
+
+
+class FakeCacheService:
+    """
+    Stand-in for CacheService (LangCache) backed by an exact-match dictionary.
+
+    Parameters:
+        latency (float): Seconds per search/save call. Defaults to 0.05.
+        enabled (bool): When False every lookup misses. Defaults to True.
+    """
+
+    def __init__(self, latency: float = 0.05, enabled: bool = True) -> None:
+        self.latency = latency
+        self.enabled = enabled
+        self.store: Dict[str, Any] = {}
+        self.l1_cache = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"entries": len(self.store)}
+
+    async def search_response(
+        self, prompt: str, embedding: Optional[List[float]] = None
+    ) -> Optional[Dict[str, Any]]:
+        await asyncio.sleep(self.latency)
+        return self.store.get(prompt) if self.enabled else None
+
+    async def save_response(
+        self, prompt: str, response: Dict[str, Any], embedding: Optional[List[float]] = None
+    ) -> None:
+        await asyncio.sleep(self.latency)
+        if self.enabled:
+            self.store[prompt] = response
+
+
+class FakeMemoryService:
+    """
+    Stand-in for MemoryService (PostgreSQL chat history).
+
+    Parameters:
+        latency (float): Seconds per history lookup. Defaults to 0.02.
+        history_turns (int): Number of synthetic messages returned. Defaults to 0.
+    """
+
+    def __init__(self, latency: float = 0.02, history_turns: int = 0) -> None:
+        self.latency = latency
+        self.history_turns = history_turns
+
+    async def get_history(self, session_id: int, limit: int = 20) -> List[Dict[str, str]]:
+        await asyncio.sleep(self.latency)
+        roles = ["user", "assistant"]
+        return [
+            {"role": roles[i % 2], "content": f"message {i} of session {session_id}"}
+            for i in range(min(self.history_turns, limit))
+        ]
+
+
+class FakePSQLService:
+    """
+    Stand-in for PSQLService that serves an in-memory list of catalog rows.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = rows
+
+    async def fetch_all(self) -> List[Dict[str, Any]]:
+        return list(self.rows)
+
+    async def stream_all(self, batch_size: int = 500) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        for i in range(0, len(self.rows), batch_size):
+            yield self.rows[i : i + batch_size]
+
+    async def fetch_specifics(self, product_ids: List[Any]) -> List[Dict[str, Any]]:
+        wanted = set(product_ids)
+        return [row for row in self.rows if row["product_id"] in wanted]
+
+    async def dispose(self) -> None:
+        return None
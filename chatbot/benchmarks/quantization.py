@@ -0,0 +1,203 @@
+"""
+Recall / latency benchmark of the dense vector quantization modes.
+
+Needs a real Qdrant server: the local (in-memory) mode ignores quantization.
+The synthetic catalog is embedded once and synced into a baseline collection
+(no quantization) through the real SyncService; its points are then copied
+into one collection per quantization mode. For every mode the benchmark
+reports, against exact (full scan, float32) search on the baseline:
+
+    - recall@k of the dense search
+    - p50 / p95 latency of the dense search and of the full hybrid search
+
+Temporary collections are deleted at the end unless --keep is given.
+
+Usage (from the chatbot directory):
+    python -m benchmarks.quantization --url http://localhost:6333 --catalog-size 5000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List
+
+from dotenv import load_dotenv
+from qdrant_client import models
+
+from benchmarks.catalog import generate_catalog
+from benchmarks.fakes import FakePSQLService
+from benchmarks.run_pipeline import load_utterances, percentile
+from src.services.embedding_service import EmbeddingService
+from src.services.qdrant_service import QdrantService
+from src.services.sync_service import SyncService
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+
+def build_service(args: argparse.Namespace, mode: str) -> QdrantService:
+    return QdrantService(
+        url=args.url,
+        api_key=args.api_key,
+        collection_name=f"{args.prefix}_{mode}",
+        quantization=mode,
+        on_disk_vectors=args.on_disk and mode != "none",
+        rescore=not args.no_rescore,
+        oversampling=args.oversampling,
+    )
+
+
+async def copy_points(source: QdrantService, target: QdrantService, batch: int = 256) -> None:
+    """
+    Copies every point (vectors + payload) of `source` into `target`, so each
+    mode is measured on identical data without re-embedding the catalog.
+    """
+    offset = None
+    while True:
+        points, offset = await source.client.scroll(
+            collection_name=source.collection_name,
+            limit=batch,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        if points:
+            await target.client.upsert(
+                collection_name=target.collection_name,
+                points=[models.PointStruct(id=p.id, vector=p.vector, payload=p.payload) for p in points],
+                wait=True,
+            )
+        if offset is None:
+            break
+
+
+async def wait_until_ready(service: QdrantService, timeout: float = 300) -> None:
+    """
+    Waits for the optimizers (quantization / indexing) to finish.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        info = await service.client.get_collection(service.collection_name)
+        if info.status == models.CollectionStatus.GREEN:
+            return
+        await asyncio.sleep(1)
+    logger.warning(f"Collection '{service.collection_name}' still optimizing, measuring anyway.")
+
+
+async def measure(
+    service: QdrantService,
+    dense_vectors: List[List[float]],
+    sparse_vectors: List[Dict],
+    ground_truth: List[List[int]],
+    top_k: int,
+) -> Dict[str, float]:
+    dense_ms, hybrid_ms, recalls = [], [], []
+
+    for dense_vec, sparse_vec, expected in zip(dense_vectors, sparse_vectors, ground_truth):
+        start = time.perf_counter()
+        points = await service.search_dense(dense_vec, top_k=top_k)
+        dense_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await service.search_hybrid(dense_vec, sparse_vec, top_k=top_k)
+        hybrid_ms.append((time.perf_counter() - start) * 1000)
+
+        if expected:
+            recalls.append(len({p.id for p in points} & set(expected)) / len(expected))
+
+    return {
+        "recall": sum(recalls) / len(recalls) if recalls else 0.0,
+        "dense_p50": percentile(dense_ms, 50),
+        "dense_p95": percentile(dense_ms, 95),
+        "hybrid_p50": percentile(hybrid_ms, 50),
+        "hybrid_p95": percentile(hybrid_ms, 95),
+    }
+
+
+async def main() -> None:
+    args = parse_args()
+    embedding_service = EmbeddingService(
+        dense_model_name=args.dense_model, sparse_model_name=args.sparse_model
+    )
+
+    services = {mode: build_service(args, mode) for mode in args.modes}
+    baseline = services.get("none") or build_service(args, "none")
+
+    try:
+        # 1. Seed the baseline once, then copy it into the quantized collections
+        await baseline.create_collection_hybrid()
+        start = time.perf_counter()
+        await SyncService(
+            psql_service=FakePSQLService(generate_catalog(size=args.catalog_size, seed=args.seed)),
+            embedding_service=embedding_service,
+            qdrant_service=baseline,
+        ).sync_all()
+        print(f"Seeded {args.catalog_size} products in {time.perf_counter() - start:.1f}s")
+
+        for mode, service in services.items():
+            if service is baseline:
+                continue
+            await service.create_collection_hybrid()
+            await copy_points(baseline, service)
+        for service in services.values():
+            await wait_until_ready(service)
+
+        # 2. Queries and exact ground truth
+        utterances = load_utterances(args.seed)[: args.queries]
+        dense_vectors, raw_sparse = embedding_service.get_query_embeddings(utterances, utterances)
+        sparse_vectors = [
+            {"indices": vec.indices.tolist(), "values": vec.values.tolist()} for vec in raw_sparse
+        ]
+        ground_truth = [
+            [p.id for p in await baseline.search_dense(vec, top_k=args.top_k, exact=True)]
+            for vec in dense_vectors
+        ]
+
+        # 3. Measure every mode
+        print(
+            f"\n{len(utterances)} queries, top_k={args.top_k}, on_disk={args.on_disk}, "
+            f"rescore={not args.no_rescore}, oversampling={args.oversampling}\n"
+        )
+        print(f"{'mode':<10}{'recall@k':>10}{'dense p50':>12}{'dense p95':>12}{'hybrid p50':>12}{'hybrid p95':>12}")
+        for mode, service in services.items():
+            result = await measure(service, dense_vectors, sparse_vectors, ground_truth, args.top_k)
+            print(
+                f"{mode:<10}{result['recall']:>10.3f}{result['dense_p50']:>12.1f}{result['dense_p95']:>12.1f}"
+                f"{result['hybrid_p50']:>12.1f}{result['hybrid_p95']:>12.1f}"
+            )
+
+    finally:
+        for service in {*services.values(), baseline}:
+            if not args.keep:
+                await service.client.delete_collection(service.collection_name)
+            await service.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.getenv("QDRANT_URL"), help="Qdrant server URL")
+    parser.add_argument("--api-key", default=os.getenv("QDRANT_API_KEY"))
+    parser.add_argument("--prefix", default="bench_quantization", help="Prefix of the temporary collections")
+    parser.add_argument("--modes", nargs="+", default=list(QdrantService.QUANTIZATION_MODES),
+                        choices=QdrantService.QUANTIZATION_MODES)
+    parser.add_argument("--catalog-size", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--on-disk", action="store_true", help="Keep original vectors on disk for quantized modes")
+    parser.add_argument("--no-rescore", action="store_true", help="Disable rescoring with the original vectors")
+    parser.add_argument("--oversampling", type=float, default=2.0)
+    parser.add_argument("--keep", action="store_true", help="Do not delete the collections afterwards")
+    parser.add_argument("--dense-model", default=os.getenv("DENSE_MODEL_NAME", "BAAI/bge-base-en-v1.5"))
+    parser.add_argument("--sparse-model", default=os.getenv("SPARSE_MODEL_NAME", "Qdrant/bm25"))
+    args = parser.parse_args()
+    if not args.url:
+        parser.error("--url (or QDRANT_URL) is required: quantization needs a Qdrant server")
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
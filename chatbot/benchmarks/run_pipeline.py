@@ -0,0 +1,194 @@
+"""
+Offline throughput / latency benchmark of Pipeline.get_response.
+
+Groq, LangCache and PostgreSQL are replaced by the fakes in benchmarks.fakes
+and Qdrant runs in-memory, seeded from a synthetic catalog through the real
+SyncService. Embedding, routing and rerank use the real models, so their CPU
+cost is what gets measured.
+
+Usage (from the chatbot directory):
+    python -m benchmarks.run_pipeline --requests 200 --concurrency 8
+"""
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+from benchmarks.catalog import generate_catalog
+from benchmarks.fakes import FakeCacheService, FakeLLMService, FakeMemoryService, FakePSQLService
+from src.rag.pipeline import Pipeline
+from src.services.embedding_service import EmbeddingService
+from src.services.qdrant_service import QdrantService
+from src.services.rerank_service import RerankService
+from src.services.semantic_router_service import SemanticRouterService
+from src.services.sync_service import SyncService
+from src.utils.timing import StageTimer
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+SAMPLES_PATH = os.path.join(os.path.dirname(__file__), "..", "fashion_chatbot_samples.json")
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def load_utterances(seed: int) -> List[str]:
+    """
+    Loads every sample utterance (all routes) in a reproducible shuffled order.
+    """
+    with open(SAMPLES_PATH, "r", encoding="utf-8") as f:
+        samples = json.load(f)
+
+    utterances = [u for route_utterances in samples.values() for u in route_utterances]
+    random.Random(seed).shuffle(utterances)
+    return utterances
+
+
+async def build_pipeline(args: argparse.Namespace) -> Pipeline:
+    """
+    Builds a Pipeline with real models, in-memory Qdrant and fake remote services.
+    """
+    embedding_service = EmbeddingService(
+        dense_model_name=args.dense_model, sparse_model_name=args.sparse_model
+    )
+    qdrant_service = QdrantService(
+        url=None, api_key=None, collection_name="benchmark", location=":memory:"
+    )
+    await qdrant_service.create_collection_hybrid()
+
+    rows = generate_catalog(size=args.catalog_size, seed=args.seed)
+    sync_service = SyncService(
+        psql_service=FakePSQLService(rows),
+        embedding_service=embedding_service,
+        qdrant_service=qdrant_service,
+    )
+
+    report = await sync_service.sync_all()
+    print(
+        f"Seeded {report['products']} products in {report['seconds']:.1f}s "
+        f"({report['products_per_sec']} products/sec, stage busy seconds: {report['busy_seconds']})"
+    )
+
+    return Pipeline(
+        semantic_router_service=SemanticRouterService(),
+        embedding_service=embedding_service,
+        memory_service=FakeMemoryService(latency=args.memory_latency, history_turns=args.history_turns),
+        qdrant_service=qdrant_service,
+        rerank_service=RerankService(model_name=args.rerank_model),
+        llm_service=FakeLLMService(latency=args.llm_latency),
+        cache_service=FakeCacheService(latency=args.cache_latency, enabled=not args.no_cache),
+        max_concurrent_subqueries=args.subquery_concurrency,
+        detect_history_references=not args.no_reference_detector,
+        fused_reflection=args.fused_reflection,
+        context_token_budget=args.context_token_budget,
+    )
+
+
+async def replay(pipeline: Pipeline, utterances: List[str], args: argparse.Namespace) -> None:
+    """
+    Replays utterances at the configured concurrency and prints per-stage percentiles.
+    """
+    semaphore = asyncio.Semaphore(args.concurrency)
+    stage_samples: Dict[str, List[float]] = defaultdict(list)
+    metric_samples: Dict[str, List[float]] = defaultdict(list)
+    errors = 0
+
+    async def run_one(index: int) -> None:
+        nonlocal errors
+        query = utterances[index % len(utterances)]
+        async with semaphore:
+            timer = StageTimer()
+            try:
+                await pipeline.get_response(session_id=index, user_query=query, timer=timer)
+            except Exception as e:
+                errors += 1
+                logger.error(f"Request '{query}' failed: {e}")
+                return
+
+            for stage, duration in timer.timings.items():
+                stage_samples[stage].append(duration)
+            stage_samples["total"].append(timer.total_ms)
+            for metric, value in timer.metrics.items():
+                metric_samples[metric].append(value)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"\n{args.requests} requests, concurrency {args.concurrency}: "
+        f"{elapsed:.2f}s, {args.requests / elapsed:.2f} req/s, {errors} errors\n"
+    )
+    print(f"{'stage':<18}{'count':>8}{'p50 ms':>12}{'p95 ms':>12}{'p99 ms':>12}")
+    # Stages in execution order, end-to-end latency last
+    total = stage_samples.pop("total", [])
+    for stage, values in [*stage_samples.items(), ("total", total)]:
+        print(
+            f"{stage:<18}{len(values):>8}"
+            f"{percentile(values, 50):>12.1f}{percentile(values, 95):>12.1f}{percentile(values, 99):>12.1f}"
+        )
+    if metric_samples:
+        print(f"\n{'metric':<18}{'count':>8}{'p50':>12}{'p95':>12}{'max':>12}")
+        for metric, values in metric_samples.items():
+            print(
+                f"{metric:<18}{len(values):>8}"
+                f"{percentile(values, 50):>12.0f}{percentile(values, 95):>12.0f}{max(values):>12.0f}"
+            )
+
+    stats = pipeline.get_stats()
+    print(f"\nReflection paths: {stats['reflection']}")
+    print(f"Coalescing: {stats['singleflight']}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Number of requests to replay")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent in-flight requests")
+    parser.add_argument("--catalog-size", type=int, default=500, help="Synthetic catalog size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--subquery-concurrency", type=int, default=4)
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="Seconds per fake LLM call")
+    parser.add_argument("--cache-latency", type=float, default=0.05, help="Seconds per fake cache call")
+    parser.add_argument("--memory-latency", type=float, default=0.02, help="Seconds per fake history lookup")
+    parser.add_argument("--history-turns", type=int, default=0, help="Synthetic history length")
+    parser.add_argument("--no-cache", action="store_true", help="Make every cache lookup miss")
+    parser.add_argument(
+        "--no-reference-detector", action="store_true", help="Always run reflection when history exists"
+    )
+    parser.add_argument(
+        "--fused-reflection", action="store_true", help="Rewrite and decompose in one LLM call"
+    )
+    parser.add_argument("--context-token-budget", type=int, default=1500, help="Product context token budget")
+    parser.add_argument("--dense-model", default=os.getenv("DENSE_MODEL_NAME", "BAAI/bge-base-en-v1.5"))
+    parser.add_argument("--sparse-model", default=os.getenv("SPARSE_MODEL_NAME", "Qdrant/bm25"))
+    parser.add_argument("--rerank-model", default=os.getenv("RERANK_MODEL_NAME", "ms-marco-MiniLM-L-12-v2"))
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    pipeline = await build_pipeline(args)
+    await replay(pipeline, load_utterances(args.seed), args)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(main())
@@ -57,7 +57,7 @@ async def main():
         collection_name=COLLECTION_NAME
     )
 
-    qdrant_service.create_collection_hybrid()
+    await qdrant_service.create_collection_hybrid()
 
     sync_service = SyncService(
         psql_service=psql_service,
@@ -73,6 +73,7 @@ async def main():
         
     finally:
         await psql_service.dispose()
+        await qdrant_service.close()
         logger.info("Resources cleaned up.")
 
 
@@ -1,6 +1,7 @@
-from functools import lru_cache
+from functools import lru_cache, partial
 from src.core.config import settings
 from src.core.database import PSQLService
+from src.core.executor import InferencePool
 from src.services.llm_service import LLMService
 from src.services.semantic_router_service import SemanticRouterService
 from src.services.embedding_service import EmbeddingService
@@ -9,7 +10,10 @@ from src.services.qdrant_service import QdrantService
 from src.services.rerank_service import RerankService
 from src.services.sync_service import SyncService
 from src.services.cache_service import CacheService
+from src.services.l1_cache_service import L1CacheService
 from src.rag.pipeline import Pipeline
+from src.utils.sync_state import SyncStateStore
+from src.utils.ttl_cache import TTLCache
 
 @lru_cache()
 def get_settings():
@@ -30,6 +34,20 @@ def get_qdrant_service() -> QdrantService:
         url=settings.QDRANT_URL,
         api_key=settings.QDRANT_API_KEY,
         collection_name=settings.COLLECTION_NAME,
+        prefer_grpc=settings.QDRANT_PREFER_GRPC,
+        grpc_port=settings.QDRANT_GRPC_PORT,
+        search_timeout=settings.QDRANT_SEARCH_TIMEOUT,
+        upsert_timeout=settings.QDRANT_UPSERT_TIMEOUT,
+        max_connections=settings.QDRANT_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.QDRANT_MAX_KEEPALIVE_CONNECTIONS,
+        payload_projection=settings.QDRANT_PAYLOAD_PROJECTION,
+        quantization=settings.QDRANT_QUANTIZATION,
+        quantization_always_ram=settings.QDRANT_QUANTIZATION_ALWAYS_RAM,
+        on_disk_vectors=settings.QDRANT_ON_DISK_VECTORS,
+        rescore=settings.QDRANT_RESCORE,
+        oversampling=settings.QDRANT_OVERSAMPLING,
+        hnsw_m=settings.QDRANT_HNSW_M,
+        hnsw_ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
     )
 
 @lru_cache()
@@ -37,6 +55,18 @@ def get_embedding_service() -> EmbeddingService:
     return EmbeddingService(
         dense_model_name=settings.DENSE_MODEL_NAME,
         sparse_model_name=settings.SPARSE_MODEL_NAME,
+        inference_pool=InferencePool(
+            name="embedding",
+            kind=settings.EMBEDDING_POOL_KIND,
+            workers=settings.EMBEDDING_POOL_WORKERS,
+            queue_size=settings.INFERENCE_QUEUE_SIZE,
+            admission_timeout=settings.INFERENCE_ADMISSION_TIMEOUT_SECONDS,
+            worker_factory=partial(
+                EmbeddingService,
+                dense_model_name=settings.DENSE_MODEL_NAME,
+                sparse_model_name=settings.SPARSE_MODEL_NAME,
+            ),
+        ),
     )
 
 @lru_cache()
@@ -44,11 +74,34 @@ def get_llm_service() -> LLMService:
     return LLMService(
         api_key=settings.GROQ_API_KEY,
         model_name=settings.LLM_MODEL_NAME,
+        search_queries_cache=TTLCache(
+            maxsize=settings.SEARCH_QUERIES_CACHE_SIZE,
+            ttl_seconds=settings.SEARCH_QUERIES_CACHE_TTL_SECONDS,
+        ),
     )
 
 @lru_cache()
 def get_rerank_service() -> RerankService:
-    return RerankService(model_name=settings.RERANK_MODEL_NAME)
+    return RerankService(
+        model_name=settings.RERANK_MODEL_NAME,
+        inference_pool=InferencePool(
+            name="rerank",
+            kind=settings.RERANK_POOL_KIND,
+            workers=settings.RERANK_POOL_WORKERS,
+            queue_size=settings.INFERENCE_QUEUE_SIZE,
+            admission_timeout=settings.INFERENCE_ADMISSION_TIMEOUT_SECONDS,
+            worker_factory=partial(RerankService, model_name=settings.RERANK_MODEL_NAME),
+        ),
+    )
+
+@lru_cache()
+def get_l1_cache_service() -> L1CacheService:
+    return L1CacheService(
+        threshold=settings.CACHE_SIMILARITY_THRESHOLD,
+        max_entries=settings.L1_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.L1_CACHE_TTL_SECONDS,
+        max_bytes=settings.L1_CACHE_MAX_MB * 1024 * 1024,
+    )
 
 @lru_cache()
 def get_cache_service() -> CacheService:
@@ -56,11 +109,26 @@ def get_cache_service() -> CacheService:
         server_url=settings.LANGCACHE_SERVER_URL,
         cache_id=settings.LANGCACHE_CACHE_ID,
         api_key=settings.LANGCACHE_API_KEY,
+        threshold=settings.CACHE_SIMILARITY_THRESHOLD,
+        l1_cache=get_l1_cache_service() if settings.L1_CACHE_ENABLED else None,
+        ttl_seconds=settings.CACHE_TTL_SECONDS,
+        product_attribute_slots=settings.CACHE_PRODUCT_ATTRIBUTE_SLOTS or settings.CONTEXT_MAX_PRODUCTS,
+        untagged_ttl_seconds=settings.CACHE_UNTAGGED_TTL_SECONDS,
+        psql_service=get_psql_service(),
     )
 
 @lru_cache()
 def get_semantic_router_service() -> SemanticRouterService:
-    return SemanticRouterService()
+    return SemanticRouterService(
+        inference_pool=InferencePool(
+            name="router",
+            kind=settings.ROUTER_POOL_KIND,
+            workers=settings.ROUTER_POOL_WORKERS,
+            queue_size=settings.INFERENCE_QUEUE_SIZE,
+            admission_timeout=settings.INFERENCE_ADMISSION_TIMEOUT_SECONDS,
+            worker_factory=SemanticRouterService,
+        ),
+    )
 
 @lru_cache()
 def get_memory_service() -> MemoryService:
@@ -74,6 +142,15 @@ def get_sync_service() -> SyncService:
         psql_service=get_psql_service(),
         qdrant_service=get_qdrant_service(),
         embedding_service=get_embedding_service(),
+        cache_service=get_cache_service(),
+        blue_green=settings.FULL_SYNC_BLUE_GREEN,
+        keep_versions=settings.FULL_SYNC_KEEP_VERSIONS,
+        embed_concurrency=settings.SYNC_EMBED_CONCURRENCY,
+        upload_concurrency=settings.SYNC_UPLOAD_CONCURRENCY,
+        queue_size=settings.SYNC_QUEUE_SIZE,
+        state_store=SyncStateStore(settings.SYNC_STATE_PATH),
+        watermark_overlap_seconds=settings.INCREMENTAL_SYNC_OVERLAP_SECONDS,
+        lock_path=settings.SYNC_LOCK_PATH,
     )
 
 @lru_cache()
@@ -86,4 +163,10 @@ def get_rag_pipeline() -> Pipeline:
         qdrant_service=get_qdrant_service(),
         rerank_service=get_rerank_service(),
         cache_service=get_cache_service(),
+        max_concurrent_subqueries=settings.RETRIEVAL_MAX_CONCURRENCY,
+        detect_history_references=settings.REFLECTION_DETECTOR_ENABLED,
+        fused_reflection=settings.LLM_FUSED_REFLECTION,
+        coalesce_requests=settings.REQUEST_COALESCING_ENABLED,
+        context_token_budget=settings.CONTEXT_TOKEN_BUDGET,
+        max_context_products=settings.CONTEXT_MAX_PRODUCTS,
     )
\ No newline at end of file
@@ -1,5 +1,7 @@
+import json
 import logging
-from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from src.api.v1.schemas import (
     ChatRequest,
     ChatResponse,
@@ -7,10 +9,11 @@ from src.api.v1.schemas import (
     SyncResponse,
     BulkProductSyncRequest
 )
-from src.api.dependencies import get_rag_pipeline, get_sync_service, get_qdrant_service
+from src.api.dependencies import get_rag_pipeline, get_sync_service
+from src.core.executor import InferencePoolSaturated
 from src.rag.pipeline import Pipeline
 from src.services.sync_service import SyncService
-from src.services.qdrant_service import QdrantService
+from src.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -19,6 +22,7 @@ router = APIRouter()
 @router.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(
     request: ChatRequest, 
+    response: Response,
     pipeline: Pipeline = Depends(get_rag_pipeline)
 ):
     """
@@ -28,29 +32,85 @@ async def chat_endpoint(
     - Performs vector search via Qdrant.
     - Generates a response using the LLM.
     - Returns a JSON object containing the text response and relevant products.
+    - Reports per-stage latencies in the `Server-Timing` header, and in the
+      `debug` field when `debug` is set in the request.
 
     The Node.js backend is responsible for saving this response to the database.
     """
     try:
+        timer = StageTimer()
+
         # The pipeline returns a dictionary matching the ChatResponse schema
         response_data = await pipeline.get_response(
             session_id=request.session_id, 
-            user_query=request.query
+            user_query=request.query,
+            timer=timer
         )
+
+        response.headers["Server-Timing"] = timer.server_timing_header()
+        if request.debug:
+            # Copy, the dictionary may be a shared cache entry
+            response_data = {**response_data, "debug": timer.to_dict()}
         return response_data
-        
+
+    except InferencePoolSaturated as e:
+        # Overloaded: shed the request so the client can retry later
+        logger.warning(f"Rejected chat request: {e}")
+        raise HTTPException(status_code=503, detail="Service overloaded, please retry later.")
+
     except Exception as e:
         # Log the error (handled by middleware usually) and return 500
         print(f"Error processing chat request: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/chat/stream")
+async def chat_stream_endpoint(
+    request: ChatRequest,
+    pipeline: Pipeline = Depends(get_rag_pipeline)
+):
+    """
+    Streaming variant of /chat using NDJSON (one JSON event per line).
+
+    - {"event": "metadata", "intent": ..., "products": [...]} is sent as soon as
+      retrieval finishes, so product cards can render before the answer text.
+    - {"event": "token", "content": ...} events follow as the LLM generates.
+    - {"event": "done"} marks the end of the answer, {"event": "error", ...}
+      is sent instead if the pipeline fails mid-stream. With `debug` set in the
+      request, the done event carries the per-stage latency breakdown.
+    """
+    async def event_stream():
+        timer = StageTimer()
+        try:
+            async for event in pipeline.stream_response(
+                session_id=request.session_id,
+                user_query=request.query,
+                timer=timer
+            ):
+                if event["event"] == "done" and request.debug:
+                    event = {**event, "debug": timer.to_dict()}
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+        except Exception as e:
+            logger.error(f"Error streaming chat response: {e}", exc_info=True)
+            yield json.dumps({"event": "error", "detail": str(e)}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.get("/stats")
+async def stats_endpoint(pipeline: Pipeline = Depends(get_rag_pipeline)):
+    """
+    Returns runtime counters (cache hit rates, ...) of this worker process.
+    """
+    return pipeline.get_stats()
+
+
 @router.post("/sync/product", response_model=SyncResponse)
 async def sync_product_endpoint(
     background_tasks: BackgroundTasks,
     request: ProductSyncRequest,
     sync_service: SyncService = Depends(get_sync_service),
-    qdrant_service: QdrantService = Depends(get_qdrant_service),
 ):
     """
     Triggers product synchronization between PostgreSQL and Qdrant.
@@ -60,6 +120,9 @@ async def sync_product_endpoint(
     - 'update': Syncs a specific product ID.
     - 'delete': Removes a specific product ID from Qdrant.
     - 'update_all': Re-syncs the entire product catalog.
+    - 'update_incremental': Syncs only products changed since the last sync.
+    - 'migrate_alias': One-off full reindex that turns a plain collection into
+      the alias used by blue/green syncs.
     """
     
     if request.action == "update":
@@ -82,11 +145,25 @@ async def sync_product_endpoint(
             "message": "Queued full synchronization of all products to Qdrant."
         }
 
+    elif request.action == "update_incremental":
+        background_tasks.add_task(sync_service.sync_incremental)
+        return {
+            "status": "success",
+            "message": "Queued incremental synchronization of changed products to Qdrant."
+        }
+
+    elif request.action == "migrate_alias":
+        background_tasks.add_task(sync_service.sync_all, migrate_alias=True)
+        return {
+            "status": "success",
+            "message": "Queued full reindex and migration of the collection to an alias."
+        }
+
     elif request.action == "delete":
         if not request.product_id:
             raise HTTPException(status_code=400, detail="product_id is required for delete action")
 
-        background_tasks.add_task(qdrant_service.delete_products, [request.product_id])
+        background_tasks.add_task(sync_service.delete_products, [request.product_id])
         return {
             "status": "success",
             "message": f"Queued deletion for product ID {request.product_id} from Qdrant.",
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # --- Request Schemas ---
 
@@ -9,6 +9,7 @@ class ChatRequest(BaseModel):
     """
     session_id: int = Field(..., description="PostgreSQL ID of the chat session")
     query: str = Field(..., min_length=1, example="Find me red sneakers")
+    debug: bool = Field(False, description="Include the per-stage latency breakdown in the response")
 
 
 class ProductSyncRequest(BaseModel):
@@ -16,7 +17,7 @@ class ProductSyncRequest(BaseModel):
     Payload for product synchronization triggers.
     """
     product_id: Optional[int] = Field(None, description="Target product ID (required for update/delete)")
-    action: str = Field(..., pattern="^(update|delete|update_all)$", description="Action to perform")
+    action: str = Field(..., pattern="^(update|delete|update_all|update_incremental|migrate_alias)$", description="Action to perform")
 
 
 class ProductData(BaseModel):
@@ -70,6 +71,15 @@ class ProductMetadata(BaseModel):
         populate_by_name = True
 
 
+class ChatDebugInfo(BaseModel):
+    """
+    Per-stage latency breakdown of a pipeline run (opt-in via ChatRequest.debug).
+    """
+    timings: Dict[str, float] = Field(default_factory=dict, description="Stage name -> duration in ms")
+    metrics: Dict[str, float] = Field(default_factory=dict, description="Request figures, e.g. prompt_tokens")
+    total_ms: float
+
+
 class ChatResponse(BaseModel):
     """
     Standard JSON response structure for the chat endpoint.
@@ -77,6 +87,7 @@ class ChatResponse(BaseModel):
     content: str
     intent: str
     products: List[ProductMetadata] = []
+    debug: Optional[ChatDebugInfo] = None
 
 
 class SyncResponse(BaseModel):
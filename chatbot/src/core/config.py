@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,33 @@ class Settings(BaseSettings):
     QDRANT_URL: str
     QDRANT_API_KEY: str
     COLLECTION_NAME: str
+    QDRANT_PREFER_GRPC: bool = False
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_SEARCH_TIMEOUT: float = 10
+    QDRANT_UPSERT_TIMEOUT: float = 120
+    QDRANT_MAX_CONNECTIONS: int = 32
+    QDRANT_MAX_KEEPALIVE_CONNECTIONS: int = 16
+    QDRANT_PAYLOAD_PROJECTION: bool = True
+    QDRANT_QUANTIZATION: str = "none"  # "none", "scalar" (int8) or "binary"
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    QDRANT_ON_DISK_VECTORS: bool = False
+    QDRANT_RESCORE: bool = True
+    QDRANT_OVERSAMPLING: float = 2.0
+    QDRANT_HNSW_M: int = 16
+    QDRANT_HNSW_EF_CONSTRUCT: int = 100
+
+    # Catalog sync
+    FULL_SYNC_BLUE_GREEN: bool = True
+    FULL_SYNC_KEEP_VERSIONS: int = 2
+    SYNC_EMBED_CONCURRENCY: int = 2
+    SYNC_UPLOAD_CONCURRENCY: int = 4
+    SYNC_QUEUE_SIZE: int = 4
+    SYNC_STATE_PATH: str = "data/sync_state.json"
+    # Serializes syncs across the worker processes sharing the state file
+    SYNC_LOCK_PATH: str = "data/sync.lock"
+    # Every worker runs the schedule; the lock file keeps their runs from overlapping
+    INCREMENTAL_SYNC_INTERVAL_SECONDS: int = 0  # 0 disables the schedule
+    INCREMENTAL_SYNC_OVERLAP_SECONDS: int = 60
 
     # PostgreSQL
     DB_HOST: str
@@ -29,6 +57,38 @@ class Settings(BaseSettings):
     SPARSE_MODEL_NAME: str
     RERANK_MODEL_NAME: str
 
+    # Semantic cache (LangCache + in-process L1)
+    CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    CACHE_TTL_SECONDS: Optional[int] = None  # None keeps LangCache's default TTL
+    # "product_1".."product_N" (and "scope") must be declared as attributes on the LangCache cache,
+    # N defaults to CONTEXT_MAX_PRODUCTS. Without them answers are cached untagged for CACHE_UNTAGGED_TTL_SECONDS.
+    CACHE_PRODUCT_ATTRIBUTE_SLOTS: Optional[int] = None
+    CACHE_UNTAGGED_TTL_SECONDS: int = 300
+    L1_CACHE_ENABLED: bool = True
+    L1_CACHE_MAX_ENTRIES: int = 2048
+    L1_CACHE_TTL_SECONDS: int = 600
+    L1_CACHE_MAX_MB: int = 64
+
+    # RAG pipeline
+    RETRIEVAL_MAX_CONCURRENCY: int = 4
+    REFLECTION_DETECTOR_ENABLED: bool = True
+    LLM_FUSED_REFLECTION: bool = False
+    REQUEST_COALESCING_ENABLED: bool = True
+    CONTEXT_TOKEN_BUDGET: int = 1500
+    CONTEXT_MAX_PRODUCTS: int = 15
+    SEARCH_QUERIES_CACHE_SIZE: int = 1024
+    SEARCH_QUERIES_CACHE_TTL_SECONDS: int = 3600
+
+    # Inference executor (pool kind is "thread" or "process")
+    INFERENCE_QUEUE_SIZE: int = 32
+    INFERENCE_ADMISSION_TIMEOUT_SECONDS: Optional[float] = 30  # None waits for a slot indefinitely
+    EMBEDDING_POOL_KIND: str = "thread"
+    EMBEDDING_POOL_WORKERS: int = 2
+    RERANK_POOL_KIND: str = "thread"
+    RERANK_POOL_WORKERS: int = 2
+    ROUTER_POOL_KIND: str = "thread"
+    ROUTER_POOL_WORKERS: int = 1
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
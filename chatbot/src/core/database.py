@@ -1,10 +1,15 @@
 import logging
-from typing import List, Any, Optional
+from typing import AsyncIterator, Callable, List, Any, Optional
 
+import asyncpg
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy import text
 
-from src.utils.text_helper import PSQL_FETCH_ALL_QUERIES, PSQL_FETCH_SPECIFICS_QUERIES
+from src.utils.text_helper import (
+    PSQL_FETCH_ALL_QUERIES,
+    PSQL_FETCH_FINGERPRINTS_QUERIES,
+    PSQL_FETCH_SPECIFICS_QUERIES,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +30,8 @@ class PSQLService:
             max_overflow=20,
             connect_args={"ssl": "require"}
         )
+        # Dedicated connection for LISTEN (a pooled one would be recycled)
+        self._listener: Optional[asyncpg.Connection] = None
         logger.info("PSQLService initialized with Async Engine.")
 
     async def fetch_all(self) -> List[dict]:
@@ -49,6 +56,42 @@ class PSQLService:
             logger.error(f"Error executing fetch_all: {e}")
             return []
 
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[List[dict]]:
+        """
+        Streams all active products in batches through a server-side cursor.
+
+        Unlike fetch_all, only one batch of rows is held in memory at a time, so
+        memory stays flat whatever the catalog size. The connection is held
+        until the iterator is exhausted or closed.
+
+        Args:
+            batch_size (int): Rows per yielded batch. Defaults to 500.
+
+        Yields:
+            List[dict]: The next batch of product dictionaries.
+
+        Raises:
+            Exception: Query errors are re-raised, so a failed read is never
+                mistaken for an empty catalog.
+        """
+        total = 0
+        try:
+            async with self.engine.connect() as conn:
+                logger.debug(f"Streaming fetch_all query (batch_size={batch_size}).")
+                async with conn.stream(
+                    text(PSQL_FETCH_ALL_QUERIES),
+                    execution_options={"yield_per": batch_size},
+                ) as result:
+                    async for partition in result.mappings().partitions(batch_size):
+                        total += len(partition)
+                        yield [dict(row) for row in partition]
+
+            logger.info(f"Streamed {total} products from DB.")
+
+        except Exception as e:
+            logger.error(f"Error streaming fetch_all after {total} rows: {e}")
+            raise
+
     async def fetch_specifics(self, product_ids: List[Any]) -> List[dict]:
         """
         Retrieves details for specific product IDs.
@@ -57,27 +100,22 @@ class PSQLService:
             product_ids (List[Any]): List of product IDs (integers).
 
         Returns:
-            List[dict]: A list of matching product dictionaries.
+            List[dict]: A list of matching product dictionaries, with the
+            "is_active", "updated_at" and "fingerprint" change-detection columns.
         """
         if not product_ids:
             return []
 
         try:
             async with self.engine.connect() as conn:
-                # Generate dynamic bind parameters (e.g., :id_0, :id_1)
-                bind_params = {f"id_{i}": pid for i, pid in enumerate(product_ids)}
-                
-                # Create the placeholder string (e.g., ":id_0, :id_1")
-                placeholder_str = ", ".join([f":{k}" for k in bind_params.keys()])
-                
-                # Format the SQL query
-                sql_query = PSQL_FETCH_SPECIFICS_QUERIES.format(placeholder=placeholder_str)
-                
                 logger.debug(f"Executing fetch_specifics for {len(product_ids)} items.")
-                
-                # Execute safely with bound parameters
-                result = await conn.execute(text(sql_query), bind_params)
-                
+
+                # IDs are bound as a single array parameter (no per-ID placeholders)
+                result = await conn.execute(
+                    text(PSQL_FETCH_SPECIFICS_QUERIES),
+                    {"product_ids": [int(pid) for pid in product_ids]},
+                )
+
                 rows = [dict(row) for row in result.mappings().all()]
                 logger.info(f"Fetched {len(rows)} specific products.")
                 return rows
@@ -87,9 +125,62 @@ class PSQLService:
             # Raise exception to let the caller handle the failure
             raise e
 
+    async def fetch_fingerprints(self) -> List[dict]:
+        """
+        Retrieves the change-detection state of every product, active or not.
+
+        Returns:
+            List[dict]: {"product_id", "is_active", "updated_at", "fingerprint"} per
+            product. The fingerprint hashes the aggregated categories, sizes and colors.
+
+        Raises:
+            Exception: Query errors are re-raised, an empty result would read as
+                "every product was deleted".
+        """
+        try:
+            async with self.engine.connect() as conn:
+                logger.debug("Executing fetch_fingerprints query.")
+                result = await conn.execute(text(PSQL_FETCH_FINGERPRINTS_QUERIES))
+
+                rows = [dict(row) for row in result.mappings().all()]
+                logger.info(f"Fetched fingerprints of {len(rows)} products.")
+                return rows
+
+        except Exception as e:
+            logger.error(f"Error executing fetch_fingerprints: {e}")
+            raise
+
+    async def notify(self, channel: str, payload: str) -> None:
+        """
+        Sends a PostgreSQL notification to every listener of `channel`.
+        """
+        async with self.engine.connect() as conn:
+            await conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload}
+            )
+            await conn.commit()
+
+    async def listen(self, channel: str, callback: Callable[[str], None]) -> None:
+        """
+        Calls `callback(payload)` for every notification sent on `channel`,
+        over a dedicated connection kept open until dispose().
+        """
+        if self._listener is None:
+            dsn = self.db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+            self._listener = await asyncpg.connect(dsn, ssl="require")
+            self._listener.add_termination_listener(
+                lambda _: logger.error("PostgreSQL listener connection lost. Notifications are no longer received.")
+            )
+
+        await self._listener.add_listener(channel, lambda _conn, _pid, _channel, payload: callback(payload))
+        logger.info(f"Listening to PostgreSQL channel '{channel}'.")
+
     async def dispose(self):
         """
-        Closes the database connection pool.
+        Closes the listener connection and the database connection pool.
         """
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
         await self.engine.dispose()
         logger.info("PSQL Engine disposed.")
\ No newline at end of file
@@ -0,0 +1,177 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Every pool created in this process, so they can be shut down together on exit
+_POOLS: List["InferencePool"] = []
+
+# Service instance owned by a process-pool worker (built once by its initializer)
+_WORKER_TARGET: Any = None
+
+
+class InferencePoolSaturated(RuntimeError):
+    """
+    Raised when an InferencePool rejects a call because too many are already waiting.
+    """
+
+
+def _init_worker(factory: Callable[[], Any]) -> None:
+    """
+    Builds the worker-local service instance inside a process-pool worker.
+    Models are loaded once per worker process, not once per call.
+    """
+    global _WORKER_TARGET
+    _WORKER_TARGET = factory()
+
+
+def _call_worker_target(method_name: str, args: tuple, kwargs: dict) -> Any:
+    """
+    Executes a method of the worker-local service instance.
+    """
+    return getattr(_WORKER_TARGET, method_name)(*args, **kwargs)
+
+
+class InferencePool:
+    """
+    A dedicated worker pool for blocking model inference or client calls.
+
+    Async code awaits `run()` while the actual work happens on the pool, so the
+    event loop is only used for I/O. Admission is bounded: at most
+    `workers + queue_size` calls can be running or queued on the executor at
+    the same time. Further callers wait for a free slot (backpressure), but
+    no more than `workers + queue_size` of them and for at most
+    `admission_timeout` seconds; beyond that `InferencePoolSaturated` is
+    raised, so overload sheds requests instead of piling them up.
+
+    Two kinds of pools are supported:
+        - "thread": runs the callable directly in a ThreadPoolExecutor. Best for
+          ONNX models (they release the GIL) and network clients.
+        - "process": runs the call in a ProcessPoolExecutor. Each worker process
+          builds its own service instance with `worker_factory`, and `run()`
+          forwards the call by method name to that instance. Arguments and
+          results must be picklable.
+
+    Parameters:
+        name (str): Pool name, used for logging.
+        kind (str): "thread" or "process". Defaults to "thread".
+        workers (int): Number of worker threads/processes. Defaults to 1.
+        queue_size (int): Number of calls allowed to wait for a worker. Defaults to 32.
+        worker_factory (Callable, optional): Picklable callable that builds the
+            service instance inside each worker process. Required for "process".
+        admission_timeout (float, optional): Seconds a call may wait for a free
+            slot. Defaults to 30; None waits indefinitely.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str = "thread",
+        workers: int = 1,
+        queue_size: int = 32,
+        worker_factory: Optional[Callable[[], Any]] = None,
+        admission_timeout: Optional[float] = 30,
+    ) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported pool kind '{kind}' for pool '{name}'")
+        if kind == "process" and worker_factory is None:
+            raise ValueError(f"Process pool '{name}' requires a worker_factory")
+
+        self.name = name
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_size)
+        self.admission_timeout = admission_timeout
+
+        self.executor: Executor
+        if kind == "process":
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(worker_factory,),
+            )
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=f"inference-{name}"
+            )
+
+        self._slots = asyncio.Semaphore(self.capacity)
+        self._waiting = 0
+        _POOLS.append(self)
+
+        logger.info(
+            f"InferencePool '{name}' initialized (kind={kind}, workers={self.workers}, capacity={self.capacity})."
+        )
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Executes `fn(*args, **kwargs)` on the pool and awaits its result.
+
+        For process pools, `fn` must be a bound method of the pooled service;
+        the call is forwarded by name to the worker-local instance.
+
+        Args:
+            fn (Callable): The blocking callable to run.
+            *args, **kwargs: Arguments for the callable.
+
+        Returns:
+            Any: Whatever the callable returns. Exceptions are propagated.
+
+        Raises:
+            InferencePoolSaturated: If `capacity` calls are already waiting, or
+                no slot frees up within `admission_timeout`.
+        """
+        if self._slots.locked():
+            await self.__wait_for_slot()
+        else:
+            await self._slots.acquire()
+
+        try:
+            loop = asyncio.get_running_loop()
+
+            if self.kind == "process":
+                call = functools.partial(_call_worker_target, fn.__name__, args, kwargs)
+            else:
+                call = functools.partial(fn, *args, **kwargs)
+
+            return await loop.run_in_executor(self.executor, call)
+        finally:
+            self._slots.release()
+
+    async def __wait_for_slot(self) -> None:
+        """
+        Acquires a slot of a saturated pool, within the waiter and time bounds.
+        """
+        if self._waiting >= self.capacity:
+            raise InferencePoolSaturated(
+                f"InferencePool '{self.name}' is saturated ({self._waiting} calls waiting). Call rejected."
+            )
+
+        logger.warning(f"InferencePool '{self.name}' is saturated. Waiting for a free slot...")
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.admission_timeout)
+        except asyncio.TimeoutError:
+            raise InferencePoolSaturated(
+                f"InferencePool '{self.name}' had no free slot within {self.admission_timeout}s. Call rejected."
+            ) from None
+        finally:
+            self._waiting -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stops the pool's workers.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"InferencePool '{self.name}' shut down.")
+
+
+def shutdown_inference_pools() -> None:
+    """
+    Shuts down every InferencePool created in this process.
+    """
+    while _POOLS:
+        _POOLS.pop().shutdown()
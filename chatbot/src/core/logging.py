@@ -35,6 +35,11 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
+        # Structured fields passed with `extra={"fields": {...}}`
+        fields = getattr(record, "fields", None)
+        if isinstance(fields, dict):
+            log_record.update(fields)
+
         # If error, log the error stack trace
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
@@ -1,10 +1,21 @@
+import asyncio
 import logging
+from contextlib import suppress
 
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
+from src.core.config import settings
 from src.core.logging import setup_logger
+from src.core.executor import shutdown_inference_pools
+from src.utils.tokens import load_encoding
 from src.api.v1.routers import router as v1_router
-from src.api.dependencies import get_rag_pipeline, get_sync_service, get_qdrant_service
+from src.api.dependencies import (
+    get_cache_service,
+    get_psql_service,
+    get_qdrant_service,
+    get_rag_pipeline,
+    get_sync_service,
+)
 
 setup_logger()
 logger = logging.getLogger(__name__)
@@ -17,11 +28,29 @@ async def lifespan(app: FastAPI):
     sync_service = get_sync_service()
     qdrant_service = get_qdrant_service()
 
+    await get_cache_service().start_invalidation_listener()
+
+    # The context budget counts tokens on every request; load the encoding off the event loop
+    await asyncio.to_thread(load_encoding)
+
     logger.info("All services initialized")
 
+    incremental_sync = None
+    if settings.INCREMENTAL_SYNC_INTERVAL_SECONDS > 0:
+        incremental_sync = asyncio.create_task(
+            sync_service.run_incremental_schedule(settings.INCREMENTAL_SYNC_INTERVAL_SECONDS)
+        )
+
     yield
 
     logger.info("Shutting down...")
+    if incremental_sync is not None:
+        incremental_sync.cancel()
+        with suppress(asyncio.CancelledError):
+            await incremental_sync
+    shutdown_inference_pools()
+    await qdrant_service.close()
+    await get_psql_service().dispose()
 
 app = FastAPI(title="Fashion ecommerce chatbot v1", version="1.0.0", lifespan=lifespan)
 
@@ -1,5 +1,8 @@
+import asyncio
+import copy
 import logging
-from typing import Union, Any, Literal, List, Dict
+import time
+from typing import Union, Any, AsyncGenerator, Literal, List, Dict, Optional, Tuple
 
 from src.services.semantic_router_service import SemanticRouterService
 from src.services.embedding_service import EmbeddingService
@@ -9,6 +12,12 @@ from src.services.llm_service import LLMService
 from src.services.rerank_service import RerankService
 from src.services.cache_service import CacheService
 from src.utils.text_helper import PROMPT_TEMPLATE, CHITCHAT_PROMPT_TEMPLATE
+from src.utils.query_normalizer import normalize_query
+from src.utils.reference_detector import find_history_reference
+from src.utils.singleflight import SingleFlight
+from src.utils.product_card import build_product_card, build_product_summary
+from src.utils.tokens import count_tokens, truncate_to_tokens
+from src.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +42,12 @@ class Pipeline:
         rerank_service: RerankService,
         llm_service: LLMService,
         cache_service: CacheService,
+        max_concurrent_subqueries: int = 4,
+        detect_history_references: bool = True,
+        fused_reflection: bool = False,
+        coalesce_requests: bool = True,
+        context_token_budget: int = 1500,
+        max_context_products: int = 15,
     ):
         self.semantic_router_service = semantic_router_service
         self.embedding_service = embedding_service
@@ -42,62 +57,158 @@ class Pipeline:
         self.llm_service = llm_service
         self.cache_service = cache_service
 
-    def __build_context(self, selected_products: List[Dict[str, Any]]) -> str:
+        # Bounds how many sub-queries are searched at once when the batch search falls back
+        self.max_concurrent_subqueries = max(1, max_concurrent_subqueries)
+
+        # When enabled, self-contained queries skip the history lookup and the rewrite call
+        self.detect_history_references = detect_history_references
+        self.reflection_stats = {"self_contained": 0, "no_history": 0, "rewritten": 0, "fused": 0, "fused_fallback": 0}
+
+        # When enabled, reflection and decomposition share one LLM call
+        self.fused_reflection = fused_reflection
+
+        # Concurrent identical cache misses share one retrieval / generation
+        self.singleflight = SingleFlight() if coalesce_requests else None
+
+        # Upper bound on the tokens spent on product context per prompt
+        self.context_token_budget = max(1, context_token_budget)
+        # Upper bound on the products (and cards) per answer; the cache tags an answer with all of them
+        self.max_context_products = max(1, max_context_products)
+
+    def __build_context(
+        self, selected_products: List[Dict[str, Any]], timer: StageTimer
+    ) -> Tuple[str, List[Dict[str, Any]]]:
         """
-        Constructs a text context from selected products for the LLM prompt.
-        
-        Updated to match the new SQL Query Aliases:
-        - product_name, product_description, price, rating, categories, etc.
-        
+        Constructs a token-budgeted text context from selected products for the LLM prompt.
+
+        Each product is represented by the compact summary precomputed at sync
+        time. Beyond `max_context_products`, or when the summaries do not fit in
+        `context_token_budget`, the lowest-ranked products (by rerank score) are
+        dropped; if even the best product does not fit, its summary is truncated. Products keep their
+        retrieval order in the context.
+
         Args:
             selected_products (List[Dict]): List of product objects from Qdrant/DB.
+            timer (StageTimer): Receives the context_tokens and context_products metrics.
 
         Returns:
-            str: A formatted string containing product details.
+            Tuple[str, List[Dict]]: A formatted string containing product details,
+            and the products that made it into it, in retrieval order, so the
+            returned cards match what the LLM was shown.
         """
         if not selected_products:
-            return "No products found matching the criteria."
-            
-        context_parts = []
-        for i, item in enumerate(selected_products, 1):
-            # 'meta' contains the payload from Qdrant/DB which matches the SQL columns
+            return "No products found matching the criteria.", []
+
+        summaries = []
+        for item in selected_products:
+            # 'meta' contains the payload from Qdrant; points synced before summaries existed get one on the fly
             p = item.get("meta", {})
-            
-            context_parts.append(
-                f"{i}. Name: {p.get('product_name', 'N/A')}\n"
-                f"   Categories: {p.get('categories', '')}\n"
-                f"   Price: {p.get('price', 'N/A')}\n"
-                f"   Original price: {p.get('original_price', 'N/A')}"
-                f"   Rating: {p.get('rating', '0')} ({p.get('review_count', 0)} reviews)\n"
-                f"   Description: {p.get('product_description', '')}\n"
-                f"   Available colors: {p.get('available_colors', '')}\n"
-                f"   Available sizes: {p.get('available_sizes', '')}\n"
+            summaries.append(p.get("summary") or build_product_summary(p))
+
+        # Spend the budget on the best-scored products first
+        by_rank = sorted(
+            range(len(selected_products)),
+            key=lambda i: selected_products[i].get("score", 0.0),
+            reverse=True,
+        )
+
+        kept = {}
+        used_tokens = 0
+        for index in by_rank[: self.max_context_products]:
+            # "N. " prefix and newline
+            cost = count_tokens(summaries[index]) + 3
+            if used_tokens + cost <= self.context_token_budget:
+                kept[index] = summaries[index]
+                used_tokens += cost
+            elif not kept:
+                kept[index] = truncate_to_tokens(summaries[index], self.context_token_budget - 3)
+                used_tokens = self.context_token_budget
+
+        dropped = len(selected_products) - len(kept)
+        if dropped:
+            logger.info(
+                f"Context budget of {self.context_token_budget} tokens / {self.max_context_products} products "
+                f"reached. Dropped {dropped} products."
             )
-        return "\n".join(context_parts)
+
+        timer.set_metric("context_tokens", used_tokens)
+        timer.set_metric("context_products", len(kept))
+
+        context_str = "\n".join(
+            f"{position}. {kept[index]}"
+            for position, index in enumerate(sorted(kept), 1)
+        )
+        return context_str, [selected_products[index] for index in sorted(kept)]
     
-    async def __reflect(self, session_id: int, query: str) -> str:
+    async def __reflect(self, session_id: int, query: str) -> Tuple[str, Optional[str]]:
         """
         Rewrites the user query based on chat history to include context.
+
+        A local rule-based detector runs first: queries without anaphora or
+        ellipsis ("show me linen shirts") are returned as-is, without loading
+        the history or calling the LLM.
+
+        In fused mode the rewrite also classifies and decomposes the query
+        (the decomposition is memoized for the next step). If the fused call
+        fails, the plain rewrite call is used instead.
+
+        Returns:
+            Tuple[str, Optional[str]]: The reflected query and an intent hint
+            from the fused call (None otherwise).
         """
+        if self.detect_history_references:
+            reason = find_history_reference(query)
+            if reason is None:
+                self.reflection_stats["self_contained"] += 1
+                logger.info(f"Query '{query}' is self-contained. Skipping reflection.")
+                return query, None
+            logger.info(f"Query '{query}' refers to previous turns ({reason}).")
+
         history = await self.memory_service.get_history(session_id=session_id)
+        if not history:
+            self.reflection_stats["no_history"] += 1
+            return query, None
+
+        if self.fused_reflection:
+            fused = await self.llm_service.reflect_and_decompose(query=query, history=history)
+            if fused is not None:
+                self.reflection_stats["fused"] += 1
+                return fused["rewritten_query"], fused["intent"]
+            self.reflection_stats["fused_fallback"] += 1
+
+        self.reflection_stats["rewritten"] += 1
         reflected_query = await self.llm_service.rewrite_query_with_memory(query=query, history=history)
-        return reflected_query
+        return reflected_query, None
     
-    def __route(self, query: str) -> Literal['CHITCHAT', 'PRODUCT_QUERY']:
+    async def __route(
+        self, query: str, intent_hint: Optional[str] = None
+    ) -> Literal['CHITCHAT', 'PRODUCT_QUERY']:
         """
         Determines the intent of the query using the Semantic Router.
+        When the router has no match, the LLM intent hint (fused mode) is used.
         """
-        intent = self.semantic_router_service.guide(query)
+        intent = await self.semantic_router_service.guide_async(query)
         if not intent:
+            if intent_hint:
+                logger.info(f"Router returned None for '{query}', using LLM intent hint {intent_hint}")
+                return intent_hint
             logger.info(f"Router returned None for '{query}', falling back to PRODUCT_QUERY")
             return 'CHITCHAT'
         return intent
     
-    async def __search_cache(self, query: str) -> str:
+    async def __embed_for_cache(self, query: str) -> Optional[List[float]]:
         """
-        Checks the semantic cache for an existing response.
+        Dense embedding of the reflected query, used as the L1 cache key.
+        Skipped when the cache service has no L1 layer.
         """
-        return await self.cache_service.search_response(prompt=query)
+        if self.cache_service.l1_cache is None:
+            return None
+
+        try:
+            return (await self.embedding_service.get_dense_embeddings_async([query]))[0]
+        except Exception as e:
+            logger.error(f"Failed to embed query for cache lookup: {e}")
+            return None
         
     async def __format_query(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -106,46 +217,168 @@ class Pipeline:
         formatted_query = await self.llm_service.generate_search_queries(query=query)
         return formatted_query
     
-    async def __retrieve(self, search_queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def __to_sparse_dict(raw_sparse_vec: Any) -> Dict[str, Any]:
+        return {
+            "indices": raw_sparse_vec.indices.tolist(),
+            "values": raw_sparse_vec.values.tolist(),
+        }
+
+    async def __search_one(
+        self, query_dense_vec: List[float], raw_sparse_vec: Any, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """
+        Runs Hybrid Search for a single, already embedded sub-query.
+
+        The async Qdrant client awaits the network, so the event loop stays free.
+        """
+        matched_products = await self.qdrant_service.search_hybrid(
+            query_dense_vec=query_dense_vec,
+            query_sparse_vec=self.__to_sparse_dict(raw_sparse_vec),
+            top_k=10,
+            filters=filters,
+        )
+        return matched_products or []
+
+    async def __search_all(
+        self,
+        dense_vectors: List[List[float]],
+        sparse_vectors: List[Any],
+        semantic_queries: List[str],
+        filters_list: List[Optional[Dict[str, Any]]],
+    ) -> List[List[Any]]:
+        """
+        Runs the Hybrid Search of every sub-query in one batched Qdrant request.
+
+        Sub-queries carry their structured filters (price, size, color,
+        category). A filtered sub-query with no match is searched again without
+        filters, so the answer can still offer alternatives.
+
+        If the batch request fails, the sub-queries are searched one by one,
+        concurrently (bounded by `max_concurrent_subqueries`).
+
+        Returns:
+            List[List[Any]]: Matched points per sub-query, aligned with the input.
+        """
+        sparse_dicts = [self.__to_sparse_dict(vec) for vec in sparse_vectors]
+        matched_products_list = await self.qdrant_service.search_hybrid_batch(
+            query_dense_vecs=list(dense_vectors),
+            query_sparse_vecs=sparse_dicts,
+            top_k=10,
+            filters_list=filters_list,
+        )
+
+        if matched_products_list is not None:
+            empty = [i for i, points in enumerate(matched_products_list) if filters_list[i] and not points]
+            if empty:
+                logger.info(f"No match with filters for {len(empty)} sub-queries. Retrying without filters.")
+                relaxed = await self.qdrant_service.search_hybrid_batch(
+                    query_dense_vecs=[dense_vectors[i] for i in empty],
+                    query_sparse_vecs=[sparse_dicts[i] for i in empty],
+                    top_k=10,
+                )
+                for i, points in zip(empty, relaxed or []):
+                    matched_products_list[i] = points
+            return matched_products_list
+
+        logger.warning("Batched search failed. Falling back to one search per sub-query.")
+        semaphore = asyncio.Semaphore(self.max_concurrent_subqueries)
+
+        async def search_bounded(index: int) -> List[Any]:
+            async with semaphore:
+                try:
+                    return await self.__search_one(
+                        query_dense_vec=dense_vectors[index],
+                        raw_sparse_vec=sparse_vectors[index],
+                        filters=filters_list[index],
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Search failed for sub-query '{semantic_queries[index]}': {e}",
+                        exc_info=True,
+                    )
+                    return []
+
+        # gather() keeps results aligned with the sub-queries
+        return list(await asyncio.gather(*(search_bounded(index) for index in range(len(dense_vectors)))))
+
+    async def __fill_missing_payloads(self, matched_products_list: List[List[Any]]) -> None:
+        """
+        Lazily fetches the full payload of points that lack the precomputed
+        summary (synced before summaries existed), so they can still be reranked
+        and shown. A no-op once the collection has been fully re-synced.
+        """
+        missing = {
+            point.id: point
+            for points in matched_products_list
+            for point in points
+            if not (point.payload or {}).get("summary")
+        }
+        if not missing:
+            return
+
+        logger.info(f"Fetching full payloads for {len(missing)} points without a summary.")
+        payloads = await self.qdrant_service.retrieve_payloads(list(missing))
+        for points in matched_products_list:
+            for point in points:
+                if point.id in payloads:
+                    point.payload = {**payloads[point.id], **(point.payload or {})}
+
+    async def __retrieve(
+        self, search_queries: List[Dict[str, Any]], timer: StageTimer
+    ) -> List[Dict[str, Any]]:
         """
         Executes Hybrid Search (Dense + Sparse) and Reranking.
+
+        1. All sub-queries are embedded in one batch (dense model on the
+           semantic queries, sparse model on the keyword queries).
+        2. All hybrid searches are sent to Qdrant in one batch request, with
+           each sub-query's structured filters pushed down into the prefetches.
+        3. All (sub-query, candidate) pairs are reranked in one inference call.
+
+        Results are merged in the original sub-query order, so deduplication
+        is deterministic.
         """
-        unique_products_map = {}
+        if not search_queries:
+            return []
 
+        semantic_queries = []
+        sparse_queries = []
+        filters_list = []
         for sub_query in search_queries:
             semantic_query = sub_query.get("semantic_query", "")
             keywords = sub_query.get("keywords", [])
 
             # Construct sparse query from keywords
-            sparse_query = " ".join(keywords) if keywords else semantic_query
+            semantic_queries.append(semantic_query)
+            sparse_queries.append(" ".join(keywords) if keywords else semantic_query)
+            filters_list.append(sub_query.get("filters"))
 
-            # Generate embeddings
-            dense_vectors, sparse_vectors = self.embedding_service.get_embeddings(
-                [semantic_query, sparse_query]
+        # 1. Generate only the embeddings that are used: dense(semantic), sparse(keywords)
+        with timer.stage("embedding"):
+            dense_vectors, sparse_vectors = await self.embedding_service.get_query_embeddings_async(
+                semantic_queries, sparse_queries
             )
 
-            query_dense_vec = dense_vectors[0]
-            raw_sparse_vec = sparse_vectors[1]
-
-            query_sparse_vec = {
-                "indices": raw_sparse_vec.indices.tolist(),
-                "values": raw_sparse_vec.values.tolist(),
-            }
-
-            # 1. Hybrid Search in Qdrant
-            matched_products = self.qdrant_service.search_hybrid(
-                query_dense_vec=query_dense_vec,
-                query_sparse_vec=query_sparse_vec,
-                top_k=10,
+        # 2. Hybrid Search in Qdrant (one round trip for every sub-query)
+        with timer.stage("search"):
+            matched_products_list = await self.__search_all(
+                dense_vectors, sparse_vectors, semantic_queries, filters_list
             )
 
-            # 2. Reranking
-            reranked_products = self.rerank_service.rerank_matched_products(
-                semantic_query=semantic_query,
-                matched_products=matched_products,
+        with timer.stage("payload_fetch"):
+            await self.__fill_missing_payloads(matched_products_list)
+
+        # 3. Reranking (single batched call for every sub-query)
+        with timer.stage("rerank"):
+            reranked_lists = await self.rerank_service.rerank_batch_async(
+                semantic_queries=semantic_queries,
+                matched_products_list=list(matched_products_list),
                 top_k=5,
             )
 
+        unique_products_map = {}
+        for reranked_products in reranked_lists:
             # Deduplicate products based on ID
             for product in reranked_products:
                 # Key update: SQL uses 'product_id', Qdrant payload stores it as such
@@ -158,117 +391,290 @@ class Pipeline:
     
     def __extract_product_metadata(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Extracts and transforms product data to match the Frontend interface.
-        
-        Target Interface:
-            id: string;
-            name: string;
-            price: number;
-            image: string;
-            rating: number;
-            reviewCount: number;
-            colors: { name: string; hex: string }[];
-            sizes: string[];
+        Returns the frontend product cards (ProductMetadata shape) of the products.
+
+        Cards are precomputed by SyncService and stored in the Qdrant payload,
+        so they are passed through as-is. Points synced before cards existed
+        are converted on the fly.
         """
         extracted = []
         for p in products:
             meta = p.get("meta", {})
-            
-            # 1. Handle Sizes: "S, M, L" -> ["S", "M", "L"]
-            raw_sizes = meta.get("available_sizes")
-            sizes_list = [s.strip() for s in raw_sizes.split(",")] if raw_sizes else []
-
-            # 2. Handle Colors: "Red, Blue" -> [{name: "Red", hex: ""}, ...]
-            raw_colors = meta.get("available_colors")
-            colors_list = []
-            if raw_colors:
-                color_names = [c.strip() for c in raw_colors.split(",")]
-                for c_name in color_names:
-                    colors_list.append({
-                        "name": c_name,
-                        "hex": "" # Placeholder. Update SQL if you need real hex codes.
-                    })
-
-            extracted.append({
-                "id": str(meta.get("product_id")),
-                "name": meta.get("product_name"),
-                "price": float(meta.get("price") or 0),
-                "image": meta.get("image_url"),
-                "rating": float(meta.get("rating") or 0),
-                "reviewCount": int(meta.get("review_count") or 0),
-                "colors": colors_list,
-                "sizes": sizes_list
-            })
+            card = meta.get("card")
+            extracted.append(card if card is not None else build_product_card(meta))
             
         return extracted
 
-    async def get_response(self, session_id: int, user_query: str) -> Dict[str, Any]:
+    async def __prepare(self, session_id: int, user_query: str, timer: StageTimer) -> Dict[str, Any]:
         """
-        Main entry point for the pipeline.
-        
-        Args:
-            session_id (int): The session ID (from PostgreSQL).
-            user_query (str): The user's input text.
-            
+        Runs reflection, routing and the cache lookup.
+
+        Chitchat gets its prompt here; product-query misses are completed by
+        `__build_product_prompt`.
+
         Returns:
-            Dict[str, Any]: { "content": str, "products": List[dict], "intent": str }
+            Dict[str, Any]: {
+                "reflected_query": str,
+                "intent": str,
+                "products": List[dict],      # Frontend product cards
+                "prompt": Optional[str],     # None on a cache hit or before retrieval
+                "cached": Optional[dict],    # Cached ChatResponse payload, if any
+                "query_embedding": Optional[List[float]],  # L1 cache key
+            }
         """
         # 1. Reflection
-        reflected_query = await self.__reflect(session_id=session_id, query=user_query)
+        with timer.stage("reflect"):
+            reflected_query, intent_hint = await self.__reflect(session_id=session_id, query=user_query)
         logger.info(f"Reflected Query: {reflected_query}")
         
         # 2. Routing
-        route = self.__route(reflected_query)
+        with timer.stage("route"):
+            route = await self.__route(reflected_query, intent_hint=intent_hint)
         logger.info(f"Route determined: {route}")
-        
-        response_text = ""
-        products_data = []
-        
-        #! FOR TESTING ONLY, NOT EXISTS IN PRODUCTION
-        # await self.memory_service.add_message_temp(session_id, "USER", user_query)
-        
+
+        prepared = {
+            "reflected_query": reflected_query,
+            "intent": route,
+            "products": [],
+            "prompt": None,
+            "cached": None,
+            "query_embedding": None,
+        }
+
         # 3. Handling Logic
         if route == 'CHITCHAT': 
-            prompt = CHITCHAT_PROMPT_TEMPLATE.format(query=reflected_query)
-            response_text = await self.llm_service.response(prompt=prompt, stream=False)
-            
-        else: # PRODUCT_QUERY
-            # A. Check Cache
-            cache_obj = await self.cache_service.search_response(reflected_query)
-            if cache_obj:
-                logger.info("Cache hit!")
-                return cache_obj
-            
-            # B. Format Query & Retrieve
+            prepared["prompt"] = CHITCHAT_PROMPT_TEMPLATE.format(query=reflected_query)
+            return prepared
+
+        # PRODUCT_QUERY
+        # A. Check Cache
+        with timer.stage("cache_embedding"):
+            prepared["query_embedding"] = await self.__embed_for_cache(reflected_query)
+        with timer.stage("cache_lookup"):
+            cache_obj = await self.cache_service.search_response(
+                reflected_query, embedding=prepared["query_embedding"]
+            )
+        if cache_obj:
+            logger.info("Cache hit!")
+            prepared["cached"] = cache_obj
+        return prepared
+
+    async def __build_product_prompt(self, reflected_query: str, timer: StageTimer) -> Dict[str, Any]:
+        """
+        Retrieves products for a cache miss and builds the generation prompt.
+
+        Returns:
+            Dict[str, Any]: {"products": List[dict], "prompt": str}
+        """
+        # B. Format Query & Retrieve
+        with timer.stage("decomposition"):
             search_queries = await self.__format_query(query=reflected_query)
-            selected_products = await self.__retrieve(search_queries=search_queries)
-            
-            # Extract metadata for Node.js
-            products_data = self.__extract_product_metadata(selected_products)
-            
-            # C. Build Context & Generate
-            context_str = self.__build_context(selected_products=selected_products)
+        selected_products = await self.__retrieve(search_queries=search_queries, timer=timer)
+        
+        with timer.stage("context_build"):
+            # C. Build Context
+            context_str, context_products = self.__build_context(selected_products=selected_products, timer=timer)
+
+            # Extract metadata for Node.js, only for the products the LLM can talk about
+            products = self.__extract_product_metadata(context_products)
             prompt = PROMPT_TEMPLATE.format(context_str=context_str, query=reflected_query)
+        return {"products": products, "prompt": prompt}
+
+    async def __coalesce(self, kind: str, prepared: Dict[str, Any], fn, timer: StageTimer) -> Tuple[Any, bool]:
+        """
+        Runs `fn` through the singleflight group of the reflected query.
+
+        Requests that joined another request's computation record the time they
+        waited as the "coalesced_wait" stage and get a private copy of the result.
 
-            # D. Call LLM
-            response_text = await self.llm_service.response(prompt=prompt, stream=False)
+        Returns:
+            Tuple[Any, bool]: The result and whether the request was coalesced.
+        """
+        if self.singleflight is None:
+            return await fn(), False
+
+        key = (kind, normalize_query(prepared["reflected_query"]))
+        start = time.perf_counter()
+        result, coalesced = await self.singleflight.do(key, fn)
+        if coalesced:
+            timer.add("coalesced_wait", (time.perf_counter() - start) * 1000)
+            result = copy.deepcopy(result)
+        return result, coalesced
+
+    async def __answer(self, prepared: Dict[str, Any], timer: StageTimer) -> Dict[str, Any]:
+        """
+        Retrieval (product queries), LLM generation and cache save for a cache miss.
+
+        Returns:
+            Dict[str, Any]: { "content": str, "products": List[dict], "intent": str }
+        """
+        if prepared["prompt"] is None:
+            prepared.update(await self.__build_product_prompt(prepared["reflected_query"], timer))
+
+        # D. Call LLM
+        timer.set_metric("prompt_tokens", count_tokens(prepared["prompt"]))
+        with timer.stage("llm_generation"):
+            response_text = await self.llm_service.response(prompt=prepared["prompt"], stream=False)
+
+        # E. Save to Cache
+        await self.__save_to_cache(prepared, response_text, timer)
+        return {
+            "content": response_text,
+            "intent": prepared["intent"],
+            "products": prepared["products"]
+        }
+
+    async def __save_to_cache(
+        self, prepared: Dict[str, Any], response_text: str, timer: StageTimer
+    ) -> None:
+        """
+        Stores a generated product answer in the semantic cache.
+        """
+        if prepared["intent"] != 'PRODUCT_QUERY' or not response_text:
+            return
+
+        with timer.stage("cache_save"):
+            await self.cache_service.save_response(
+                prompt=prepared["reflected_query"],
+                response={
+                    "content": response_text, 
+                    "intent": prepared["intent"],
+                    "products": prepared["products"]
+                },
+                embedding=prepared["query_embedding"],
+            )
+
+    def __log_timings(self, session_id: int, intent: str, timer: StageTimer) -> None:
+        """
+        Emits the per-stage latency breakdown as structured log fields.
+        """
+        logger.info(
+            f"Pipeline finished in {timer.total_ms:.1f}ms",
+            extra={
+                "fields": {
+                    "session_id": session_id,
+                    "intent": intent,
+                    "timings_ms": dict(timer.timings),
+                    "metrics": dict(timer.metrics),
+                    "total_ms": timer.total_ms,
+                }
+            },
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Runtime counters of the pipeline and its caches (per worker process).
+        """
+        return {
+            "reflection": dict(self.reflection_stats),
+            "singleflight": self.singleflight.get_stats() if self.singleflight is not None else None,
+            "llm": self.llm_service.get_stats(),
+            "cache": self.cache_service.get_stats(),
+        }
+
+    async def get_response(
+        self, session_id: int, user_query: str, timer: Optional[StageTimer] = None
+    ) -> Dict[str, Any]:
+        """
+        Main entry point for the pipeline.
+        
+        Args:
+            session_id (int): The session ID (from PostgreSQL).
+            user_query (str): The user's input text.
+            timer (StageTimer, optional): Collects per-stage latencies. Pass one in
+                to read the breakdown after the call.
             
-            # E. Save to Cache
-            if response_text:
-                await self.cache_service.save_response(
-                    prompt=reflected_query,
-                    response={
-                        "content": response_text, 
-                        "intent": route,
-                        "products": products_data
-                    }
-                )
+        Returns:
+            Dict[str, Any]: { "content": str, "products": List[dict], "intent": str }
+        """
+        timer = timer or StageTimer()
+
+        #! FOR TESTING ONLY, NOT EXISTS IN PRODUCTION
+        # await self.memory_service.add_message_temp(session_id, "USER", user_query)
+
+        prepared = await self.__prepare(session_id=session_id, user_query=user_query, timer=timer)
+        if prepared["cached"]:
+            self.__log_timings(session_id, prepared["intent"], timer)
+            return prepared["cached"]
+
+        if prepared["intent"] == 'PRODUCT_QUERY':
+            # Identical concurrent misses wait for one retrieval + generation
+            response, _ = await self.__coalesce(
+                "answer", prepared, lambda: self.__answer(prepared, timer), timer
+            )
+        else:
+            response = await self.__answer(prepared, timer)
+        self.__log_timings(session_id, prepared["intent"], timer)
         
         #! FOR TESTING ONLY, NOT EXISTS IN PRODUCTION
-        # await self.memory_service.add_message_temp(session_id, "BOT", response_text)
+        # await self.memory_service.add_message_temp(session_id, "BOT", response["content"])
         # 4. Return structured data to Node.js Backend
-        return {
-            "content": response_text,
-            "intent": route,
-            "products": products_data
-        }
\ No newline at end of file
+        return response
+
+    async def stream_response(
+        self, session_id: int, user_query: str, timer: Optional[StageTimer] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Streaming variant of get_response.
+
+        Yields events in this order:
+            1. {"event": "metadata", "intent": str, "products": List[dict]}
+               as soon as retrieval is finished.
+            2. {"event": "token", "content": str} for every LLM chunk.
+            3. {"event": "done"} once the answer is complete.
+
+        A cache hit is replayed as a single token event. The full answer is
+        written to the cache after the stream completes. Identical concurrent
+        misses share retrieval; each stream still runs its own generation, and
+        only the request that did the retrieval saves the answer.
+
+        Args:
+            session_id (int): The session ID (from PostgreSQL).
+            user_query (str): The user's input text.
+            timer (StageTimer, optional): Collects per-stage latencies.
+        """
+        timer = timer or StageTimer()
+        prepared = await self.__prepare(session_id=session_id, user_query=user_query, timer=timer)
+
+        cached = prepared["cached"]
+        if cached:
+            self.__log_timings(session_id, prepared["intent"], timer)
+            yield {
+                "event": "metadata",
+                "intent": cached.get("intent", prepared["intent"]),
+                "products": cached.get("products", []),
+            }
+            yield {"event": "token", "content": cached.get("content", "")}
+            yield {"event": "done"}
+            return
+
+        coalesced = False
+        if prepared["prompt"] is None:
+            built, coalesced = await self.__coalesce(
+                "prompt",
+                prepared,
+                lambda: self.__build_product_prompt(prepared["reflected_query"], timer),
+                timer,
+            )
+            prepared.update(built)
+
+        yield {"event": "metadata", "intent": prepared["intent"], "products": prepared["products"]}
+
+        timer.set_metric("prompt_tokens", count_tokens(prepared["prompt"]))
+        generation_start = time.perf_counter()
+        streamer = await self.llm_service.response(prompt=prepared["prompt"], stream=True)
+        if streamer is None:
+            raise RuntimeError("LLM streaming request failed")
+
+        chunks = []
+        async for chunk in streamer:
+            if not chunks:
+                timer.add("llm_first_token", (time.perf_counter() - generation_start) * 1000)
+            chunks.append(chunk)
+            yield {"event": "token", "content": chunk}
+        timer.add("llm_generation", (time.perf_counter() - generation_start) * 1000)
+
+        if not coalesced:
+            await self.__save_to_cache(prepared, "".join(chunks), timer)
+        self.__log_timings(session_id, prepared["intent"], timer)
+        yield {"event": "done"}
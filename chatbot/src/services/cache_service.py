@@ -3,10 +3,27 @@ import asyncio
 import json
 
 from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
 from langcache import LangCache
+from langcache.errors import BadRequestErrorResponseContent
+
+from src.core.database import PSQLService
+from src.services.l1_cache_service import L1CacheService
 
 logger = logging.getLogger(__name__)
 
+# LangCache attribute shared by every cached product answer
+PRODUCT_SCOPE_ATTRIBUTE = "scope"
+PRODUCT_SCOPE_VALUE = "product_answer"
+
+# Invalidating more products than this drops every product answer at once
+FLUSH_THRESHOLD = 50
+
+# PostgreSQL channel carrying L1 invalidations ("42,43" or "*") to every worker
+L1_INVALIDATION_CHANNEL = "chatbot_l1_invalidation"
+FLUSH_MESSAGE = "*"
+MAX_NOTIFY_PAYLOAD = 7000
+
 
 class CacheService:
     """
@@ -23,32 +40,91 @@ class CacheService:
         threshold (float, optional):
             Similarity score threshold used when searching for cached responses.
             Defaults to 1.
+        l1_cache (L1CacheService, optional):
+            In-process cache consulted before LangCache. LangCache hits are
+            written back into it.
+        ttl_seconds (int, optional):
+            Lifetime of LangCache entries. Defaults to the cache's own setting.
+        product_attribute_slots (int, optional):
+            Number of "product_<n>" attributes declared on the LangCache cache,
+            at least the most products an answer can show. Defaults to 15.
+        untagged_ttl_seconds (int, optional):
+            Lifetime of the LangCache entries that could not be tagged with
+            their products (and so cannot be invalidated). Defaults to 300.
+        psql_service (PSQLService, optional):
+            Used to broadcast L1 invalidations to every worker process
+            (PostgreSQL LISTEN/NOTIFY). Without it only the local L1 is invalidated.
+
+    Cached answers embed product data (price, rating, sizes), so every
+    LangCache entry is tagged with the IDs of the products it shows, one per
+    "product_<n>" attribute, plus scope=product_answer. `invalidate_products`
+    deletes by attribute on the LangCache server, so entries saved by any
+    worker, before or after a restart, are removed. Answers that cannot be
+    tagged (more products than attribute slots, or a cache without these
+    attributes declared, which LangCache rejects) are saved untagged with the
+    short `untagged_ttl_seconds` lifetime instead. The L1 caches of all
+    workers are invalidated through a PostgreSQL notification.
     """
 
     def __init__(
-        self, server_url: str, cache_id: str, api_key: str, threshold: float = 0.95
+        self,
+        server_url: str,
+        cache_id: str,
+        api_key: str,
+        threshold: float = 0.95,
+        l1_cache: Optional[L1CacheService] = None,
+        ttl_seconds: Optional[int] = None,
+        product_attribute_slots: int = 15,
+        untagged_ttl_seconds: int = 300,
+        psql_service: Optional[PSQLService] = None,
     ):
         logger.info(f"Connecting to LangCache at {server_url}...")
         self.lang_cache = LangCache(
             server_url=server_url, cache_id=cache_id, api_key=api_key
         )
         self.threshold = threshold
+        self.l1_cache = l1_cache
+        self.ttl_seconds = ttl_seconds
         self.executor = ThreadPoolExecutor(max_workers=5)
+        self.product_attribute_slots = max(1, product_attribute_slots)
+        self.untagged_ttl_seconds = untagged_ttl_seconds
+        # Turned off on the first save LangCache rejects for its attributes
+        self.tag_products = True
+        self.psql_service = psql_service
         logger.info(f"Successfully create Cache service with threshold {threshold}.")
 
-    async def search_response(self, prompt) -> str:
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Counters of the L1 cache.
+        """
+        return {
+            "l1_cache": self.l1_cache.get_stats() if self.l1_cache is not None else None,
+        }
+
+    async def search_response(self, prompt, embedding: Optional[List[float]] = None) -> str:
         """
         Search for a cached response that matches the given prompt based on
         the configured similarity threshold.
 
+        The in-process L1 cache is checked first; LangCache is only called on
+        an L1 miss, and a LangCache hit is written back into L1.
+
         Args:
             prompt (str): The input prompt to look up in the cache.
+            embedding (List[float], optional): Dense embedding of the prompt,
+                used for the L1 semantic lookup.
 
         Returns:
             Optional[str]: The cached response if a match above the threshold is
                 found; otherwise None.
         """
         preview_prompt = (prompt[:50] + "...") if len(prompt) > 50 else prompt
+        if self.l1_cache is not None:
+            cached = self.l1_cache.get(prompt, embedding)
+            if cached is not None:
+                logger.info(f"L1 cache hit: {preview_prompt}")
+                return cached
+
         logger.debug(f"Searching LangCache for response to prompt: {preview_prompt}.")
         try:
             loop = asyncio.get_running_loop()
@@ -65,7 +141,11 @@ class CacheService:
                 logger.info(f"Cache hit: {preview_prompt}")
 
                 raw = result.data[0].response
-                return json.loads(raw)   # ← decode JSON
+                response = json.loads(raw)   # ← decode JSON
+
+                if self.l1_cache is not None:
+                    self.l1_cache.set(prompt, response, embedding)
+                return response
 
             logger.info(f"Cache miss: {preview_prompt}")
             return None
@@ -74,13 +154,15 @@ class CacheService:
                 f"Error while searching LangCache for response to prompt: {preview_prompt}: {e}"
             )
 
-    async def save_response(self, prompt, response) -> None:
+    async def save_response(self, prompt, response, embedding: Optional[List[float]] = None) -> None:
         """
-        Store a prompt-response pair into LangCache.
+        Store a prompt-response pair into the L1 cache and LangCache.
 
         Args:
             prompt (str): The input prompt to be stored.
             response (json): The generated response associated with the prompt.
+            embedding (List[float], optional): Dense embedding of the prompt,
+                used for later L1 semantic lookups.
 
         Returns:
             None: This method returns nothing; it completes once the save
@@ -91,17 +173,173 @@ class CacheService:
         logger.debug(
             f"Saving LLM response to LangCache. Prompt: {preview_prompt}; Response: {preview_response}."
         )
+        if self.l1_cache is not None:
+            self.l1_cache.set(prompt, response, embedding)
+
+        attributes = self.__product_attributes(response) if self.tag_products else None
+        if attributes is None:
+            logger.debug(f"Answer cannot be tagged with its products, saved untagged: {preview_prompt}")
+
         try:
             payload = json.dumps(response)  # ← encode JSON
 
-            loop = asyncio.get_running_loop()
+            try:
+                await self.__set(prompt, payload, attributes)
+            except BadRequestErrorResponseContent as e:
+                if attributes is None:
+                    raise
+                # Most likely "scope" / "product_<n>" are not declared on this cache
+                self.tag_products = False
+                logger.warning(
+                    f"LangCache rejected the product attributes, saving answers untagged "
+                    f"with a {self.untagged_ttl_seconds}s TTL from now on: {e}"
+                )
+                await self.__set(prompt, payload, None)
+
+            logger.info(f"Saved cache for: {preview_prompt}")
+
+        except Exception as e:
+            logger.error(f"Error while saving LLM response to LangCache: {e}")
+
+    async def __set(self, prompt: str, payload: str, attributes: Optional[Dict[str, str]]) -> None:
+        """
+        Saves an entry in LangCache. Untagged entries cannot be invalidated,
+        so they get the short untagged TTL.
+        """
+        if attributes is None:
+            ttl_seconds = min(self.ttl_seconds or self.untagged_ttl_seconds, self.untagged_ttl_seconds)
+        else:
+            ttl_seconds = self.ttl_seconds
+        ttl_millis = ttl_seconds * 1000 if ttl_seconds else None
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self.executor,
+            lambda: self.lang_cache.set(
+                prompt=prompt, response=payload, attributes=attributes, ttl_millis=ttl_millis
+            )
+        )
+
+    def __product_attributes(self, response: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """
+        LangCache attributes tagging an answer with its products
+        ({"scope": "product_answer", "product_1": "42", ...}), or None when it
+        shows more products than there are attribute slots.
+        """
+        product_ids = []
+        for product in response.get("products") or []:
+            product_id = str(product.get("id") or "")
+            if product_id and product_id not in product_ids:
+                product_ids.append(product_id)
+
+        if len(product_ids) > self.product_attribute_slots:
+            return None
 
-            await loop.run_in_executor(
+        attributes = {PRODUCT_SCOPE_ATTRIBUTE: PRODUCT_SCOPE_VALUE}
+        for slot, product_id in enumerate(product_ids, 1):
+            attributes[f"product_{slot}"] = product_id
+        return attributes
+
+    async def __delete_by_attributes(self, attributes: Dict[str, str]) -> int:
+        """
+        Deletes the LangCache entries matching every attribute. Never called
+        with an empty dict, which would wipe the whole cache.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(
                 self.executor,
-                lambda: self.lang_cache.set(prompt=prompt, response=payload)
+                lambda: self.lang_cache.delete_query(attributes=attributes)
             )
+            return result.deleted_entries_count
+        except Exception as e:
+            logger.error(f"Failed to delete LangCache entries matching {attributes}: {e}")
+            return 0
 
-            logger.info(f"Saved cache for: {preview_prompt}")
+    def __invalidate_l1(self, product_ids: Optional[List[str]]) -> None:
+        """
+        Drops the given products (None: everything) from this worker's L1 cache.
+        """
+        if self.l1_cache is None:
+            return
+        if product_ids is None:
+            self.l1_cache.clear()
+            logger.info("Cleared the L1 cache.")
+        else:
+            removed = self.l1_cache.invalidate_products(product_ids)
+            logger.info(f"Invalidated {removed} L1 cache entries for {len(product_ids)} products.")
+
+    def __on_invalidation_message(self, payload: str) -> None:
+        self.__invalidate_l1(None if payload == FLUSH_MESSAGE else payload.split(","))
 
+    async def start_invalidation_listener(self) -> None:
+        """
+        Subscribes this worker's L1 cache to the invalidations broadcast by
+        any worker. Called once at startup.
+        """
+        if self.psql_service is None or self.l1_cache is None:
+            return
+        try:
+            await self.psql_service.listen(L1_INVALIDATION_CHANNEL, self.__on_invalidation_message)
         except Exception as e:
-            logger.error(f"Error while saving LLM response to LangCache: {e}")
+            logger.error(f"Could not subscribe to L1 cache invalidations: {e}")
+
+    async def __broadcast_l1_invalidation(self, product_ids: Optional[List[str]]) -> None:
+        """
+        Sends the invalidation to the other workers' L1 caches, in chunks that
+        fit a NOTIFY payload.
+        """
+        if self.psql_service is None:
+            return
+
+        if product_ids is None:
+            messages = [FLUSH_MESSAGE]
+        else:
+            messages, chunk = [], []
+            for product_id in product_ids:
+                if chunk and len(",".join(chunk + [product_id])) > MAX_NOTIFY_PAYLOAD:
+                    messages.append(",".join(chunk))
+                    chunk = []
+                chunk.append(product_id)
+            messages.append(",".join(chunk))
+
+        try:
+            for message in messages:
+                await self.psql_service.notify(L1_INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.error(f"Could not broadcast L1 cache invalidation: {e}")
+
+    async def invalidate_products(self, product_ids: Iterable[Any]) -> None:
+        """
+        Deletes every cached answer that shows one of the given products, from
+        LangCache and from the L1 cache of every worker.
+
+        Beyond FLUSH_THRESHOLD products (e.g. a full sync), every product
+        answer is dropped instead of issuing one delete per product and slot.
+
+        Args:
+            product_ids (Iterable): IDs of the products that changed or were deleted.
+        """
+        product_ids = list(dict.fromkeys(str(p) for p in product_ids))
+        if not product_ids:
+            return
+
+        flush = len(product_ids) > FLUSH_THRESHOLD
+        l1_ids = None if flush else product_ids
+        self.__invalidate_l1(l1_ids)
+        await self.__broadcast_l1_invalidation(l1_ids)
+
+        if flush:
+            queries = [{PRODUCT_SCOPE_ATTRIBUTE: PRODUCT_SCOPE_VALUE}]
+        else:
+            queries = [
+                {f"product_{slot}": product_id}
+                for product_id in product_ids
+                for slot in range(1, self.product_attribute_slots + 1)
+            ]
+
+        deleted = sum(await asyncio.gather(*(self.__delete_by_attributes(q) for q in queries)))
+        logger.info(
+            f"Invalidated {deleted} LangCache entries for {len(product_ids)} products"
+            + (" (flushed all product answers)." if flush else ".")
+        )
@@ -1,20 +1,39 @@
 import logging
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from fastembed import SparseTextEmbedding, TextEmbedding
 
+from src.core.executor import InferencePool
+
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingService:
-    def __init__(self, dense_model_name: str, sparse_model_name: str) -> None:
+    def __init__(
+        self,
+        dense_model_name: str,
+        sparse_model_name: str,
+        inference_pool: Optional[InferencePool] = None,
+    ) -> None:
         """
         Initialize the embedding service with both dense and sparse embedding models.
 
         Parameters:
             dense_model_name: Name or path of the dense embedding model.
             sparse_model_name: Name or path of the sparse embedding model.
+            inference_pool: Pool used by the async wrappers. Defaults to a
+                single-thread pool, created on first use (so instances built
+                inside process-pool workers have none). With a "process" pool
+                the models are only loaded by the pool's workers, not here.
         """
+        self._inference_pool = inference_pool
+        self.dense_model = None
+        self.sparse_model = None
+
+        if inference_pool is not None and inference_pool.kind == "process":
+            logger.info("Embedding models are loaded by the process pool workers.")
+            return
+
         logger.info(f"Loading dense vector embedding model: {dense_model_name}")
         self.dense_model = TextEmbedding(model_name=dense_model_name)
 
@@ -23,6 +42,92 @@ class EmbeddingService:
 
         logger.info("Embedding models successfully loaded.")
 
+    @property
+    def inference_pool(self) -> InferencePool:
+        if self._inference_pool is None:
+            self._inference_pool = InferencePool(name="embedding")
+        return self._inference_pool
+
+    def __log_duration(self, start_time: float, count: int, kind: str) -> None:
+        """
+        Logs how long an embedding call took, warning on slow calls.
+        """
+        duration = time.perf_counter() - start_time
+        if duration > 1.0:
+            logger.warning(
+                f"Slow embedding detected: {duration:.4f}s for {count} texts ({kind})."
+            )
+        else:
+            logger.debug(f"Embedded {count} texts ({kind}) in {duration:.4f}s")
+
+    def get_dense_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate dense vector embeddings only.
+
+        Parameters:
+            texts: A list of input strings to embed.
+
+        Returns:
+            List of dense embedding vectors (list of floats), one per text.
+        """
+        if not texts:
+            return []
+
+        start_time = time.perf_counter()
+        dense_vectors = [v.tolist() for v in self.dense_model.embed(texts)]
+        self.__log_duration(start_time, len(texts), "dense")
+        return dense_vectors
+
+    def get_sparse_embeddings(self, texts: List[str]) -> List[object]:
+        """
+        Generate sparse vector embeddings only.
+
+        Parameters:
+            texts: A list of input strings to embed.
+
+        Returns:
+            List of sparse embedding objects, one per text.
+        """
+        if not texts:
+            return []
+
+        start_time = time.perf_counter()
+        sparse_vectors = list(self.sparse_model.embed(texts))
+        self.__log_duration(start_time, len(texts), "sparse")
+        return sparse_vectors
+
+    def get_query_embeddings(
+        self, semantic_queries: List[str], sparse_queries: List[str]
+    ) -> Tuple[List[List[float]], List[object]]:
+        """
+        Embed all sub-queries of a request with one invocation per model.
+
+        Only the vectors used at query time are computed: the dense model runs
+        on the semantic queries and the sparse model on the keyword queries.
+
+        Parameters:
+            semantic_queries: Natural language queries for dense search.
+            sparse_queries: Keyword strings for sparse search, aligned with
+                semantic_queries.
+
+        Returns:
+            A tuple (dense_vectors, sparse_vectors), aligned with the inputs.
+
+        Raises:
+            Exception: Propagates any exception encountered during embedding operations.
+        """
+        logger.info(f"Creating query embeddings for {len(semantic_queries)} sub-queries...")
+        try:
+            dense_vectors = self.get_dense_embeddings(semantic_queries)
+            sparse_vectors = self.get_sparse_embeddings(sparse_queries)
+            return dense_vectors, sparse_vectors
+
+        except Exception as e:
+            logger.error(
+                f"Error embedding {len(semantic_queries)} sub-queries: {str(e)}", exc_info=True
+            )
+            raise
+
     def get_embeddings(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[object]]:
@@ -41,26 +146,37 @@ class EmbeddingService:
             Exception: Propagates any exception encountered during embedding operations.
         """
         logger.info(f"Creating vector embeddings for {len(texts)} texts...")
-        start_time = time.perf_counter()
 
         try:
-            # Dense embeddings
-            dense_vectors = list(self.dense_model.embed(texts))
-            dense_vectors = [v.tolist() for v in dense_vectors]
-
-            # Sparse embeddings (already in output form)
-            sparse_vectors = list(self.sparse_model.embed(texts))
-
-            # Performance logging
-            duration = time.perf_counter() - start_time
-            if duration > 1.0:
-                logger.warning(
-                    f"Slow embedding detected: {duration:.4f}s for {len(texts)} texts."
-                )
-            else:
-                logger.debug(f"Embedded in {duration:.4f}s")
-
+            dense_vectors = self.get_dense_embeddings(texts)
+            sparse_vectors = self.get_sparse_embeddings(texts)
             return dense_vectors, sparse_vectors
 
         except Exception as e:
-            logger.error(f"Error embedding {len(texts)} texts: {str(e)}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Error embedding {len(texts)} texts: {str(e)}", exc_info=True)
+            raise
+
+    async def get_embeddings_async(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[object]]:
+        """
+        Async wrapper of get_embeddings that runs on the inference pool,
+        keeping the event loop free while the models run.
+        """
+        return await self.inference_pool.run(self.get_embeddings, texts)
+
+    async def get_dense_embeddings_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        Async wrapper of get_dense_embeddings that runs on the inference pool.
+        """
+        return await self.inference_pool.run(self.get_dense_embeddings, texts)
+
+    async def get_query_embeddings_async(
+        self, semantic_queries: List[str], sparse_queries: List[str]
+    ) -> Tuple[List[List[float]], List[object]]:
+        """
+        Async wrapper of get_query_embeddings that runs on the inference pool.
+        """
+        return await self.inference_pool.run(
+            self.get_query_embeddings, semantic_queries, sparse_queries
+        )
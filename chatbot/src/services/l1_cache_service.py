@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from src.utils.query_normalizer import normalize_query
+
+logger = logging.getLogger(__name__)
+
+
+class L1CacheService:
+    """
+    In-process semantic cache placed in front of LangCache.
+
+    Entries are keyed by the reflected query. A lookup first tries an exact
+    hash of the normalized query text, then a vectorized cosine scan of the
+    query's dense embedding against every live entry.
+
+    Eviction combines:
+        - TTL: entries expire `ttl_seconds` after they were stored.
+        - LRU: the least recently used entry is evicted when `max_entries`
+          or `max_bytes` would be exceeded.
+
+    Responses are stored as JSON strings, so callers always get a fresh copy
+    and the memory accounting matches what is actually held. A product id ->
+    entry index allows dropping only the answers that show a given product.
+
+    Parameters:
+        threshold (float): Minimum cosine similarity for a semantic hit. Defaults to 0.95.
+        max_entries (int): Maximum number of cached responses. Defaults to 2048.
+        ttl_seconds (float): Lifetime of an entry. Defaults to 600.
+        max_bytes (int): Memory cap for stored responses and vectors. Defaults to 64 MB.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 2048,
+        ttl_seconds: float = 600,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        # key -> {"slot": int, "payload": str, "size": int, "products": Set[str]}, ordered by recency
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # product id -> keys of the entries whose response contains it
+        self._product_keys: Dict[str, Set[str]] = {}
+
+        # Vector matrix is allocated on the first insert, when the dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._expires_at = np.zeros(self.max_entries, dtype=np.float64)
+        self._slot_keys: List[Optional[str]] = [None] * self.max_entries
+        self._free_slots = list(range(self.max_entries - 1, -1, -1))
+        self._used_bytes = 0
+
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0}
+
+        logger.info(
+            f"L1CacheService initialized (threshold={threshold}, max_entries={self.max_entries}, "
+            f"ttl={ttl_seconds}s, max_bytes={max_bytes})."
+        )
+
+    @staticmethod
+    def __make_key(prompt: str) -> str:
+        """
+        Hashes the normalized prompt (case, whitespace and trailing punctuation insensitive).
+        """
+        return hashlib.sha1(normalize_query(prompt).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def __normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def __remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        slot = entry["slot"]
+        self._slot_keys[slot] = None
+        self._expires_at[slot] = 0.0
+        if self._vectors is not None:
+            self._vectors[slot] = 0.0
+        self._free_slots.append(slot)
+        self._used_bytes -= entry["size"]
+
+        for product_id in entry["products"]:
+            keys = self._product_keys.get(product_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._product_keys[product_id]
+
+    def __evict_lru(self) -> None:
+        oldest_key = next(iter(self._entries))
+        self.__remove(oldest_key)
+        self.stats["evictions"] += 1
+
+    def __hit(self, key: str) -> Dict[str, Any]:
+        self._entries.move_to_end(key)
+        return json.loads(self._entries[key]["payload"])
+
+    def get(self, prompt: str, embedding: Optional[List[float]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a cached response.
+
+        Args:
+            prompt (str): The reflected user query.
+            embedding (List[float], optional): Dense embedding of the prompt.
+                Without it only exact matches are possible.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached response, or None on a miss.
+        """
+        now = time.monotonic()
+
+        # 1. Exact hash match
+        key = self.__make_key(prompt)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._expires_at[entry["slot"]] > now:
+                self.stats["exact_hits"] += 1
+                return self.__hit(key)
+            self.__remove(key)
+
+        # 2. Cosine scan over live entries
+        if embedding is not None and self._vectors is not None and self._entries:
+            query_vector = self.__normalize(embedding)
+            if query_vector.shape[0] != self._vectors.shape[1]:
+                logger.warning("Query embedding dimension does not match the L1 cache. Skipping scan.")
+                self.stats["misses"] += 1
+                return None
+
+            scores = self._vectors @ query_vector
+            scores[self._expires_at <= now] = -1.0
+
+            best_slot = int(np.argmax(scores))
+            if scores[best_slot] >= self.threshold:
+                self.stats["semantic_hits"] += 1
+                return self.__hit(self._slot_keys[best_slot])
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, prompt: str, response: Dict[str, Any], embedding: Optional[List[float]] = None) -> None:
+        """
+        Stores a response, evicting least recently used entries when full.
+
+        Args:
+            prompt (str): The reflected user query.
+            response (Dict[str, Any]): JSON-serializable response.
+            embedding (List[float], optional): Dense embedding of the prompt.
+                Entries without one can only be found by exact match.
+        """
+        key = self.__make_key(prompt)
+        self.__remove(key)
+
+        payload = json.dumps(response, ensure_ascii=False)
+        vector = self.__normalize(embedding) if embedding is not None else None
+        if vector is not None and self._vectors is not None and vector.shape[0] != self._vectors.shape[1]:
+            logger.warning("Embedding dimension does not match the L1 cache. Storing for exact match only.")
+            vector = None
+        size = len(payload.encode("utf-8")) + (vector.nbytes if vector is not None else 0)
+
+        if size > self.max_bytes:
+            logger.warning(f"Response of {size} bytes exceeds the L1 memory cap. Not cached.")
+            return
+
+        while self._entries and (not self._free_slots or self._used_bytes + size > self.max_bytes):
+            self.__evict_lru()
+
+        slot = self._free_slots.pop()
+        if vector is not None:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+            self._vectors[slot] = vector
+
+        self._slot_keys[slot] = key
+        self._expires_at[slot] = time.monotonic() + self.ttl_seconds
+        product_ids = {str(p.get("id")) for p in response.get("products") or [] if p.get("id")}
+        self._entries[key] = {"slot": slot, "payload": payload, "size": size, "products": product_ids}
+        self._used_bytes += size
+
+        for product_id in product_ids:
+            self._product_keys.setdefault(product_id, set()).add(key)
+
+    def invalidate_products(self, product_ids: Iterable[Any]) -> int:
+        """
+        Drops every entry whose response contains one of the given products.
+
+        Args:
+            product_ids (Iterable): Product IDs (int or str).
+
+        Returns:
+            int: Number of entries removed.
+        """
+        keys = set()
+        for product_id in product_ids:
+            keys.update(self._product_keys.get(str(product_id), ()))
+
+        for key in keys:
+            self.__remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        """
+        for key in list(self._entries):
+            self.__remove(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters plus current size.
+        """
+        return {**self.stats, "entries": len(self._entries), "bytes": self._used_bytes}
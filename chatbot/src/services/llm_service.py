@@ -1,3 +1,5 @@
+import copy
+import hashlib
 import json
 import os
 import asyncio
@@ -5,15 +7,29 @@ import logging
 
 from dotenv import load_dotenv
 from groq import AsyncGroq
-from typing import Union, AsyncGenerator, Dict, Any, List
+from typing import Union, AsyncGenerator, Dict, Any, List, Optional
 
-from src.utils.text_helper import FORMAT_USER_INPUT_PROMPT, REWRITE_QUERY_WITH_HISTORY_PROMPT_TEMPLATE
+from src.utils.text_helper import (
+    FORMAT_USER_INPUT_PROMPT,
+    REWRITE_QUERY_WITH_HISTORY_PROMPT_TEMPLATE,
+    REFLECT_AND_DECOMPOSE_PROMPT,
+    REFLECT_AND_DECOMPOSE_INPUT_TEMPLATE,
+)
+from src.utils.query_normalizer import normalize_query
+from src.utils.search_filters import normalize_search_filters
+from src.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
+# Memoized decompositions are keyed on the prompt that produced them, so editing it invalidates them
+SEARCH_QUERIES_PROMPT_VERSION = hashlib.sha1(FORMAT_USER_INPUT_PROMPT.encode("utf-8")).hexdigest()[:12]
+FUSED_QUERIES_PROMPT_VERSION = hashlib.sha1(
+    (REFLECT_AND_DECOMPOSE_PROMPT + REFLECT_AND_DECOMPOSE_INPUT_TEMPLATE + FORMAT_USER_INPUT_PROMPT).encode("utf-8")
+).hexdigest()[:12]
+
 
 class LLMService:
     """
@@ -24,17 +40,32 @@ class LLMService:
         1. Low-level communication with Groq's ChatCompletion API (async).
         2. Unified interface for full-response and streamed-response modes.
         3. Query decomposition where the model must output a strict JSON schema.
-        4. Fallback behavior to ensure system stability when the model produces invalid JSON.
+        4. Optional fused reflection + decomposition in a single JSON-mode call.
+        5. Fallback behavior to ensure system stability when the model produces invalid JSON.
 
     Attributes:
         client (AsyncGroq): Asynchronous Groq API client instance.
         model_name (str): Default model used for all completion requests.
+        search_queries_cache (TTLCache): Memo of successful query decompositions,
+            keyed on (prompt version, normalized query).
     """
-    def __init__(self, api_key: str, model_name: str):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str,
+        search_queries_cache: Optional[TTLCache] = None,
+    ):
         self.client = AsyncGroq(api_key=api_key)
         self.model_name = model_name
+        self.search_queries_cache = search_queries_cache or TTLCache()
         logger.info(f"LLMService initialized with model: {model_name}")
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Counters of the decomposition memo cache.
+        """
+        return {"search_queries_cache": self.search_queries_cache.get_stats()}
+
     async def response(
         self,
         prompt: str,
@@ -124,6 +155,76 @@ class LLMService:
             logger.warning(f"Trigger fallback mechanism. Returning original query.")
             return query
             
+    async def reflect_and_decompose(
+        self, query: str, history: List[Dict]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rewrites the query with the chat history, classifies it and decomposes it
+        for hybrid search, all in one JSON-mode call.
+
+        This replaces the `rewrite_query_with_memory` + `generate_search_queries`
+        round trips. On success the decomposition is stored in the memo cache
+        under the rewritten query and a version of both prompts, so a following
+        `generate_search_queries` call for it is served without another LLM call
+        and editing either prompt invalidates it.
+
+        Args:
+            query (str): The latest user query.
+            history (List[Dict]): Chat history as [{'role': ..., 'content': ...}].
+
+        Returns:
+            Optional[Dict[str, Any]]:
+                {
+                    "rewritten_query": str,
+                    "intent": Optional[str],   # "PRODUCT_QUERY" / "CHITCHAT" hint
+                    "queries": List[Dict[str, Any]]
+                }
+                None if the call fails or the output is invalid, so the caller
+                can fall back to the separate calls.
+        """
+        history_text = "\n".join([f"{msg['role']}: {msg['content']}" for msg in history])
+
+        logger.info(f"Rewriting and decomposing new user's query {query} in one call...")
+        try:
+            completion = await self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": REFLECT_AND_DECOMPOSE_PROMPT},
+                    {
+                        "role": "user",
+                        "content": REFLECT_AND_DECOMPOSE_INPUT_TEMPLATE.format(history=history_text, new_query=query),
+                    },
+                ],
+                temperature=0.1,
+                response_format={"type": "json_object"},
+            )
+            data = json.loads(completion.choices[0].message.content)
+
+            rewritten_query = data.get("rewritten_query")
+            if not isinstance(rewritten_query, str) or not rewritten_query.strip():
+                raise ValueError("LLM returned no 'rewritten_query'")
+            rewritten_query = rewritten_query.strip()
+
+            intent = data.get("intent")
+            if intent not in ("PRODUCT_QUERY", "CHITCHAT"):
+                intent = None
+
+            queries = [
+                {**q, "filters": normalize_search_filters(q.get("filters"))}
+                for q in data.get("queries") or []
+                if isinstance(q, dict) and q.get("semantic_query")
+            ]
+            if queries:
+                cache_key = (FUSED_QUERIES_PROMPT_VERSION, normalize_query(rewritten_query))
+                self.search_queries_cache.set(cache_key, copy.deepcopy(queries))
+
+            logger.info(f"Fused reflection returned '{rewritten_query}' with {len(queries)} sub-queries.")
+            return {"rewritten_query": rewritten_query, "intent": intent, "queries": queries}
+
+        except Exception as e:
+            logger.error(f"Fused reflection failed for query {query}: {e}")
+            return None
+
     async def generate_search_queries(self, query: str) -> List[Dict[str, Any]]:
         """
         Performs intelligent query decomposition using the LLM to prepare input
@@ -136,11 +237,17 @@ class LLMService:
             4. Produce, for each sub-query:
                 - semantic_query (str): cleaned, optimized query text.
                 - keywords (List[str]): extracted keyword list for sparse search.
+                - filters (dict | None): explicit price / size / color / category
+                  constraints, normalized for Qdrant payload filtering.
 
         The model is required to output strict JSON. If JSON parsing fails or
         the structure is invalid, the method falls back to a robust default that
         treats the entire user query as a single search unit.
 
+        Successful decompositions are memoized (bounded, with TTL) on the
+        normalized query and the prompt version, so repeated phrasing skips the
+        LLM call. Fallback results are never memoized.
+
         Args:
             query (str):
                 The raw text provided by the user describing what they want.
@@ -150,7 +257,8 @@ class LLMService:
                 A list of objects with the structure:
                 {
                     "semantic_query": str,
-                    "keywords": List[str]
+                    "keywords": List[str],
+                    "filters": Optional[Dict[str, Any]]
                 }
                 In case of failure, returns a single-element fallback list.
 
@@ -159,6 +267,16 @@ class LLMService:
                 Any LLM or parsing-related exception is logged and re-raised
                 after fallback handling.
         """
+        normalized_query = normalize_query(query)
+        cache_key = (SEARCH_QUERIES_PROMPT_VERSION, normalized_query)
+        # The fused key holds decompositions left by reflect_and_decompose for the same rewritten query
+        cached_queries = self.search_queries_cache.get_any(
+            (cache_key, (FUSED_QUERIES_PROMPT_VERSION, normalized_query))
+        )
+        if cached_queries is not None:
+            logger.info(f"Reusing memoized search queries for input: '{query}'")
+            return copy.deepcopy(cached_queries)
+
         logger.info(f"Generating search queries for input: '{query}'")
         try:
             completion = await self.client.chat.completions.create(
@@ -185,11 +303,14 @@ class LLMService:
                 logger.warning("LLM returned valid JSON but empty 'queries' list.")
                 raise ValueError("LLM returned empty queries list")
 
+            queries = [{**q, "filters": normalize_search_filters(q.get("filters"))} for q in queries]
+
             logger.info(f"Successfully decomposed into {len(queries)} sub-queries.")
+            self.search_queries_cache.set(cache_key, copy.deepcopy(queries))
             return queries
 
         except Exception as e:
             logger.error(f"Error during query decomposition: {str(e)}", exc_info=True)
             logger.warning("Triggering fallback mechanism: returning original query.")
             # Fallback mechanism: Return the original query as a single item list
-            return [{"semantic_query": query, "keywords": query.split()}]
+            return [{"semantic_query": query, "keywords": query.split(), "filters": None}]
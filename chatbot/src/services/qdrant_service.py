@@ -1,6 +1,10 @@
+import asyncio
 import logging
-from typing import List, Dict, Any, Tuple
-from qdrant_client import QdrantClient, models
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
+from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.models import (
     VectorParams,
     SparseVectorParams,
@@ -12,54 +16,237 @@ logger = logging.getLogger(__name__)
 
 
 class QdrantService:
-    def __init__(self, url: str, api_key: str, collection_name: str) -> None:
+    QUANTIZATION_MODES = ("none", "scalar", "binary")
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str,
+        collection_name: str,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        search_timeout: float = 10,
+        upsert_timeout: float = 120,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        keepalive_expiry: float = 30,
+        payload_projection: bool = True,
+        quantization: str = "none",
+        quantization_always_ram: bool = True,
+        on_disk_vectors: bool = False,
+        rescore: bool = True,
+        oversampling: float = 2.0,
+        hnsw_m: int = 16,
+        hnsw_ef_construct: int = 100,
+        location: Optional[str] = None,
+    ) -> None:
         """
-        Initialize Qdrant service and establish connection.
+        Initialize Qdrant service backed by the async client.
+
+        The client keeps a pool of keep-alive connections, so the chat and sync
+        paths reuse connections instead of opening one per request, and no
+        thread is blocked while waiting on the network.
 
         Parameters:
             url: Qdrant endpoint URL.
             api_key: Qdrant API key or None for local deployments.
-            collection_name: Name of the collection where vectors will be stored.
+            collection_name: Name searches and writes go through. With blue/green
+                full syncs this is an alias pointing at the current versioned
+                collection ("<name>_v<timestamp>").
+            prefer_grpc: Use the gRPC transport (port `grpc_port`) instead of REST.
+            grpc_port: Qdrant gRPC port. Defaults to 6334.
+            search_timeout: Deadline in seconds of a search call. Defaults to 10.
+            upsert_timeout: Deadline in seconds of an upsert / delete call. Defaults to 120.
+            max_connections: Maximum open HTTP connections. Defaults to 32.
+            max_keepalive_connections: Idle connections kept open for reuse. Defaults to 16.
+            keepalive_expiry: Seconds an idle connection is kept open. Defaults to 30.
+            payload_projection: Return only RETRIEVAL_PAYLOAD_FIELDS from searches
+                instead of the full payload. Defaults to True.
+            quantization: Dense vector quantization: "none", "scalar" (int8) or
+                "binary". Defaults to "none".
+            quantization_always_ram: Keep quantized vectors in RAM. Defaults to True.
+            on_disk_vectors: Store the original float32 dense vectors on disk
+                (memmap). Useful with quantization. Defaults to False.
+            rescore: Rescore quantized candidates with the original vectors. Defaults to True.
+            oversampling: Candidates fetched per result before rescoring. Defaults to 2.0.
+            hnsw_m: HNSW graph degree used for serving. Defaults to 16.
+            hnsw_ef_construct: HNSW build-time search width used for serving. Defaults to 100.
+            location: Local Qdrant mode (":memory:" or a path). When set, `url`
+                and `api_key` are ignored. Used by the offline benchmarks.
         """
-        self.client = QdrantClient(url=url, api_key=api_key, check_compatibility=False, timeout=60)
+        if location:
+            self.client = AsyncQdrantClient(location=location)
+        else:
+            self.client = AsyncQdrantClient(
+                url=url,
+                api_key=api_key,
+                prefer_grpc=prefer_grpc,
+                grpc_port=grpc_port,
+                check_compatibility=False,
+                timeout=int(max(search_timeout, upsert_timeout)),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+            )
+        if quantization not in self.QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization '{quantization}', expected one of {self.QUANTIZATION_MODES}")
+
         self.collection_name = collection_name
+        self.is_local = bool(location)
+        self.quantization = quantization
+        self.quantization_always_ram = quantization_always_ram
+        self.on_disk_vectors = on_disk_vectors
+        self.rescore = rescore
+        self.oversampling = oversampling
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construct = hnsw_ef_construct
+        self.search_timeout = search_timeout
+        self.upsert_timeout = upsert_timeout
 
         self.DENSE_VECTOR_NAME = "text-dense"
         self.SPARSE_VECTOR_NAME = "text-sparse"
 
+        # Payload fields searches return: id, frontend card, compact summary (rerank + LLM context).
+        # Long fields (product_description, text_content) stay on the server.
+        self.RETRIEVAL_PAYLOAD_FIELDS = ["product_id", "card", "summary"]
+        self.with_payload = (
+            models.PayloadSelectorInclude(include=self.RETRIEVAL_PAYLOAD_FIELDS)
+            if payload_projection
+            else True
+        )
+
+        # Payload fields used by structured search filters, with their index type
+        self.PAYLOAD_INDEXES = {
+            "price": models.PayloadSchemaType.FLOAT,
+            "categories": models.PayloadSchemaType.KEYWORD,
+            "available_sizes": models.PayloadSchemaType.KEYWORD,
+            "available_colors": models.PayloadSchemaType.KEYWORD,
+        }
+
         logger.info(
-            f"QdrantService initialized. URL={url}, Collection={collection_name}"
+            f"QdrantService initialized. URL={location or url}, Collection={collection_name}, "
+            f"gRPC={prefer_grpc and not location}"
         )
 
-    def create_collection_hybrid(self) -> None:
+    async def close(self) -> None:
+        """
+        Closes the client's connections.
+        """
+        await self.client.close()
+        logger.info("QdrantService connections closed.")
+
+    def __build_quantization_config(self) -> Optional[Any]:
+        """
+        Quantization config of the dense vector for the configured mode.
+        """
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=self.quantization_always_ram,
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=self.quantization_always_ram)
+            )
+        return None
+
+    def __build_dense_search_params(self) -> Optional[models.SearchParams]:
+        """
+        Query-time quantization params: oversample quantized candidates and rescore
+        them with the original vectors.
+        """
+        if self.quantization == "none":
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=self.rescore,
+                oversampling=self.oversampling if self.rescore else None,
+            )
+        )
+
+    async def apply_vector_storage_config(self) -> None:
+        """
+        Switches an existing collection to the configured quantization and
+        on-disk settings. Qdrant rebuilds the quantized data in the background.
+        """
+        await self.client.update_collection(
+            collection_name=self.collection_name,
+            vectors_config={
+                self.DENSE_VECTOR_NAME: models.VectorParamsDiff(on_disk=self.on_disk_vectors)
+            },
+            quantization_config=self.__build_quantization_config() or models.Disabled.DISABLED,
+        )
+        logger.info(
+            f"Collection '{self.collection_name}' switched to quantization={self.quantization}, "
+            f"on_disk={self.on_disk_vectors}."
+        )
+
+    async def __create_collection(self, collection_name: str, bulk_load: bool = False) -> None:
+        """
+        Creates a hybrid collection (dense + sparse vectors) with its payload indexes.
+
+        With `bulk_load`, HNSW graph building is disabled (m=0) so points can be
+        loaded without indexing work; `finish_bulk_load` enables it afterwards.
+        """
+        await self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config={
+                self.DENSE_VECTOR_NAME: VectorParams(
+                    size=768,
+                    distance=Distance.COSINE,
+                    on_disk=self.on_disk_vectors,
+                )
+            },
+            sparse_vectors_config={
+                self.SPARSE_VECTOR_NAME: SparseVectorParams()
+            },
+            hnsw_config=models.HnswConfigDiff(
+                m=0 if bulk_load else self.hnsw_m,
+                ef_construct=self.hnsw_ef_construct,
+            ),
+            quantization_config=self.__build_quantization_config(),
+        )
+        await self.__ensure_payload_indexes(collection_name)
+        logger.info(f"Successfully created Hybrid Collection: {collection_name} (bulk_load={bulk_load})")
+
+    async def __get_alias_target(self) -> Optional[str]:
+        """
+        Name of the collection `collection_name` currently points to, if it is an alias.
+        """
+        response = await self.client.get_aliases()
+        for alias in response.aliases:
+            if alias.alias_name == self.collection_name:
+                return alias.collection_name
+        return None
+
+    async def create_collection_hybrid(self) -> None:
         """
         Create a Hybrid Search-enabled collection using both dense and sparse vectors.
-        If the collection already exists, the operation is skipped.
+        If the collection (or an alias with its name) already exists, creation is skipped.
+
+        Payload indexes for the filterable fields are ensured in both cases.
         """
         try:
-            if not self.client.collection_exists(self.collection_name):
+            if await self.__get_alias_target() is not None:
                 logger.info(
-                    f"Collection '{self.collection_name}' does not exist. Creating..."
-                )
-                self.client.create_collection(
-                    collection_name=self.collection_name,
-                    vectors_config={
-                        self.DENSE_VECTOR_NAME: VectorParams(
-                            size=768,
-                            distance=Distance.COSINE,
-                        )
-                    },
-                    sparse_vectors_config={
-                        self.SPARSE_VECTOR_NAME: SparseVectorParams()
-                    },
+                    f"Alias '{self.collection_name}' already exists. Skipping."
                 )
+                await self.__ensure_payload_indexes(self.collection_name)
+            elif not await self.client.collection_exists(self.collection_name):
                 logger.info(
-                    f"Successfully created Hybrid Collection: {self.collection_name}"
+                    f"Collection '{self.collection_name}' does not exist. Creating..."
                 )
+                await self.__create_collection(self.collection_name)
             else:
                 logger.info(
                     f"Collection '{self.collection_name}' already exists. Skipping."
                 )
+                await self.__ensure_payload_indexes(self.collection_name)
 
         except Exception as e:
             logger.error(
@@ -68,12 +255,204 @@ class QdrantService:
             )
             raise
 
-    def upsert_products(
+    async def create_versioned_collection(self) -> str:
+        """
+        Creates a fresh "<collection_name>_v<timestamp>" collection for a bulk
+        load, with HNSW indexing deferred.
+
+        Returns:
+            str: Name of the new collection.
+        """
+        version_name = f"{self.collection_name}_v{time.strftime('%Y%m%d%H%M%S')}"
+        logger.info(f"Creating versioned collection '{version_name}' for bulk load...")
+        await self.__create_collection(version_name, bulk_load=True)
+        return version_name
+
+    async def finish_bulk_load(self, collection_name: str, expected_points: int, timeout: float = 1800) -> None:
+        """
+        Enables HNSW indexing with the serving settings and waits until the
+        collection is fully indexed, so it serves at full speed once live.
+
+        The status alone is not enough: it still reads GREEN until the optimizer
+        picks up the new HNSW config. The collection is only considered ready
+        once it is GREEN, holds `expected_points` points and has indexed them all.
+        Collections below the optimizer's indexing threshold are never indexed
+        (searched exhaustively), so there only the point count is awaited.
+
+        Parameters:
+            collection_name: The bulk-loaded collection.
+            expected_points: Number of points loaded into it.
+            timeout: Seconds to wait for indexing. Defaults to 1800.
+
+        Raises:
+            TimeoutError: If indexing does not finish in time.
+        """
+        await self.client.update_collection(
+            collection_name=collection_name,
+            hnsw_config=models.HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct),
+        )
+
+        deadline = time.monotonic() + timeout
+        while True:
+            info = await self.client.get_collection(collection_name)
+            points_count = info.points_count or 0
+            if (
+                info.status == models.CollectionStatus.GREEN
+                and points_count >= expected_points
+                and (info.indexed_vectors_count or 0) >= self.__expected_indexed_vectors(info, expected_points)
+            ):
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Collection '{collection_name}' was not indexed within {timeout}s "
+                    f"(status={info.status}, points={points_count}/{expected_points}, "
+                    f"indexed={info.indexed_vectors_count})"
+                )
+            await asyncio.sleep(2)
+
+        logger.info(
+            f"Bulk load of '{collection_name}' finished "
+            f"({points_count} points, {info.indexed_vectors_count} vectors indexed)."
+        )
+
+    def __expected_indexed_vectors(self, info: models.CollectionInfo, points: int) -> int:
+        """
+        Dense vectors HNSW has to index before a bulk-loaded collection is ready:
+        all of them, unless their total size stays below the indexing threshold
+        (or the client runs in local mode, which has no HNSW index).
+        """
+        if self.is_local:
+            return 0
+
+        threshold_kb = info.config.optimizer_config.indexing_threshold
+        vectors = info.config.params.vectors
+        dense_params = vectors.get(self.DENSE_VECTOR_NAME) if isinstance(vectors, dict) else vectors
+        if threshold_kb is not None and dense_params is not None:
+            vectors_kb = points * dense_params.size * 4 / 1024
+            if vectors_kb < threshold_kb:
+                return 0
+        return points
+
+    async def is_plain_collection(self) -> bool:
+        """
+        Whether `collection_name` is a regular collection rather than an alias
+        (deployments from before blue/green syncs).
+        """
+        if await self.__get_alias_target() is not None:
+            return False
+        return await self.client.collection_exists(self.collection_name)
+
+    async def swap_alias(self, collection_name: str) -> Optional[str]:
+        """
+        Atomically points the `collection_name` alias at another collection.
+
+        Parameters:
+            collection_name: The collection that becomes live.
+
+        Returns:
+            Optional[str]: The collection the alias pointed to before, if any.
+
+        Raises:
+            RuntimeError: If `collection_name` is still a plain collection; it
+                has to go through `migrate_to_alias` once.
+        """
+        previous = await self.__get_alias_target()
+        if previous is None and await self.client.collection_exists(self.collection_name):
+            raise RuntimeError(
+                f"'{self.collection_name}' is a plain collection, not an alias. "
+                f"It must be migrated with migrate_to_alias first."
+            )
+
+        operations = []
+        if previous is not None:
+            operations.append(
+                models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=self.collection_name))
+            )
+        operations.append(
+            models.CreateAliasOperation(
+                create_alias=models.CreateAlias(collection_name=collection_name, alias_name=self.collection_name)
+            )
+        )
+        await self.client.update_collection_aliases(change_aliases_operations=operations)
+
+        logger.info(f"Alias '{self.collection_name}' now points to '{collection_name}' (was '{previous}').")
+        return previous
+
+    async def migrate_to_alias(self, collection_name: str) -> None:
+        """
+        One-off migration of a plain `collection_name` collection to an alias
+        pointing at `collection_name`.
+
+        Qdrant does not allow an alias and a collection with the same name, so
+        the plain collection is deleted right before the alias is created and
+        searches fail for the duration of these two calls. Only call this once
+        `collection_name` is fully loaded and indexed.
+
+        Parameters:
+            collection_name: The collection that becomes live.
+        """
+        logger.warning(
+            f"Migrating plain collection '{self.collection_name}' to an alias of '{collection_name}'."
+        )
+        await self.client.delete_collection(self.collection_name)
+        await self.client.update_collection_aliases(
+            change_aliases_operations=[
+                models.CreateAliasOperation(
+                    create_alias=models.CreateAlias(collection_name=collection_name, alias_name=self.collection_name)
+                )
+            ]
+        )
+        logger.info(f"Alias '{self.collection_name}' now points to '{collection_name}'.")
+
+    async def drop_collection(self, collection_name: str) -> None:
+        """
+        Deletes a collection (e.g. an aborted bulk load).
+        """
+        await self.client.delete_collection(collection_name)
+        logger.info(f"Dropped collection '{collection_name}'.")
+
+    async def gc_versions(self, keep: int = 2) -> List[str]:
+        """
+        Deletes old versioned collections, keeping the live one and the newest
+        `keep - 1` others (for rollback).
+
+        Parameters:
+            keep: Number of versions to keep, live one included. Defaults to 2.
+
+        Returns:
+            List[str]: Names of the deleted collections.
+        """
+        live = await self.__get_alias_target()
+        prefix = f"{self.collection_name}_v"
+        response = await self.client.get_collections()
+        versions = sorted(
+            (c.name for c in response.collections if c.name.startswith(prefix)),
+            reverse=True,
+        )
+
+        kept = [live] if live in versions else []
+        deleted = []
+        for name in versions:
+            if name in kept:
+                continue
+            if len(kept) < max(1, keep):
+                kept.append(name)
+                continue
+            await self.client.delete_collection(name)
+            deleted.append(name)
+
+        if deleted:
+            logger.info(f"Garbage-collected old collection versions: {deleted}")
+        return deleted
+
+    async def upsert_products(
         self,
         ids: List[int],
         dense_vectors: List[List[float]],
         sparse_vectors: List[Any],
         payloads: List[Dict[str, Any]],
+        collection_name: Optional[str] = None,
+        wait: bool = True,
     ) -> None:
         """
         Upsert (insert or update) product vectors and payloads.
@@ -83,6 +462,11 @@ class QdrantService:
             dense_vectors: List of dense embedding vectors.
             sparse_vectors: List of sparse embeddings (objects supporting as_object()).
             payloads: List of payload dictionaries to attach to each point.
+            collection_name: Target collection. Defaults to the live collection
+                (alias); a versioned collection is passed during bulk loads.
+            wait: Return only once the points are applied. Bulk loads pass False
+                and rely on the point count check of `finish_bulk_load` instead.
+                Defaults to True.
 
         Raises:
             Exception: Raised when upsert fails.
@@ -104,17 +488,21 @@ class QdrantService:
             ]
 
             logger.debug(f"Sending upsert request for {count} points...")
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points,
-                wait=True,
+            await asyncio.wait_for(
+                self.client.upsert(
+                    collection_name=collection_name or self.collection_name,
+                    points=points,
+                    wait=wait,
+                ),
+                timeout=self.upsert_timeout,
             )
             logger.info(f"Successfully upserted {count} products.")
 
         except Exception as e:
             logger.error(f"Error during upsert operation: {e}", exc_info=True)
+            raise
 
-    def delete_products(self, ids: List[int]) -> None:
+    async def delete_products(self, ids: List[int]) -> None:
         """
         Delete products based on their IDs.
 
@@ -123,6 +511,10 @@ class QdrantService:
 
         Notes:
             If the ID list is empty, the operation is skipped.
+
+        Raises:
+            Exception: Raised when the delete fails, so callers do not record
+                the products as removed.
         """
         if not ids:
             logger.warning("Delete operation called with empty ID list. Skipping.")
@@ -131,21 +523,112 @@ class QdrantService:
         logger.info(f"Attempting to delete {len(ids)} products...")
 
         try:
-            self.client.delete(
-                collection_name=self.collection_name,
-                points_selector=models.PointIdsList(points=ids),
-                wait=True,
+            await asyncio.wait_for(
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=models.PointIdsList(points=ids),
+                    wait=True,
+                ),
+                timeout=self.upsert_timeout,
             )
             logger.info(f"Successfully deleted {len(ids)} products.")
 
         except Exception as e:
             logger.error(f"Error deleting products: {e}", exc_info=True)
+            raise
 
-    def search_hybrid(
+    async def __ensure_payload_indexes(self, collection_name: str) -> None:
+        """
+        Creates the payload indexes used by search filters (no-op if they exist).
+        Local mode has no payload indexes, filters are evaluated by scanning.
+        """
+        if self.is_local:
+            return
+
+        collection = await self.client.get_collection(collection_name)
+        existing = collection.payload_schema or {}
+
+        for field_name, schema in self.PAYLOAD_INDEXES.items():
+            if field_name in existing:
+                continue
+            logger.info(f"Creating payload index on '{field_name}' ({schema.value})...")
+            await self.client.create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=schema,
+                wait=True,
+            )
+
+    @staticmethod
+    def __build_filter(filters: Optional[Dict[str, Any]]) -> Optional[models.Filter]:
+        """
+        Converts normalized search filters into a Qdrant filter (all conditions must hold).
+
+        Parameters:
+            filters: {"price_min", "price_max", "sizes", "colors", "categories"},
+                as produced by normalize_search_filters.
+        """
+        if not filters:
+            return None
+
+        conditions = []
+        if filters.get("price_min") is not None or filters.get("price_max") is not None:
+            conditions.append(
+                models.FieldCondition(
+                    key="price",
+                    range=models.Range(gte=filters.get("price_min"), lte=filters.get("price_max")),
+                )
+            )
+        for key, field_name in (
+            ("sizes", "available_sizes"),
+            ("colors", "available_colors"),
+            ("categories", "categories"),
+        ):
+            if filters.get(key):
+                conditions.append(
+                    models.FieldCondition(key=field_name, match=models.MatchAny(any=filters[key]))
+                )
+
+        return models.Filter(must=conditions) if conditions else None
+
+    def __build_hybrid_prefetch(
+        self,
+        query_dense_vec: List[float],
+        query_sparse_vec: Dict[str, Any],
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[models.Prefetch]:
+        """
+        Dense + sparse prefetches of one hybrid query, fused with RRF by the caller.
+        Filters are applied inside both prefetches, so every candidate matches them.
+        """
+        prefetch_limit = top_k * 2
+        query_filter = self.__build_filter(filters)
+        return [
+            models.Prefetch(
+                query=query_dense_vec,
+                using=self.DENSE_VECTOR_NAME,
+                filter=query_filter,
+                params=self.__build_dense_search_params(),
+                limit=prefetch_limit,
+            ),
+            models.Prefetch(
+                query=models.SparseVector(
+                    indices=query_sparse_vec["indices"],
+                    values=query_sparse_vec["values"],
+                ),
+                using=self.SPARSE_VECTOR_NAME,
+                filter=query_filter,
+                limit=prefetch_limit,
+            ),
+        ]
+
+    async def search_hybrid(
         self,
         query_dense_vec: List[float],
         query_sparse_vec: Dict[str, Any],
         top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
     ):
         """
         Execute a Hybrid Search using Reciprocal Rank Fusion (RRF).
@@ -155,9 +638,11 @@ class QdrantService:
             query_sparse_vec: Sparse embedding represented as a dict with
                 'indices' and 'values'.
             top_k: Number of results to return.
+            filters: Optional structured filters (price range, sizes, colors,
+                categories) applied inside both prefetches.
 
         Returns:
-            List of matching points with payloads.
+            List of matching points with (projected) payloads.
 
         Raises:
             Exception: If hybrid search fails.
@@ -165,32 +650,144 @@ class QdrantService:
         logger.debug(f"Starting Hybrid Search. top_k={top_k}")
 
         try:
-            prefetch_limit = top_k * 2
-
-            results = self.client.query_points(
+            query = self.client.query_points(
                 collection_name=self.collection_name,
-                prefetch=[
-                    models.Prefetch(
-                        query=query_dense_vec,
-                        using=self.DENSE_VECTOR_NAME,
-                        limit=prefetch_limit,
-                    ),
-                    models.Prefetch(
-                        query=models.SparseVector(
-                            indices=query_sparse_vec["indices"],
-                            values=query_sparse_vec["values"],
-                        ),
-                        using=self.SPARSE_VECTOR_NAME,
-                        limit=prefetch_limit,
-                    ),
-                ],
+                prefetch=self.__build_hybrid_prefetch(query_dense_vec, query_sparse_vec, top_k, filters),
                 query=models.FusionQuery(fusion=models.Fusion.RRF),
                 limit=top_k,
-                with_payload=True,
+                with_payload=self.with_payload,
+                timeout=max(1, int(self.search_timeout)),
             )
+            # Client-side deadline as well, so a stalled connection cannot hold the request
+            results = await asyncio.wait_for(query, timeout=self.search_timeout)
 
             logger.debug(f"Hybrid search returned {len(results.points)} results.")
             return results.points
 
         except Exception as e:
-            logger.error(f"Error during Hybrid Search: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Error during Hybrid Search: {e}", exc_info=True)
+
+    async def search_dense(
+        self, query_dense_vec: List[float], top_k: int = 5, exact: bool = False
+    ) -> List[Any]:
+        """
+        Dense-only nearest neighbour search, with the configured quantization params.
+
+        Parameters:
+            query_dense_vec: Dense embedding vector for the query.
+            top_k: Number of results to return.
+            exact: Full scan over the original vectors (no HNSW, no quantization).
+                Used as ground truth when measuring recall.
+
+        Returns:
+            List of matching points (IDs and scores only).
+        """
+        search_params = (
+            models.SearchParams(exact=True, quantization=models.QuantizationSearchParams(ignore=True))
+            if exact
+            else self.__build_dense_search_params()
+        )
+        results = await asyncio.wait_for(
+            self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_dense_vec,
+                using=self.DENSE_VECTOR_NAME,
+                search_params=search_params,
+                limit=top_k,
+                with_payload=False,
+                timeout=max(1, int(self.search_timeout)),
+            ),
+            timeout=self.search_timeout,
+        )
+        return results.points
+
+    async def search_hybrid_batch(
+        self,
+        query_dense_vecs: List[List[float]],
+        query_sparse_vecs: List[Dict[str, Any]],
+        top_k: int = 5,
+        filters_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> Optional[List[List[Any]]]:
+        """
+        Execute several Hybrid Searches (RRF) in a single batch request.
+
+        Every query keeps its own dense and sparse prefetches; Qdrant runs them
+        all and answers in one round trip.
+
+        Parameters:
+            query_dense_vecs: Dense embedding vector of each query.
+            query_sparse_vecs: Sparse embedding of each query, as a dict with
+                'indices' and 'values'.
+            top_k: Number of results to return per query.
+            filters_list: Optional structured filters of each query (None entries
+                mean unfiltered).
+
+        Returns:
+            One list of matching points (with payloads) per query, in input
+            order, or None if the batch request fails.
+        """
+        if not query_dense_vecs:
+            return []
+
+        logger.debug(f"Starting batched Hybrid Search for {len(query_dense_vecs)} queries. top_k={top_k}")
+
+        filters_list = filters_list or [None] * len(query_dense_vecs)
+
+        try:
+            requests = [
+                models.QueryRequest(
+                    prefetch=self.__build_hybrid_prefetch(dense_vec, sparse_vec, top_k, filters),
+                    query=models.FusionQuery(fusion=models.Fusion.RRF),
+                    limit=top_k,
+                    with_payload=self.with_payload,
+                )
+                for dense_vec, sparse_vec, filters in zip(query_dense_vecs, query_sparse_vecs, filters_list)
+            ]
+
+            batch = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests,
+                timeout=max(1, int(self.search_timeout)),
+            )
+            responses = await asyncio.wait_for(batch, timeout=self.search_timeout)
+
+            logger.debug(f"Batched hybrid search returned {sum(len(r.points) for r in responses)} results.")
+            return [response.points for response in responses]
+
+        except Exception as e:
+            logger.error(f"Error during batched Hybrid Search: {e}", exc_info=True)
+            return None
+
+    async def retrieve_payloads(
+        self, ids: List[int], fields: Optional[List[str]] = None
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Fetches the payloads of specific points.
+
+        Parameters:
+            ids: Product IDs.
+            fields: Payload fields to return. None returns the full payload.
+
+        Returns:
+            Mapping of point ID -> payload. Missing points are left out; an empty
+            mapping is returned on error.
+        """
+        if not ids:
+            return {}
+
+        try:
+            points = await asyncio.wait_for(
+                self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=ids,
+                    with_payload=models.PayloadSelectorInclude(include=fields) if fields else True,
+                    with_vectors=False,
+                    timeout=max(1, int(self.search_timeout)),
+                ),
+                timeout=self.search_timeout,
+            )
+            return {point.id: point.payload or {} for point in points}
+
+        except Exception as e:
+            logger.error(f"Error retrieving payloads for {len(ids)} points: {e}", exc_info=True)
+            return {}
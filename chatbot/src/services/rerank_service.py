@@ -1,22 +1,35 @@
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
 from flashrank import RerankRequest, Ranker
 
+from src.core.executor import InferencePool
+
 logger = logging.getLogger(__name__)
 
 
 class RerankService:
-    def __init__(self, model_name: str) -> None:
+    def __init__(
+        self, model_name: str, inference_pool: Optional[InferencePool] = None
+    ) -> None:
         """
         Initialize the RerankService with a FlashRank model.
 
         Parameters:
             model_name: Name of the FlashRank model to load.
+            inference_pool: Pool used by the async wrappers, as in EmbeddingService.
 
         Raises:
             Exception: If the model cannot be loaded.
         """
+        self._inference_pool = inference_pool
+        self.ranker = None
+
+        if inference_pool is not None and inference_pool.kind == "process":
+            logger.info("Rerank model is loaded by the process pool workers.")
+            return
+
         logger.info(f"Initializing RerankService. Loading model '{model_name}'...")
         try:
             self.ranker = Ranker(model_name=model_name)
@@ -26,6 +39,12 @@ class RerankService:
                 f"Failed to load Rerank model '{model_name}': {e}", exc_info=True
             )
 
+    @property
+    def inference_pool(self) -> InferencePool:
+        if self._inference_pool is None:
+            self._inference_pool = InferencePool(name="rerank")
+        return self._inference_pool
+
     def rerank_matched_products(
         self, semantic_query: str, matched_products: List[Any], top_k: int = 5
     ) -> List[Dict[str, Any]]:
@@ -60,15 +79,7 @@ class RerankService:
 
             # Convert Qdrant payloads to FlashRank passage format
             for product in matched_products:
-                payload = product.payload or {}
-
-                passages.append(
-                    {
-                        "id": str(payload.get("product_id")),
-                        "text": payload.get("text_content", ""),
-                        "meta": payload,
-                    }
-                )
+                passages.append(self.__build_passage(product))
 
             logger.debug(
                 f"Prepared {len(passages)} passages. Sending to FlashRank reranker..."
@@ -91,3 +102,207 @@ class RerankService:
                 "Trigger fallback mechanism. Returning original matched products unmodified."
             )
             return matched_products
+
+    def __build_passage(self, product: Any) -> Dict[str, Any]:
+        """
+        Converts a Qdrant point into a FlashRank passage.
+
+        The compact summary is scored when present (projected payloads carry no
+        text_content); shorter passages also make the cross-encoder cheaper.
+        """
+        payload = product.payload or {}
+        return {
+            "id": str(payload.get("product_id")),
+            "text": payload.get("summary") or payload.get("text_content", ""),
+            "meta": payload,
+        }
+
+    def __score_pairs(self, pairs: List[List[str]]) -> np.ndarray:
+        """
+        Scores (query, passage text) pairs with one ONNX session run.
+
+        Mirrors the pairwise branch of flashrank's Ranker.rerank, but accepts
+        pairs from several queries at once.
+        """
+        encoded = self.ranker.tokenizer.encode_batch(pairs)
+        input_ids = np.array([e.ids for e in encoded])
+        token_type_ids = np.array([e.type_ids for e in encoded])
+        attention_mask = np.array([e.attention_mask for e in encoded])
+
+        onnx_input = {
+            "input_ids": input_ids.astype(np.int64),
+            "attention_mask": attention_mask.astype(np.int64),
+        }
+        if not np.all(token_type_ids == 0):
+            onnx_input["token_type_ids"] = token_type_ids.astype(np.int64)
+
+        logits = self.ranker.session.run(None, onnx_input)[0]
+
+        if logits.shape[1] == 1:
+            return 1 / (1 + np.exp(-logits.flatten()))
+
+        exp_logits = np.exp(logits)
+        return exp_logits[:, 1] / np.sum(exp_logits, axis=1)
+
+    def score_candidates(
+        self, semantic_queries: List[str], candidate_texts: List[List[str]]
+    ) -> List[List[float]]:
+        """
+        Relevance score of every candidate text of every query.
+
+        This is the part that runs where the model lives (on the inference
+        pool), so only strings go in and floats come out. Pointwise models
+        score all (query, text) pairs in one ONNX session run. Listwise (LLM
+        based) FlashRank models cannot batch pairs: they rank per query, and
+        candidates are scored by their rank.
+
+        Parameters:
+            semantic_queries: The sub-queries.
+            candidate_texts: Passage texts to score, one list per sub-query.
+
+        Returns:
+            Scores aligned with candidate_texts (higher is more relevant).
+        """
+        if getattr(self.ranker, "llm_model", None) is not None:
+            scores: List[List[float]] = []
+            for query, texts in zip(semantic_queries, candidate_texts):
+                ranked = self.ranker.rerank(
+                    RerankRequest(query=query, passages=[{"id": i, "text": t} for i, t in enumerate(texts)])
+                ) if texts else []
+                by_index = [0.0] * len(texts)
+                for rank, passage in enumerate(ranked):
+                    by_index[int(passage["id"])] = float(len(ranked) - rank)
+                scores.append(by_index)
+            return scores
+
+        pairs = [[query, text] for query, texts in zip(semantic_queries, candidate_texts) for text in texts]
+        flat_scores = self.__score_pairs(pairs).tolist()
+
+        scores, offset = [], 0
+        for texts in candidate_texts:
+            scores.append([float(score) for score in flat_scores[offset : offset + len(texts)]])
+            offset += len(texts)
+        return scores
+
+    def __prepare_batch(
+        self, matched_products_list: List[List[Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[List[str]]]:
+        """
+        Builds one passage per unique product, even when several sub-queries
+        retrieved the same product, and the candidate product IDs of each sub-query.
+        """
+        passages: Dict[str, Dict[str, Any]] = {}
+        candidate_ids: List[List[str]] = []
+
+        for matched_products in matched_products_list:
+            ids: List[str] = []
+            for product in matched_products or []:
+                passage = self.__build_passage(product)
+                passages.setdefault(passage["id"], passage)
+                if passage["id"] not in ids:
+                    ids.append(passage["id"])
+            candidate_ids.append(ids)
+
+        return passages, candidate_ids
+
+    @staticmethod
+    def __assemble(
+        passages: Dict[str, Dict[str, Any]],
+        candidate_ids: List[List[str]],
+        scores: Optional[List[List[float]]],
+        top_k: int,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Sorts each sub-query's passages by score and keeps the top_k. Without
+        scores (reranking failed) passages are kept in retrieval order.
+        """
+        if scores is None:
+            return [[passages[p_id] for p_id in ids[:top_k]] for ids in candidate_ids]
+
+        results: List[List[Dict[str, Any]]] = []
+        for ids, query_scores in zip(candidate_ids, scores):
+            ranked = [
+                {**passages[p_id], "score": score} for p_id, score in zip(ids, query_scores)
+            ]
+            ranked.sort(key=lambda x: x["score"], reverse=True)
+            results.append(ranked[:top_k])
+        return results
+
+    def rerank_batch(
+        self,
+        semantic_queries: List[str],
+        matched_products_list: List[List[Any]],
+        top_k: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Rerank the candidates of several sub-queries in a single inference call.
+
+        Passages are built once per unique product and every (sub-query,
+        candidate) pair is scored together (see score_candidates).
+
+        Parameters:
+            semantic_queries: The sub-queries used to rerank product passages.
+            matched_products_list: Qdrant points retrieved for each sub-query,
+                aligned with semantic_queries.
+            top_k: Number of ranked results to return per sub-query.
+
+        Returns:
+            One list of ranked passages (FlashRank result format) per sub-query.
+            If reranking fails, passages are returned in retrieval order.
+        """
+        passages, candidate_ids = self.__prepare_batch(matched_products_list)
+        if not any(candidate_ids):
+            return [[] for _ in semantic_queries]
+
+        try:
+            scores = self.score_candidates(
+                semantic_queries, [[passages[p_id]["text"] for p_id in ids] for ids in candidate_ids]
+            )
+        except Exception as e:
+            logger.error(f"Error during batched reranking: {e}", exc_info=True)
+            logger.warning("Trigger fallback mechanism. Returning passages in retrieval order.")
+            scores = None
+
+        return self.__assemble(passages, candidate_ids, scores, top_k)
+
+    async def rerank_matched_products_async(
+        self, semantic_query: str, matched_products: List[Any], top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of rerank_matched_products, scored on the inference pool
+        like rerank_batch_async.
+        """
+        return (await self.rerank_batch_async([semantic_query], [matched_products], top_k))[0]
+
+    async def rerank_batch_async(
+        self,
+        semantic_queries: List[str],
+        matched_products_list: List[List[Any]],
+        top_k: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Async variant of rerank_batch. Passages are built here, only their texts
+        are sent to the inference pool and only the scores come back, so Qdrant
+        points and payloads never cross a process boundary.
+        """
+        passages, candidate_ids = self.__prepare_batch(matched_products_list)
+        pair_count = sum(len(ids) for ids in candidate_ids)
+        logger.debug(
+            f"Starting batched rerank: {len(semantic_queries)} queries, "
+            f"{len(passages)} unique products, {pair_count} pairs."
+        )
+        if pair_count == 0:
+            return [[] for _ in semantic_queries]
+
+        try:
+            scores = await self.inference_pool.run(
+                self.score_candidates,
+                semantic_queries,
+                [[passages[p_id]["text"] for p_id in ids] for ids in candidate_ids],
+            )
+        except Exception as e:
+            logger.error(f"Error during batched reranking: {e}", exc_info=True)
+            logger.warning("Trigger fallback mechanism. Returning passages in retrieval order.")
+            scores = None
+
+        return self.__assemble(passages, candidate_ids, scores, top_k)
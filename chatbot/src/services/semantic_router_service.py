@@ -1,18 +1,32 @@
 import logging
 import json
 import os
+from typing import Optional
 
 from semantic_router.route import Route
 from semantic_router.encoders import HuggingFaceEncoder
 from semantic_router.routers import SemanticRouter
 
+from src.core.executor import InferencePool
+
 logger = logging.getLogger(__name__)
 logging.getLogger("semantic_router").setLevel(logging.ERROR)
 
 class SemanticRouterService():
-    def __init__(self):
+    def __init__(self, inference_pool: Optional[InferencePool] = None):
+        """
+        Builds the router. The default single-thread pool is created on first
+        use; with a "process" pool the router is only built by its workers.
+        """
+        self._inference_pool = inference_pool
+        self.router = None
+
+        if inference_pool is not None and inference_pool.kind == "process":
+            logger.info("Semantic router is built by the process pool workers.")
+            return
+
         logger.info("Initializing Semantic router service...")
-        
+
         self.encoder = HuggingFaceEncoder(name="sentence-transformers/all-MiniLM-L6-v2")
         
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -41,6 +55,12 @@ class SemanticRouterService():
 
         logger.info("Initialized Semantic router successfully.")
     
+    @property
+    def inference_pool(self) -> InferencePool:
+        if self._inference_pool is None:
+            self._inference_pool = InferencePool(name="router")
+        return self._inference_pool
+
     def guide(self, query: str) -> str:
         try:
             route_choice = self.router(query)
@@ -51,4 +71,10 @@ class SemanticRouterService():
                 return None
         except Exception as e:
             logger.error(f"Failed to guide route for \"{query}\": {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def guide_async(self, query: str) -> str:
+        """
+        Async wrapper of guide that runs the router encoder on the inference pool.
+        """
+        return await self.inference_pool.run(self.guide, query)
@@ -1,9 +1,19 @@
+import asyncio
 import logging
-from typing import List, Tuple, Dict, Any
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Tuple, Dict, Any, Optional
+
+from filelock import AsyncFileLock
 
 from src.core.database import PSQLService
+from src.services.cache_service import CacheService
 from src.services.embedding_service import EmbeddingService
 from src.services.qdrant_service import QdrantService
+from src.utils.product_card import build_product_card, build_product_summary
+from src.utils.search_filters import normalize_size, to_keyword_list
+from src.utils.sync_state import SyncStateStore
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +22,24 @@ class SyncService:
     """
     Service responsible for synchronizing product data from PostgreSQL
     to Qdrant vector database.
+
+    Every sync or delete also invalidates the cached answers that show the
+    affected products, so stale prices are never served from the cache.
+
+    Full syncs run as a staged pipeline: row batches are read, embedded and
+    uploaded by separate workers connected through bounded queues, so the
+    database, the embedding pool and Qdrant are kept busy at the same time.
+
+    In blue/green mode a full sync loads a fresh versioned collection and
+    atomically swaps the collection alias onto it once it is indexed, so
+    searches never see a half-written catalog.
+
+    With a state store, incremental syncs re-embed only the products that
+    changed since the last run (by "updatedAt" watermark and by a fingerprint
+    of their categories and variants) and delete deactivated ones. Full and
+    incremental syncs, and the product updates and deletes they would
+    race with, never run at the same time; with a lock file this also holds
+    across the worker processes of a host.
     """
 
     def __init__(
@@ -19,6 +47,15 @@ class SyncService:
         psql_service: PSQLService,
         embedding_service: EmbeddingService,
         qdrant_service: QdrantService,
+        cache_service: Optional[CacheService] = None,
+        blue_green: bool = False,
+        keep_versions: int = 2,
+        embed_concurrency: int = 2,
+        upload_concurrency: int = 4,
+        queue_size: int = 4,
+        state_store: Optional[SyncStateStore] = None,
+        watermark_overlap_seconds: float = 60,
+        lock_path: Optional[str] = None,
     ) -> None:
         """
         Initialize the synchronization service.
@@ -27,14 +64,56 @@ class SyncService:
             psql_service (PSQLService): Async PostgreSQL data access layer.
             embedding_service (EmbeddingService): Service for generating vectors.
             qdrant_service (QdrantService): Service for Qdrant operations.
+            cache_service (CacheService, optional): Response cache to invalidate
+                after products change.
+            blue_green (bool): Run full syncs as a reindex into a new collection
+                followed by an alias swap. Defaults to False (in-place upserts).
+            keep_versions (int): Collection versions kept after a swap, the live
+                one included, for rollback. Defaults to 2.
+            embed_concurrency (int): Batches embedded at the same time during a
+                full sync. Defaults to 2.
+            upload_concurrency (int): Batches uploaded to Qdrant at the same time
+                during a full sync. Defaults to 4.
+            queue_size (int): Batches buffered between two pipeline stages.
+                Bounds memory and applies backpressure. Defaults to 4.
+            state_store (SyncStateStore, optional): Where the last synced
+                watermark and fingerprints are kept. Required for incremental syncs.
+            watermark_overlap_seconds (float): Products updated up to this long
+                before the watermark are synced again, to catch transactions
+                that committed after a later one was already seen. Defaults to 60.
+            lock_path (str, optional): Lock file shared by the worker processes,
+                so only one of them syncs at a time (and writes the state file).
+                Defaults to None (in-process lock only).
         """
         self.psql_service = psql_service
         self.embedding_service = embedding_service
         self.qdrant_service = qdrant_service
+        self.cache_service = cache_service
+        self.blue_green = blue_green
+        self.keep_versions = keep_versions
+        self.embed_concurrency = max(1, embed_concurrency)
+        self.upload_concurrency = max(1, upload_concurrency)
+        self.queue_size = max(1, queue_size)
+        self.state_store = state_store
+        self.watermark_overlap = timedelta(seconds=watermark_overlap_seconds)
+        self.__lock = asyncio.Lock()
+        self.__file_lock = AsyncFileLock(lock_path) if lock_path else None
 
         logger.info("SyncService initialized.")
 
-    def __process_batch(
+    @asynccontextmanager
+    async def __exclusive(self) -> AsyncIterator[None]:
+        """
+        Holds the in-process sync lock and, if configured, the cross-process lock file.
+        """
+        async with self.__lock:
+            if self.__file_lock is None:
+                yield
+            else:
+                async with self.__file_lock:
+                    yield
+
+    async def __process_batch(
         self, batch_rows: List[Dict[str, Any]]
     ) -> Tuple[List[int], List[List[float]], List[Any], List[Dict[str, Any]]]:
         """
@@ -91,27 +170,35 @@ class SyncService:
                 texts.append(semantic_text)
 
                 # 3. Build Payload for Retrieval
-                # Keys here must match what Pipeline.__extract_product_metadata expects
-                payloads.append(
-                    {
-                        "product_id": product_id,
-                        "product_name": product_name,
-                        "slug": slug,
-                        "categories": categories,
-                        "price": float(price) if price else 0.0,
-                        "original_price": float(original_price) if original_price else 0.0,
-                        "image_url": image_url,
-                        "rating": float(rating),
-                        "review_count": int(review_count),
-                        "product_description": desc,
-                        "available_sizes": sizes_str, # Keep as string for display or split if needed
-                        "available_colors": colors_str,
-                        "text_content": semantic_text,
-                    }
-                )
+                # Keys here must match what Pipeline.__build_context expects
+                payload = {
+                    "product_id": product_id,
+                    "product_name": product_name,
+                    "slug": slug,
+                    "categories": categories,
+                    "price": float(price) if price else 0.0,
+                    "original_price": float(original_price) if original_price else 0.0,
+                    "image_url": image_url,
+                    "rating": float(rating),
+                    "review_count": int(review_count),
+                    "product_description": desc,
+                    "available_sizes": sizes_str,
+                    "available_colors": colors_str,
+                    "text_content": semantic_text,
+                }
+
+                # Frontend card and compact LLM context, computed once here instead of on every chat request
+                payload["card"] = build_product_card(payload)
+                payload["summary"] = build_product_summary(payload)
+
+                # Filterable attributes as normalized keyword arrays (matched by the Qdrant payload indexes)
+                payload["categories"] = to_keyword_list(categories)
+                payload["available_sizes"] = to_keyword_list(sizes_str, normalize_size)
+                payload["available_colors"] = to_keyword_list(colors_str)
+                payloads.append(payload)
 
             # 4. Generate Embeddings
-            dense_vecs, sparse_vecs = self.embedding_service.get_embeddings(texts)
+            dense_vecs, sparse_vecs = await self.embedding_service.get_embeddings_async(texts)
 
             return ids, dense_vecs, sparse_vecs, payloads
 
@@ -119,52 +206,378 @@ class SyncService:
             logger.error(f"Error processing batch: {e}", exc_info=True)
             raise
 
-    async def sync_all(self, batch: int = 128) -> None:
+    async def __invalidate_cache(self, product_ids: List[Any]) -> None:
+        """
+        Drops cached answers that show any of the given products.
+        A cache failure must not fail the sync itself.
+        """
+        if self.cache_service is None or not product_ids:
+            return
+
+        try:
+            await self.cache_service.invalidate_products(product_ids)
+        except Exception as e:
+            logger.error(f"Cache invalidation failed for {len(product_ids)} products: {e}", exc_info=True)
+
+    async def __run_pipeline(
+        self, batch: int, collection_name: Optional[str] = None
+    ) -> Tuple[List[int], Dict[str, Any]]:
+        """
+        Streams the catalog through read -> embed -> upload stages.
+
+        Each stage has its own workers (1 reader, `embed_concurrency` embedders,
+        `upload_concurrency` uploaders) and hands batches to the next one through
+        a queue of `queue_size` batches, so a slow stage throttles the stages
+        before it instead of buffering the whole catalog. The first error in any
+        stage cancels the others and is re-raised.
+
+        In-place syncs wait for each upsert to be applied. Bulk loads into a
+        versioned collection do not wait; `finish_bulk_load` checks that every
+        point landed before the swap. Callers invalidate the cache once the
+        whole catalog is written (an in-place sync that fails does it here for
+        the batches it already wrote).
+
+        Args:
+            batch (int): Rows per batch.
+            collection_name (str, optional): Upload target. Defaults to the live collection.
+
+        Returns:
+            Tuple[List[int], Dict[str, Any]]: The synced product IDs and a throughput
+            report (products, batches, seconds, products_per_sec, busy seconds per stage).
+        """
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        upload_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        synced_ids: List[int] = []
+        busy = {"read": 0.0, "embed": 0.0, "upload": 0.0}
+        active_embedders = self.embed_concurrency
+        batches = 0
+
+        async def read() -> None:
+            nonlocal batches
+            start = time.perf_counter()
+            # Streamed from a server-side cursor, so the full catalog is never held in memory
+            async for batch_rows in self.psql_service.stream_all(batch_size=batch):
+                busy["read"] += time.perf_counter() - start
+                await embed_queue.put(batch_rows)
+                batches += 1
+                start = time.perf_counter()
+            for _ in range(self.embed_concurrency):
+                await embed_queue.put(None)
+
+        async def embed() -> None:
+            nonlocal active_embedders
+            while (batch_rows := await embed_queue.get()) is not None:
+                start = time.perf_counter()
+                processed = await self.__process_batch(batch_rows)
+                busy["embed"] += time.perf_counter() - start
+                await upload_queue.put(processed)
+
+            # The last embedder to finish closes the upload stage
+            active_embedders -= 1
+            if active_embedders == 0:
+                for _ in range(self.upload_concurrency):
+                    await upload_queue.put(None)
+
+        async def upload() -> None:
+            while (processed := await upload_queue.get()) is not None:
+                ids, dense_vecs, sparse_vecs, payloads = processed
+                start = time.perf_counter()
+                await self.qdrant_service.upsert_products(
+                    ids, dense_vecs, sparse_vecs, payloads,
+                    collection_name=collection_name,
+                    wait=collection_name is None,
+                )
+                busy["upload"] += time.perf_counter() - start
+                synced_ids.extend(ids)
+
+        started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(read()),
+            *(asyncio.create_task(embed()) for _ in range(self.embed_concurrency)),
+            *(asyncio.create_task(upload()) for _ in range(self.upload_concurrency)),
+        ]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            if task.exception() is not None:
+                if collection_name is None:
+                    # Batches already written in place must not leave stale answers behind
+                    await self.__invalidate_cache(synced_ids)
+                raise task.exception()
+
+        elapsed = time.perf_counter() - started
+        report = {
+            "products": len(synced_ids),
+            "batches": batches,
+            "seconds": round(elapsed, 3),
+            "products_per_sec": round(len(synced_ids) / elapsed, 1) if elapsed > 0 else 0.0,
+            "busy_seconds": {stage: round(seconds, 3) for stage, seconds in busy.items()},
+        }
+        logger.info(
+            f"Synced {report['products']} products in {report['seconds']}s "
+            f"({report['products_per_sec']} products/sec, busy: {report['busy_seconds']})"
+        )
+        return synced_ids, report
+
+    async def sync_all(self, batch: int = 128, migrate_alias: bool = False) -> Dict[str, Any]:
         """
         Asynchronously synchronizes all active products from PostgreSQL to Qdrant.
 
         Args:
             batch (int): Batch size for processing.
+            migrate_alias (bool): Run a blue/green reindex even if it is disabled,
+                and replace a plain live collection (deployments from before
+                blue/green syncs) by an alias to the new one. This one-off
+                migration briefly leaves the collection name unresolved.
+                Defaults to False.
+
+        Returns:
+            Dict[str, Any]: Throughput report of the sync (empty if nothing was synced).
         """
-        logger.info("Starting full sync (PostgreSQL -> Qdrant).")
+        async with self.__exclusive():
+            return await self.__sync_all(batch, migrate_alias=migrate_alias)
+
+    async def __snapshot(
+        self,
+    ) -> Optional[Tuple[Optional[datetime], Dict[int, str], Dict[int, datetime]]]:
+        """
+        Watermark, fingerprints and recent versions of the active catalog, taken before a full
+        sync so changes made while it runs are picked up by the next incremental one.
+        """
+        if self.state_store is None:
+            return None
 
         try:
-            rows = await self.psql_service.fetch_all()
+            rows = await self.psql_service.fetch_fingerprints()
+        except Exception as e:
+            logger.error(f"Could not snapshot the catalog, sync state will not be updated: {e}")
+            return None
 
-            total_rows = len(rows)
-            logger.info(f"Fetched {total_rows} rows from database.")
+        watermark = max((row["updated_at"] for row in rows), default=None)
+        fingerprints = {row["product_id"]: row["fingerprint"] for row in rows if row["is_active"]}
+        return watermark, fingerprints, self.__recent(rows, watermark)
 
-            if total_rows == 0:
-                logger.warning("No products found. Full sync aborted.")
-                return
+    def __recent(self, rows: List[Dict[str, Any]], watermark: Optional[datetime]) -> Dict[int, datetime]:
+        """
+        "updatedAt" of the active products inside the overlap window of `watermark`.
+        """
+        if watermark is None:
+            return {}
+        since = watermark - self.watermark_overlap
+        return {
+            row["product_id"]: row["updated_at"]
+            for row in rows
+            if row["is_active"] and row["updated_at"] > since
+        }
+
+    async def __sync_all(self, batch: int, migrate_alias: bool = False) -> Dict[str, Any]:
+        """
+        Full sync (in place or blue/green), recording the sync state on success.
+        """
+        snapshot = await self.__snapshot()
 
-            # Process in batches
-            for i in range(0, total_rows, batch):
-                batch_rows = rows[i : i + batch]
-                ids, dense_vecs, sparse_vecs, payloads = self.__process_batch(
-                    batch_rows
-                )
-                self.qdrant_service.upsert_products(
-                    ids, dense_vecs, sparse_vecs, payloads
-                )
+        if self.blue_green or migrate_alias:
+            report = await self.__reindex_all(batch, migrate_alias=migrate_alias)
+        else:
+            report = await self.__sync_all_in_place(batch)
 
+        if report and snapshot is not None:
+            self.state_store.save(*snapshot)
+        return report
+
+    async def __sync_all_in_place(self, batch: int) -> Dict[str, Any]:
+        """
+        Full sync by upserting into the live collection.
+        """
+
+        logger.info("Starting full sync (PostgreSQL -> Qdrant).")
+
+        try:
+            synced_ids, report = await self.__run_pipeline(batch)
+
+            if not synced_ids:
+                logger.warning("No products found. Full sync aborted.")
+                return {}
+
+            # Once for the whole catalog, so cached answers are not flushed after every batch
+            await self.__invalidate_cache(synced_ids)
             logger.info("Full sync completed successfully.")
+            return report
 
         except Exception as e:
             logger.error(f"Full sync failed: {e}", exc_info=True)
             raise
 
+    async def __reindex_all(self, batch: int, migrate_alias: bool = False) -> Dict[str, Any]:
+        """
+        Blue/green full sync: loads every product into a new versioned collection
+        (HNSW indexing deferred), builds the index, then swaps the alias.
+
+        The live collection keeps serving untouched until the swap. On failure
+        or an empty catalog the new collection is dropped and the alias is left
+        as it was.
+
+        A live collection that is not an alias yet is only replaced when
+        `migrate_alias` is set; otherwise the sync runs in place.
+        """
+        plain = await self.qdrant_service.is_plain_collection()
+        if plain and not migrate_alias:
+            logger.warning(
+                f"'{self.qdrant_service.collection_name}' is a plain collection, syncing in place. "
+                f"Run the 'migrate_alias' sync action once to enable blue/green syncs."
+            )
+            return await self.__sync_all_in_place(batch)
+
+        logger.info("Starting blue/green full sync (PostgreSQL -> new Qdrant collection).")
+
+        target = await self.qdrant_service.create_versioned_collection()
+        try:
+            synced_ids, report = await self.__run_pipeline(batch, collection_name=target)
+
+            if not synced_ids:
+                logger.warning("No products found. Full sync aborted, live collection kept.")
+                await self.qdrant_service.drop_collection(target)
+                return {}
+
+            await self.qdrant_service.finish_bulk_load(target, expected_points=len(synced_ids))
+            if plain:
+                await self.qdrant_service.migrate_to_alias(target)
+            else:
+                await self.qdrant_service.swap_alias(target)
+
+        except Exception as e:
+            logger.error(f"Blue/green full sync failed, dropping '{target}': {e}", exc_info=True)
+            try:
+                await self.qdrant_service.drop_collection(target)
+            except Exception as drop_error:
+                logger.error(f"Could not drop '{target}': {drop_error}")
+            raise
+
+        await self.__invalidate_cache(synced_ids)
+
+        try:
+            await self.qdrant_service.gc_versions(keep=self.keep_versions)
+        except Exception as e:
+            logger.error(f"Garbage collection of old collection versions failed: {e}", exc_info=True)
+
+        logger.info(f"Blue/green full sync completed: {len(synced_ids)} products live in '{target}'.")
+        return report
+
+    async def sync_incremental(self, batch: int = 50) -> Dict[str, Any]:
+        """
+        Synchronizes only what changed since the last successful sync.
+
+        Every product's "updatedAt", active flag and fingerprint (hash of its
+        aggregated categories, sizes and colors) is read in one query and
+        compared with the saved state:
+
+            - active products updated after the watermark (minus the overlap),
+              new ones, and ones whose fingerprint changed are re-embedded;
+            - indexed products that were deactivated or deleted are removed.
+
+        Without a saved state a full sync runs instead and records one.
+
+        Args:
+            batch (int): Batch size for re-embedding.
+
+        Returns:
+            Dict[str, Any]: {"upserted", "deleted", "seconds"} (or the full sync report).
+
+        Raises:
+            ValueError: If the service has no state store.
+        """
+        if self.state_store is None:
+            raise ValueError("Incremental sync requires a state store")
+
+        async with self.__exclusive():
+            state = self.state_store.load()
+            if state is None:
+                logger.info("No sync state yet, running a full sync to record one.")
+                return await self.__sync_all(batch=128)
+
+            start = time.perf_counter()
+            rows = await self.psql_service.fetch_fingerprints()
+
+            watermark = state["watermark"]
+            since = watermark - self.watermark_overlap if watermark else None
+            indexed, recent = state["fingerprints"], state["recent"]
+
+            new_watermark = max((row["updated_at"] for row in rows), default=watermark)
+            if watermark is not None and new_watermark is not None:
+                new_watermark = max(new_watermark, watermark)
+
+            active: Dict[int, str] = {}
+            to_upsert: List[int] = []
+            for row in rows:
+                if not row["is_active"]:
+                    continue
+
+                product_id, updated_at = row["product_id"], row["updated_at"]
+                active[product_id] = row["fingerprint"]
+
+                # Inside the overlap window, skip versions that were already synced
+                changed = since is None or (updated_at > since and recent.get(product_id) != updated_at)
+                if changed or indexed.get(product_id) != row["fingerprint"]:
+                    to_upsert.append(product_id)
+
+            to_delete = [product_id for product_id in indexed if product_id not in active]
+
+            if to_upsert:
+                await self.__sync_specifics(to_upsert, batch=batch)
+            if to_delete:
+                await self.__delete_products(to_delete)
+
+            self.state_store.save(new_watermark, active, self.__recent(rows, new_watermark))
+
+            report = {
+                "upserted": len(to_upsert),
+                "deleted": len(to_delete),
+                "seconds": round(time.perf_counter() - start, 3),
+            }
+            logger.info(
+                f"Incremental sync: {report['upserted']} upserted, {report['deleted']} deleted "
+                f"in {report['seconds']}s (watermark {new_watermark})."
+            )
+            return report
+
+    async def run_incremental_schedule(self, interval_seconds: float) -> None:
+        """
+        Runs sync_incremental every `interval_seconds` until cancelled.
+        A failed run is logged and retried at the next tick.
+        """
+        logger.info(f"Incremental sync scheduled every {interval_seconds}s.")
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.sync_incremental()
+            except Exception as e:
+                logger.error(f"Scheduled incremental sync failed: {e}", exc_info=True)
+
     async def sync_specifics(self, product_ids: List[int], batch: int = 50) -> None:
         """
         Asynchronously synchronizes specific products based on IDs.
 
+        Waits for a running full sync to finish first: during a blue/green
+        reindex the writes would go to the collection about to be replaced.
+
         Args:
             product_ids (List[int]): List of product IDs to sync.
             batch (int): Batch size.
         """
+        async with self.__exclusive():
+            rows = await self.__sync_specifics(product_ids, batch=batch)
+            self.__record_push(synced_rows=rows)
+
+    async def __sync_specifics(self, product_ids: List[int], batch: int) -> List[Dict[str, Any]]:
+        """
+        sync_specifics without the lock, for callers already holding it.
+        Returns the rows that were upserted.
+        """
         if not product_ids:
             logger.warning("sync_specifics called with an empty list. Skipped.")
-            return
+            return []
 
         logger.info(f"Starting partial sync for {len(product_ids)} products...")
 
@@ -176,20 +589,85 @@ class SyncService:
 
             if total_rows == 0:
                 logger.warning(f"No matching records found for IDs: {product_ids}")
-                return
+                await self.__invalidate_cache(product_ids)
+                return []
 
             for i in range(0, total_rows, batch):
                 batch_rows = rows[i : i + batch]
-                ids, dense_vecs, sparse_vecs, payloads = self.__process_batch(
+                ids, dense_vecs, sparse_vecs, payloads = await self.__process_batch(
                     batch_rows
                 )
 
-                self.qdrant_service.upsert_products(
+                await self.qdrant_service.upsert_products(
                     ids, dense_vecs, sparse_vecs, payloads
                 )
 
+            await self.__invalidate_cache(product_ids)
             logger.info("Partial sync completed successfully.")
+            return rows
 
         except Exception as e:
             logger.error(f"Partial sync failed: {e}", exc_info=True)
-            raise
\ No newline at end of file
+            raise
+
+    async def delete_products(self, product_ids: List[int]) -> None:
+        """
+        Removes products from Qdrant and invalidates the cached answers showing them.
+
+        Like sync_specifics, waits for a running full sync to finish first.
+
+        Args:
+            product_ids (List[int]): List of product IDs to delete.
+        """
+        async with self.__exclusive():
+            await self.__delete_products(product_ids)
+            self.__record_push(deleted_ids=product_ids)
+
+    async def __delete_products(self, product_ids: List[int]) -> None:
+        """
+        delete_products without the lock, for callers already holding it.
+        """
+        if not product_ids:
+            logger.warning("delete_products called with an empty list. Skipped.")
+            return
+
+        await self.qdrant_service.delete_products(product_ids)
+        await self.__invalidate_cache(product_ids)
+
+    def __record_push(
+        self,
+        synced_rows: Optional[List[Dict[str, Any]]] = None,
+        deleted_ids: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Records pushed upserts and deletes in the sync state, so the next
+        incremental sync knows which products are indexed and removes a pushed
+        product once it is deactivated, even if that delete push is lost.
+
+        The watermark is left as is. Without a saved state there is nothing to
+        update: the next incremental sync runs a full sync. A state write
+        failure is logged only, the push itself succeeded.
+        """
+        if self.state_store is None or not (synced_rows or deleted_ids):
+            return
+
+        state = self.state_store.load()
+        if state is None:
+            return
+
+        watermark, fingerprints, recent = state["watermark"], state["fingerprints"], state["recent"]
+        since = watermark - self.watermark_overlap if watermark else None
+        for row in synced_rows or []:
+            product_id = int(row["product_id"])
+            fingerprints[product_id] = row["fingerprint"]
+            # Inside the overlap window, the next incremental sync would re-embed this version otherwise
+            if since is not None and row["updated_at"] > since:
+                recent[product_id] = row["updated_at"]
+        for product_id in deleted_ids or []:
+            fingerprints.pop(int(product_id), None)
+            recent.pop(int(product_id), None)
+
+        try:
+            self.state_store.save(watermark, fingerprints, recent)
+        except Exception as e:
+            logger.error(f"Could not record pushed products in the sync state: {e}", exc_info=True)
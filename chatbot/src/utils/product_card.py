@@ -0,0 +1,125 @@
+from typing import Any, Dict, List
+
+# Color name -> hex, kept in sync with the client's ProductCard color map
+COLOR_HEX = {
+    "white": "#FFFFFF",
+    "black": "#000000",
+    "red": "#EF4444",
+    "blue": "#3B82F6",
+    "light blue": "#60A5FA",
+    "dark blue": "#1E40AF",
+    "green": "#10B981",
+    "olive green": "#84CC16",
+    "yellow": "#F59E0B",
+    "pink": "#EC4899",
+    "pastel pink": "#FBCFE8",
+    "purple": "#A855F7",
+    "gray": "#6B7280",
+    "grey": "#6B7280",
+    "light gray": "#D1D5DB",
+    "light grey": "#D1D5DB",
+    "dark gray": "#374151",
+    "dark grey": "#374151",
+    "brown": "#92400E",
+    "navy": "#1E3A8A",
+    "navy blue": "#1E3A8A",
+    "beige": "#F5F5DC",
+    "orange": "#F97316",
+    "cream": "#FFFDD0",
+    "maroon": "#7C2D12",
+}
+
+# Neutral swatch for colors missing from the table (same as the client)
+DEFAULT_COLOR_HEX = "#9CA3AF"
+
+
+def color_to_hex(color_name: str) -> str:
+    """
+    Resolves a color name ("Navy Blue", " black ") to its hex code.
+    """
+    return COLOR_HEX.get(" ".join(color_name.lower().split()), DEFAULT_COLOR_HEX)
+
+
+def split_list(value: Any) -> List[str]:
+    """
+    Splits a comma-separated SQL aggregate ("S, M, L") into a clean list.
+    Lists (payload keyword arrays) are cleaned the same way.
+    """
+    if not value:
+        return []
+    items = value if isinstance(value, (list, tuple)) else str(value).split(",")
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def build_product_card(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds the frontend product card (ProductMetadata shape) from a product payload.
+
+    Target Interface:
+        id: string;
+        name: string;
+        price: number;
+        image: string;
+        rating: number;
+        reviewCount: number;
+        colors: { name: string; hex: string }[];
+        sizes: string[];
+
+    Args:
+        payload (Dict[str, Any]): Product fields as stored in Qdrant
+            (product_id, product_name, price, available_colors, ...).
+
+    Returns:
+        Dict[str, Any]: The card, ready to be returned to the Node.js backend.
+    """
+    return {
+        "id": str(payload.get("product_id")),
+        "name": payload.get("product_name"),
+        "price": float(payload.get("price") or 0),
+        "image": payload.get("image_url"),
+        "rating": float(payload.get("rating") or 0),
+        "reviewCount": int(payload.get("review_count") or 0),
+        "colors": [
+            {"name": name, "hex": color_to_hex(name)}
+            for name in split_list(payload.get("available_colors"))
+        ],
+        "sizes": split_list(payload.get("available_sizes")),
+    }
+
+
+# Characters of the description kept in the compact summary
+SUMMARY_DESCRIPTION_CHARS = 200
+
+
+def build_product_summary(payload: Dict[str, Any]) -> str:
+    """
+    Builds the compact one-line product summary used as LLM context.
+
+    Only the fields the answer needs are kept, and the description is clipped
+    (at a word boundary) to SUMMARY_DESCRIPTION_CHARS.
+
+    Args:
+        payload (Dict[str, Any]): Product fields as stored in Qdrant.
+
+    Returns:
+        str: e.g. "Name: Linen Shirt | Categories: Tops | Price: 25.0 (was 30.0) | ..."
+    """
+    description = " ".join(str(payload.get("product_description") or "").split())
+    if len(description) > SUMMARY_DESCRIPTION_CHARS:
+        description = description[:SUMMARY_DESCRIPTION_CHARS].rsplit(" ", 1)[0] + "..."
+
+    price = float(payload.get("price") or 0)
+    original_price = float(payload.get("original_price") or 0)
+    price_text = f"{price}" + (f" (was {original_price})" if original_price > price else "")
+
+    parts = [
+        f"Name: {payload.get('product_name', 'N/A')}",
+        f"Categories: {', '.join(split_list(payload.get('categories')))}",
+        f"Price: {price_text}",
+        f"Rating: {payload.get('rating', 0)} ({payload.get('review_count', 0)} reviews)",
+        f"Colors: {', '.join(split_list(payload.get('available_colors'))) or 'N/A'}",
+        f"Sizes: {', '.join(split_list(payload.get('available_sizes'))) or 'N/A'}",
+    ]
+    if description:
+        parts.append(f"Description: {description}")
+    return " | ".join(parts)
@@ -0,0 +1,9 @@
+import re
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a user query for exact-match caching: lowercase, single spaces,
+    no trailing punctuation.
+    """
+    return re.sub(r"\s+", " ", query.lower()).strip().rstrip("?!.").strip()
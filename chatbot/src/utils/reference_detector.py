@@ -0,0 +1,69 @@
+import re
+from typing import Optional
+
+from src.utils.query_normalizer import normalize_query
+
+# Pronouns that point back to something mentioned in an earlier turn
+_PRONOUNS = r"it|its|it's|them|they|their|theirs|those|these|this|one|ones"
+
+# Comparatives only make sense against a product from an earlier turn
+_COMPARATIVES = r"cheaper|pricier|bigger|smaller|larger|longer|shorter|darker|lighter"
+
+# Rules are checked in order; the first match gives the reason
+_REFERENCE_RULES = [
+    # "does it come in red", "show me those", "the blue one"
+    ("pronoun", re.compile(rf"\b({_PRONOUNS})\b")),
+    # "that one", "is that waterproof", "how much does that cost" (also "shoes that fit": a cheap false alarm)
+    ("demonstrative", re.compile(r"\bthat\b")),
+    # "the first", "the second one", "the last", "the cheaper", "the other"
+    ("ordinal", re.compile(
+        rf"\bthe\s+(first|second|third|fourth|fifth|last|previous|former|latter|other|same"
+        rf"|{_COMPARATIVES}|cheapest)\b"
+    )),
+    # "what about ...", "how about ...", "and in blue", "also", "instead"
+    ("ellipsis", re.compile(
+        r"(^(what about|how about|and|also|or|but|any other|only|just|in|with|without)\b"
+        r"|\b(instead|another|else|more like|similar|same)\b)"
+    )),
+    # "cheaper?", "show me something cheaper", "do you have a larger size"
+    ("comparative", re.compile(rf"\b({_COMPARATIVES})\b")),
+    # "show me more", "are there other colors", "any options", "what is the price"
+    ("follow_up", re.compile(
+        r"(\b(more|other|others|options|alternatives)\b"
+        r"|\bthe\s+(price|cost|size|sizes|color|colors|colour|colours|material|fit|reviews?)\b)"
+    )),
+]
+
+# Queries this short rarely carry enough information on their own ("size M?", "red")
+_MIN_SELF_CONTAINED_WORDS = 3
+
+
+def find_history_reference(query: str) -> Optional[str]:
+    """
+    Rule-based anaphora / ellipsis detector.
+
+    Decides locally whether a query can only be understood with the previous
+    turns (e.g. "does it come in red?", "what about the cheaper one", "in blue")
+    or is already self-contained (e.g. "show me linen shirts"). Misses are
+    costly (wrong retrieval), false alarms only cost a rewrite call, so the
+    rules lean towards reporting a reference.
+
+    Args:
+        query (str): The raw user query.
+
+    Returns:
+        Optional[str]: The name of the rule that matched ("pronoun", "ordinal",
+        "ellipsis", ...), or None when the query is self-contained.
+    """
+    text = normalize_query(query)
+    if not text:
+        return None
+
+    for reason, pattern in _REFERENCE_RULES:
+        if pattern.search(text):
+            return reason
+
+    if len(text.split()) < _MIN_SELF_CONTAINED_WORDS:
+        return "short_query"
+
+    return None
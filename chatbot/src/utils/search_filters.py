@@ -0,0 +1,99 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+# Keys of a normalized filter dict
+FILTER_KEYS = ("price_min", "price_max", "sizes", "colors", "categories")
+
+_PRICE_PATTERN = re.compile(r"^([0-9]+(?:\.[0-9]+)?)\s*(k|m)?$")
+_PRICE_MULTIPLIERS = {None: 1, "k": 1_000, "m": 1_000_000}
+
+
+def normalize_size(value: Any) -> str:
+    """
+    Canonical form of a size keyword ("m " -> "M", "xl" -> "XL").
+    """
+    return " ".join(str(value).upper().split())
+
+
+def normalize_keyword(value: Any) -> str:
+    """
+    Canonical form of a color / category keyword ("Navy  Blue" -> "navy blue").
+    """
+    return " ".join(str(value).lower().split())
+
+
+def to_keyword_list(values: Any, normalize=normalize_keyword) -> List[str]:
+    """
+    Normalizes a comma-separated string or a list into unique keywords, in order.
+    """
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = values.split(",")
+
+    keywords = []
+    for value in values:
+        keyword = normalize(value)
+        if keyword and keyword not in keywords:
+            keywords.append(keyword)
+    return keywords
+
+
+def parse_price(value: Any) -> Optional[float]:
+    """
+    Parses a price bound: numbers, numeric strings and shorthand like "500k" or "1.5m".
+    Returns None for anything else.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value >= 0 else None
+
+    match = _PRICE_PATTERN.match(str(value).lower().replace(",", "").strip())
+    if not match:
+        return None
+    return float(match.group(1)) * _PRICE_MULTIPLIERS[match.group(2)]
+
+
+def normalize_search_filters(raw_filters: Any) -> Optional[Dict[str, Any]]:
+    """
+    Validates the structured filters extracted by the LLM.
+
+    Keywords are normalized the same way as the payload keyword arrays
+    written by SyncService, so they can be matched exactly in Qdrant.
+
+    Args:
+        raw_filters (Any): The "filters" object of a sub-query, e.g.
+            {"price_max": "500k", "sizes": ["m"], "colors": ["Black"], "categories": []}
+
+    Returns:
+        Optional[Dict[str, Any]]: {"price_min", "price_max", "sizes", "colors",
+        "categories"}, or None when no usable constraint is present.
+    """
+    if not isinstance(raw_filters, dict):
+        return None
+
+    filters = {
+        "price_min": parse_price(raw_filters.get("price_min")),
+        "price_max": parse_price(raw_filters.get("price_max")),
+        "sizes": to_keyword_list(_as_list(raw_filters.get("sizes")), normalize_size),
+        "colors": to_keyword_list(_as_list(raw_filters.get("colors"))),
+        "categories": to_keyword_list(_as_list(raw_filters.get("categories"))),
+    }
+
+    # A swapped range is more likely a model slip than an impossible request
+    if filters["price_min"] is not None and filters["price_max"] is not None:
+        if filters["price_min"] > filters["price_max"]:
+            filters["price_min"], filters["price_max"] = filters["price_max"], filters["price_min"]
+
+    if not any(filters[key] not in (None, []) for key in FILTER_KEYS):
+        return None
+    return filters
+
+
+def _as_list(value: Any) -> Iterable[Any]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return value
+    return [value]
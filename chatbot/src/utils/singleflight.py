@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one in-flight computation.
+
+    The first caller for a key (the leader) starts the computation as its own
+    task; callers arriving while it runs await the same task and get the same
+    result (or exception). The task is shielded, so a leader whose request is
+    cancelled (e.g. client disconnect) does not cancel the work for the others.
+
+    Usage:
+        flight = SingleFlight()
+        result, coalesced = await flight.do(key, lambda: compute(...))
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.stats = {"leaders": 0, "coalesced": 0}
+
+    def __forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every waiter is gone
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Runs `fn()` unless a computation for `key` is already in flight.
+
+        Args:
+            key (Hashable): Identity of the computation.
+            fn (Callable): Zero-argument coroutine function doing the work.
+
+        Returns:
+            Tuple[Any, bool]: The result and whether this call was coalesced
+            onto another caller's computation. Shared results are the same
+            object for every caller, so treat them as read-only.
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            logger.info(f"Coalescing request onto in-flight computation for {key!r}")
+            return await asyncio.shield(task), True
+
+        self.stats["leaders"] += 1
+        task = asyncio.ensure_future(fn())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self.__forget(key, done))
+        return await asyncio.shield(task), False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Leader / coalesced counters plus the number of computations in flight.
+        """
+        return {**self.stats, "in_flight": len(self._in_flight)}
@@ -0,0 +1,81 @@
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SyncStateStore:
+    """
+    JSON file holding what the Qdrant index was last synced from:
+
+        {
+            "watermark": "2026-01-31T12:00:00.123000",  # max Product."updatedAt" seen
+            "fingerprints": {"42": "9e107d9d372bb6826bd81d3542a419d6", ...},
+            "recent": {"42": "2026-01-31T11:59:30.000000", ...}
+        }
+
+    `fingerprints` lists the indexed (active) products, `recent` the
+    "updatedAt" already synced for products close to the watermark, so the
+    overlap window does not re-embed them on every run. Writes go through a
+    temporary file and an atomic rename, so a crash never leaves a torn state.
+
+    Parameters:
+        path (str): Location of the state file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns {"watermark": datetime or None, "fingerprints": {product_id: str},
+        "recent": {product_id: datetime}}, or None when there is no (readable) state yet.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+
+            watermark = raw.get("watermark")
+            return {
+                "watermark": datetime.fromisoformat(watermark) if watermark else None,
+                "fingerprints": {int(pid): fp for pid, fp in raw.get("fingerprints", {}).items()},
+                "recent": {int(pid): datetime.fromisoformat(ts) for pid, ts in raw.get("recent", {}).items()},
+            }
+
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Unreadable sync state '{self.path}', ignoring it: {e}")
+            return None
+
+    def save(
+        self,
+        watermark: Optional[datetime],
+        fingerprints: Dict[int, str],
+        recent: Optional[Dict[int, datetime]] = None,
+    ) -> None:
+        """
+        Atomically replaces the state file.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        payload = {
+            "watermark": watermark.isoformat() if watermark else None,
+            "fingerprints": {str(pid): fp for pid, fp in fingerprints.items()},
+            "recent": {str(pid): ts.isoformat() for pid, ts in (recent or {}).items()},
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".sync_state.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+        logger.debug(f"Saved sync state ({len(fingerprints)} products, watermark {payload['watermark']}).")
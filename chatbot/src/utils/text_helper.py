@@ -9,6 +9,11 @@ Your task is to analyze the user's raw input and prepare it for a Hybrid Search
 3. **Format**: For EACH search query, generate:
    - `semantic_query`: A natural language sentence optimized for Dense Vector Search (e.g., "elegant red evening gown suitable for parties from brand Everlane").
    - `keywords`: A list of specific keywords, synonyms, and attributes for Sparse Search (e.g., ["red", "dress", "elegant" "gown", "parties", "Everlane"]).
+   - `filters`: Hard constraints the user EXPLICITLY stated for this item. Use null or [] for anything not stated:
+     - `price_min` / `price_max`: plain numbers in the store currency. Expand shorthand ("500k" -> 500000, "1.5m" -> 1500000). "under X" sets only `price_max`.
+     - `sizes`: e.g. ["M"], ["38"].
+     - `colors`: basic color names, e.g. ["black"].
+     - `categories`: only when the user names a category explicitly, e.g. ["dresses"].
 
 ### OUTPUT FORMAT:
 Return a JSON object with a single key "queries" containing a list of objects.
@@ -17,11 +22,13 @@ Example JSON structure:
   "queries": [
     {
       "semantic_query": "...",
-      "keywords": ["...", "..."]
+      "keywords": ["...", "..."],
+      "filters": {"price_min": null, "price_max": 500000, "sizes": ["M"], "colors": ["black"], "categories": []}
     },
     {
       "semantic_query": "...",
-      "keywords": ["...", "..."]
+      "keywords": ["...", "..."],
+      "filters": {"price_min": null, "price_max": null, "sizes": [], "colors": [], "categories": []}
     }
   ]
 }
@@ -157,57 +164,163 @@ Important constraints:
 
 """
 
+REFLECT_AND_DECOMPOSE_PROMPT = """
+You are a query rewriting assistant and an expert Search Query Analyzer for a Fashion E-commerce platform.
+You receive the recent chat history and the user's latest query. Do BOTH tasks below in one pass.
+
+### TASK 1: REWRITE
+Rewrite the latest query into a fully self-contained, context-complete query by incorporating ONLY the information from the chat history that is explicitly relevant to it.
+- Preserve the original intent of the latest query.
+- Do not introduce new assumptions, facts, or external knowledge.
+- If the latest query is already clear and independent of the history, keep it unchanged.
+
+### TASK 2: CLASSIFY
+Set `intent` to "PRODUCT_QUERY" if the rewritten query asks to find, compare or get information about products, otherwise "CHITCHAT".
+
+### TASK 3: DECOMPOSE (only for PRODUCT_QUERY, otherwise return an empty list)
+1. Determine if the rewritten query asks for a single product type or multiple distinct products (e.g., "red dress and black shoes").
+2. If multiple distinct products are requested, split them into separate search queries.
+3. For EACH search query, generate:
+   - `semantic_query`: A natural language sentence optimized for Dense Vector Search.
+   - `keywords`: A list of specific keywords, synonyms, and attributes for Sparse Search.
+   - `filters`: Hard constraints the user EXPLICITLY stated for this item (null or [] when not stated):
+     `price_min` / `price_max` as plain numbers ("500k" -> 500000), `sizes`, `colors` (basic color names) and `categories` (only when named explicitly).
+
+### OUTPUT FORMAT:
+Return ONLY a JSON object:
+{
+  "rewritten_query": "...",
+  "intent": "PRODUCT_QUERY",
+  "queries": [
+    {
+      "semantic_query": "...",
+      "keywords": ["...", "..."],
+      "filters": {"price_min": null, "price_max": null, "sizes": [], "colors": [], "categories": []}
+    }
+  ]
+}
+"""
+
+REFLECT_AND_DECOMPOSE_INPUT_TEMPLATE = """
+======================= CHAT HISTORY =======================
+{history}
+
+======================= LATEST USER QUERY =======================
+{new_query}
+"""
+
 # PSQL QUERIES
-PSQL_FETCH_ALL_QUERIES = """
+# Categories and variants are aggregated per product *before* joining them to
+# "Product". Joining both link tables directly would emit categories x variants
+# rows per product that STRING_AGG(DISTINCT ...) then has to collapse.
+PSQL_PRODUCT_AGGREGATES_CTE = """
+    WITH product_categories AS (
+        SELECT
+            cp."B" AS product_id,
+            STRING_AGG(DISTINCT c.name, ', ') AS categories
+        FROM "_CategoryToProduct" cp
+        JOIN "Category" c ON c.id = cp."A"
+        GROUP BY cp."B"
+    ),
+    product_variants AS (
+        SELECT
+            pv."productId" AS product_id,
+            STRING_AGG(DISTINCT pv.size, ', ') AS available_sizes,
+            STRING_AGG(DISTINCT pv.color, ', ') AS available_colors
+        FROM "ProductVariant" pv
+        GROUP BY pv."productId"
+    )
+"""
+
+PSQL_FETCH_ALL_QUERIES = PSQL_PRODUCT_AGGREGATES_CTE + """
     SELECT
         p.id AS product_id,
         p.name AS product_name,
         p.description AS product_description,
         p.slug,
-        
+
         p.price,
         p."originalPrice" AS original_price,
         p.thumbnail AS image_url,
         p.rating,
         p."reviewCount" AS review_count,
 
-        STRING_AGG(DISTINCT c.name, ', ') AS categories,
+        pc.categories,
 
-        STRING_AGG(DISTINCT pv.size, ', ') AS available_sizes,
-        STRING_AGG(DISTINCT pv.color, ', ') AS available_colors
+        pvs.available_sizes,
+        pvs.available_colors
 
     FROM "Product" p
-    LEFT JOIN "_CategoryToProduct" cp ON cp."B" = p.id
-    LEFT JOIN "Category" c ON c.id = cp."A"
-    LEFT JOIN "ProductVariant" pv ON pv."productId" = p.id
-    
+    LEFT JOIN product_categories pc ON pc.product_id = p.id
+    LEFT JOIN product_variants pvs ON pvs.product_id = p.id
+
     WHERE p."isActive" = TRUE
-    GROUP BY p.id
 """
 
+# Change detection for incremental syncs, over every product (active or not).
+# "Product" rows carry "updatedAt", but variants and category links have no
+# timestamp, so their aggregated values are hashed into a fingerprint instead.
+PSQL_FETCH_FINGERPRINTS_QUERIES = PSQL_PRODUCT_AGGREGATES_CTE + """
+    SELECT
+        p.id AS product_id,
+        p."isActive" AS is_active,
+        p."updatedAt" AS updated_at,
+        MD5(CONCAT(
+            COALESCE(pc.categories, ''), '|',
+            COALESCE(pvs.available_sizes, ''), '|',
+            COALESCE(pvs.available_colors, '')
+        )) AS fingerprint
+
+    FROM "Product" p
+    LEFT JOIN product_categories pc ON pc.product_id = p.id
+    LEFT JOIN product_variants pvs ON pvs.product_id = p.id
+"""
+
+# A handful of products: per-product LATERAL aggregates use the link table
+# indexes instead of aggregating whole tables. The IDs are bound as one array
+# parameter, so the statement text (and its prepared plan) never changes.
+# The change-detection columns match PSQL_FETCH_FINGERPRINTS_QUERIES, so pushed
+# products can be recorded in the incremental sync state.
 PSQL_FETCH_SPECIFICS_QUERIES = """
     SELECT
         p.id AS product_id,
         p.name AS product_name,
         p.description AS product_description,
         p.slug,
-        
+
         p.price,
         p."originalPrice" AS original_price,
         p.thumbnail AS image_url,
         p.rating,
         p."reviewCount" AS review_count,
 
-        STRING_AGG(DISTINCT c.name, ', ') AS categories,
+        pc.categories,
+
+        pvs.available_sizes,
+        pvs.available_colors,
 
-        STRING_AGG(DISTINCT pv.size, ', ') AS available_sizes,
-        STRING_AGG(DISTINCT pv.color, ', ') AS available_colors
+        p."isActive" AS is_active,
+        p."updatedAt" AS updated_at,
+        MD5(CONCAT(
+            COALESCE(pc.categories, ''), '|',
+            COALESCE(pvs.available_sizes, ''), '|',
+            COALESCE(pvs.available_colors, '')
+        )) AS fingerprint
 
     FROM "Product" p
-    LEFT JOIN "_CategoryToProduct" cp ON cp."B" = p.id
-    LEFT JOIN "Category" c ON c.id = cp."A"
-    LEFT JOIN "ProductVariant" pv ON pv."productId" = p.id
-    
-    WHERE p.id IN ({placeholder})
-    GROUP BY p.id
+    LEFT JOIN LATERAL (
+        SELECT STRING_AGG(DISTINCT c.name, ', ') AS categories
+        FROM "_CategoryToProduct" cp
+        JOIN "Category" c ON c.id = cp."A"
+        WHERE cp."B" = p.id
+    ) pc ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT
+            STRING_AGG(DISTINCT pv.size, ', ') AS available_sizes,
+            STRING_AGG(DISTINCT pv.color, ', ') AS available_colors
+        FROM "ProductVariant" pv
+        WHERE pv."productId" = p.id
+    ) pvs ON TRUE
+
+    WHERE p.id = ANY(CAST(:product_ids AS INTEGER[]))
 """
@@ -0,0 +1,68 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StageTimer:
+    """
+    Collects wall-clock durations (in milliseconds) of named pipeline stages.
+
+    A stage that runs several times in one request (e.g. once per sub-query)
+    accumulates its durations. Non-latency figures of the request (e.g. the
+    prompt token count) can be attached with `set_metric`.
+
+    Usage:
+        timer = StageTimer()
+        with timer.stage("embedding"):
+            ...
+        timer.timings  # {"embedding": 12.3}
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self.metrics: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Times the enclosed block and records it under `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name: str, duration_ms: float) -> None:
+        """
+        Records a duration measured elsewhere (e.g. across a stream).
+        """
+        self.timings[name] = round(self.timings.get(name, 0.0) + duration_ms, 3)
+
+    def set_metric(self, name: str, value: float) -> None:
+        """
+        Records a request-level figure that is not a duration.
+        """
+        self.metrics[name] = value
+
+    @property
+    def total_ms(self) -> float:
+        """
+        Milliseconds elapsed since the timer was created.
+        """
+        return round((time.perf_counter() - self.started_at) * 1000, 3)
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Serializable snapshot: {"timings": {...}, "metrics": {...}, "total_ms": float}.
+        """
+        return {"timings": dict(self.timings), "metrics": dict(self.metrics), "total_ms": self.total_ms}
+
+    def server_timing_header(self) -> str:
+        """
+        Formats the timings as a `Server-Timing` HTTP header value.
+        """
+        metrics = [f"{name};dur={duration:.1f}" for name, duration in self.timings.items()]
+        metrics.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(metrics)
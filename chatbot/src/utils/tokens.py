@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Generic BPE encoding used to estimate prompt sizes. Groq's models use their
+# own tokenizers, so counts are an estimate of the same order, not exact.
+TOKEN_ENCODING = "cl100k_base"
+
+# Fallback ratio when the encoding cannot be loaded (e.g. no network to fetch it)
+CHARS_PER_TOKEN = 4
+
+# Delay before a failed encoding load is tried again
+ENCODING_RETRY_SECONDS = 300
+
+_encoding: Optional[Any] = None
+_attempted = False
+_retry_at = 0.0
+_load_lock = threading.Lock()
+
+
+def load_encoding() -> Optional[Any]:
+    """
+    Loads the tiktoken encoding (blocking: it may be downloaded) and keeps it
+    for the life of the process. A failure is not kept: the load can be tried
+    again once ENCODING_RETRY_SECONDS have passed.
+
+    Returns:
+        Optional[Any]: The encoding, or None if it could not be loaded.
+    """
+    global _encoding, _attempted, _retry_at
+    with _load_lock:
+        if _encoding is not None:
+            return _encoding
+
+        _attempted = True
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding(TOKEN_ENCODING)
+            return _encoding
+        except Exception as e:
+            _retry_at = time.monotonic() + ENCODING_RETRY_SECONDS
+            logger.warning(
+                f"Could not load tiktoken encoding '{TOKEN_ENCODING}' ({e}). "
+                f"Estimating token counts, retrying in {ENCODING_RETRY_SECONDS}s."
+            )
+            return None
+
+
+def _get_encoding() -> Optional[Any]:
+    """
+    The loaded encoding, or None while it is unavailable.
+
+    Only the very first load runs inline (the app warms it up at startup, off
+    the event loop); retries after a failure run in a background thread, so
+    callers on the event loop never wait on a download.
+    """
+    global _retry_at
+    if _encoding is not None:
+        return _encoding
+    if not _attempted:
+        return load_encoding()
+
+    if time.monotonic() >= _retry_at and not _load_lock.locked():
+        _retry_at = time.monotonic() + ENCODING_RETRY_SECONDS
+        threading.Thread(target=load_encoding, name="tiktoken-load", daemon=True).start()
+    return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Number of tokens in `text` (estimated from its length if tiktoken is unavailable).
+    """
+    if not text:
+        return 0
+
+    encoding = _get_encoding()
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cuts `text` down to at most `max_tokens` tokens.
+    """
+    if max_tokens <= 0:
+        return ""
+
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
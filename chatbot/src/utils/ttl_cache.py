@@ -0,0 +1,79 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+
+class TTLCache:
+    """
+    Bounded in-process memo cache with LRU eviction and per-entry TTL.
+
+    Not thread-safe: meant to be used from the event loop only.
+
+    Parameters:
+        maxsize (int): Maximum number of entries. Defaults to 1024.
+        ttl_seconds (float): Lifetime of an entry. Defaults to 3600.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600) -> None:
+        self.maxsize = max(1, maxsize)
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __lookup(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the live value of `key` without touching the counters.
+        """
+        item = self._data.get(key)
+        if item is not None:
+            value, expires_at = item
+            if expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                return value
+            del self._data[key]
+        return None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value, or None if missing or expired.
+        """
+        return self.get_any((key,))
+
+    def get_any(self, keys: Iterable[Hashable]) -> Optional[Any]:
+        """
+        Returns the value of the first of `keys` that is cached, or None.
+        Counted as a single hit or miss, however many keys are tried.
+        """
+        for key in keys:
+            value = self.__lookup(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry when full.
+        """
+        self._data[key] = (value, time.monotonic() + self.ttl_seconds)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters plus current size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._data),
+        }
@@ -0,0 +1,37 @@
+import pytest
+
+from src.utils.reference_detector import find_history_reference
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "do you have a larger size?",
+        "show me something cheaper",
+        "any cheaper options?",
+        "is that available in size M?",
+        "how much does that cost",
+        "can I get a discount on that jacket",
+        "are there other colors",
+        "what is the price",
+        "does it come in red?",
+        "what about the second one",
+        "in blue",
+        "show me more",
+    ],
+)
+def test_follow_ups_need_history(query):
+    assert find_history_reference(query) is not None
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "show me linen shirts",
+        "red summer dresses under 50 dollars",
+        "men's running shoes in size 42",
+        "waterproof hiking boots for women",
+    ],
+)
+def test_self_contained_queries(query):
+    assert find_history_reference(query) is None